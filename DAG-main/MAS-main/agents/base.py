@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 class Agent(ABC):
     def __init__(self, name: str):
@@ -19,7 +20,31 @@ class Agent(ABC):
         """LLM → final answer"""
         return str(tool_output)
 
+    def can_handle(self, task_input: str) -> float:
+        """Cheap, LLM-free estimate (0-1) of whether this agent fits the input"""
+        return 0.5
+
+    def preprocess_local(self, task_input: str) -> Optional[Dict[str, Any]]:
+        """Structured input extracted without an LLM, or None if one is needed"""
+        return None
+
+    def preprocess_request(self, task_input: str) -> Optional[Dict[str, Any]]:
+        """Prompt for the preprocess LLM call, so callers can batch it.
+
+        Returns {"system", "user", "required_keys"} (plus an optional
+        "semantic_query") or None if preprocess does not call an LLM.
+        """
+        return None
+
+    def run_preprocessed(self, task_input: str, processed_input: Dict[str, Any]) -> str:
+        """Run the agent with an already extracted structured input"""
+        tool_output = self.call_tool(processed_input)
+        return self.postprocess(tool_output)
+
     def run(self, task_input: str) -> str:
         processed_input = self.preprocess(task_input)
-        tool_output = self.call_tool(processed_input)
-        return self.postprocess(tool_output)
\ No newline at end of file
+        return self.run_preprocessed(task_input, processed_input)
+
+    async def arun(self, task_input: str) -> str:
+        """Async entry point; sync agents run on a worker thread"""
+        return await asyncio.to_thread(self.run, task_input)
@@ -1,30 +1,195 @@
 from agents.base import Agent
-from llm.llm_client import call_llm, call_llm_json
+from llm.llm_client import call_llm, call_llm_json, cached_call_llm_json
 from fundamental.main import run_nifty_scraper
+import calendar
+import logging
 import re
 from datetime import datetime
 
-def success(data, confidence=0.7, citations=None):
-    return {"status": "success", "confidence": confidence, "data": data, "citations": citations or []}
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
 
-def failure(reason):
-    return {"status": "failed", "error": reason}
+logger = logging.getLogger(__name__)
 
-class FundamentalAgent(Agent):
-    def __init__(self):
-        super().__init__("fundamental_agent")
 
-    def preprocess(self, task_input: str):
-        """
-        Extract ticker and period from query
-        Returns: {
-            "ticker": "ADANIPORTS",
-            "start_date": "2024-10-01",
-            "end_date": "2024-12-31",
-            "period_description": "October 2024 to December 2024"
+TICKERS = frozenset({
+    "ADANIENT", "ADANIPORTS", "APOLLOHOSP", "ASIANPAINT", "AXISBANK", "BAJAJ-AUTO",
+    "BAJFINANCE", "BAJAJFINSV", "BPCL", "BHARTIARTL", "BRITANNIA", "CIPLA", "COALINDIA",
+    "DIVISLAB", "DRREDDY", "EICHERMOT", "GRASIM", "HCLTECH", "HDFCBANK", "HDFCLIFE",
+    "HEROMOTOCO", "HINDALCO", "HINDUNILVR", "ICICIBANK", "ITC", "INDUSINDBK", "INFY",
+    "JSWSTEEL", "KOTAKBANK", "LT", "M&M", "MARUTI", "NESTLEIND", "NTPC", "ONGC",
+    "POWERGRID", "RELIANCE", "SBILIFE", "SBIN", "SUNPHARMA", "TATACONSUM", "TATAMOTORS",
+    "TATASTEEL", "TECHM", "TITAN", "ULTRACEMCO", "UPL", "WIPRO", "LTIM", "BAJAJHLDNG",
+})
+
+# Common company names -> ticker (matched on the upper-cased query)
+TICKER_ALIASES = {
+    "ADANI ENTERPRISES": "ADANIENT", "ADANI PORTS": "ADANIPORTS", "APOLLO HOSPITALS": "APOLLOHOSP",
+    "ASIAN PAINTS": "ASIANPAINT", "AXIS BANK": "AXISBANK", "BAJAJ AUTO": "BAJAJ-AUTO",
+    "BAJAJ FINANCE": "BAJFINANCE", "BAJAJ FINSERV": "BAJAJFINSV", "BHARAT PETROLEUM": "BPCL",
+    "BHARTI AIRTEL": "BHARTIARTL", "AIRTEL": "BHARTIARTL", "COAL INDIA": "COALINDIA",
+    "DIVIS LAB": "DIVISLAB", "DR REDDY": "DRREDDY", "EICHER MOTORS": "EICHERMOT",
+    "HCL TECH": "HCLTECH", "HDFC BANK": "HDFCBANK", "HDFC LIFE": "HDFCLIFE",
+    "HERO MOTOCORP": "HEROMOTOCO", "HINDUSTAN UNILEVER": "HINDUNILVR", "ICICI BANK": "ICICIBANK",
+    "INDUSIND BANK": "INDUSINDBK", "INFOSYS": "INFY", "JSW STEEL": "JSWSTEEL",
+    "KOTAK MAHINDRA BANK": "KOTAKBANK", "KOTAK BANK": "KOTAKBANK", "LARSEN": "LT",
+    "MAHINDRA & MAHINDRA": "M&M", "MARUTI SUZUKI": "MARUTI", "NESTLE": "NESTLEIND",
+    "POWER GRID": "POWERGRID", "SBI LIFE": "SBILIFE", "STATE BANK OF INDIA": "SBIN",
+    "SUN PHARMA": "SUNPHARMA", "TATA CONSUMER": "TATACONSUM", "TATA MOTORS": "TATAMOTORS",
+    "TATA STEEL": "TATASTEEL", "TECH MAHINDRA": "TECHM", "ULTRATECH": "ULTRACEMCO",
+    "LTIMINDTREE": "LTIM", "BAJAJ HOLDINGS": "BAJAJHLDNG",
+    "SBI": "SBIN", "L&T": "LT", "DR. REDDY": "DRREDDY", "HCL TECHNOLOGIES": "HCLTECH",
+}
+
+# Financial or company wording: without a ticker match this still points
+# at fundamentals, just not at a company the local table can name
+_FUNDAMENTAL_HINT_RE = re.compile(
+    r"\b(revenues?|profits?|earnings|results?|margins?|fundamentals?|ratios?|eps|p/?e|valuation"
+    r"|balance sheet|cash flows?|debt|dividends?|order book|sales|growth|roc?e|book value"
+    r"|market cap\w*|shares?|stocks?|company|companies|ltd|limited|quarter(ly)?|q[1-4]|fy\s?\d{0,4}"
+    r"|annual|financials?)\b",
+    re.IGNORECASE,
+)
+
+
+def _build_ticker_matcher():
+    words = {t: t for t in TICKERS}
+    words.update(TICKER_ALIASES)
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for word, ticker in words.items():
+            automaton.add_word(word, (len(word), ticker))
+        automaton.make_automaton()
+        return automaton
+    # Without pyahocorasick, a single compiled alternation (longest first) does the scan
+    pattern = "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+    return re.compile(pattern), words
+
+
+_TICKER_MATCHER = _build_ticker_matcher()
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch in "&-"
+
+
+def match_tickers(text):
+    """Return the distinct tickers named in ``text``
+
+    Tickers and single-word names must match whole words; multi-word names
+    may also start a longer word ("SUN PHARMA" in "SUN PHARMACEUTICAL").
+    A name inside a longer matched name ("SBI" in "SBI LIFE") is ignored.
+    """
+    upper = text.upper()
+    if ahocorasick is not None:
+        matches = [
+            (end - length + 1, end + 1, ticker)
+            for end, (length, ticker) in _TICKER_MATCHER.iter(upper)
+        ]
+    else:
+        pattern, words = _TICKER_MATCHER
+        matches = [(m.start(), m.end(), words[m.group(0)]) for m in pattern.finditer(upper)]
+    # Longest match first at each start, so nested names are dropped below
+    matches.sort(key=lambda m: (m[0], -m[1]))
+    found = []
+    covered_to = 0
+    for start, end, ticker in matches:
+        if end <= covered_to:
+            continue
+        if start > 0 and _is_word_char(upper[start - 1]):
+            continue
+        if end < len(upper) and _is_word_char(upper[end]) and " " not in upper[start:end]:
+            continue
+        covered_to = end
+        if ticker not in found:
+            found.append(ticker)
+    return found
+
+
+_MONTHS = {m.lower(): i for i, m in enumerate(calendar.month_name) if m}
+_MONTHS.update({m.lower(): i for i, m in enumerate(calendar.month_abbr) if m})
+_MONTHS["sept"] = 9
+_MONTH_RE = "|".join(sorted(_MONTHS, key=len, reverse=True))
+_ISO_DATE_RE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_MONTH_RANGE_RE = re.compile(
+    rf"\b({_MONTH_RE})\.?(?:\s+(\d{{4}}))?\s*(?:-|–|to|through|till|until)\s*({_MONTH_RE})\.?,?\s+(\d{{4}})\b",
+    re.IGNORECASE,
+)
+_MONTH_YEAR_RE = re.compile(rf"\b({_MONTH_RE})\.?,?\s+(\d{{4}})\b", re.IGNORECASE)
+# Indian fiscal quarters, FY24 = April 2023 - March 2024: "Q3 FY24", "Q3FY2024"
+_FISCAL_QUARTER_RE = re.compile(r"\bQ([1-4])\s*FY\s*'?(\d{4}|\d{2})\b", re.IGNORECASE)
+# "Q4 2024" could be a calendar or a fiscal quarter, so it is left to the LLM
+_BARE_QUARTER_RE = re.compile(r"\bQ[1-4]\s*\d{4}\b", re.IGNORECASE)
+# Period labels in the scraped fundamentals, e.g. "Dec 2024" / "Mar-2025"
+_QUARTER_LABEL_RE = re.compile(r"\b(Mar|Jun|Sep|Dec)[\s\-]?(\d{4})\b", re.IGNORECASE)
+
+
+def _month_bounds(year, month):
+    last = calendar.monthrange(year, month)[1]
+    return f"{year:04d}-{month:02d}-01", f"{year:04d}-{month:02d}-{last:02d}"
+
+
+def extract_period(text):
+    """Parse an explicit date range from ``text`` without an LLM.
+
+    Handles ISO dates, "October 2024 to December 2024", "Oct-Dec 2024",
+    Indian fiscal quarters ("Q3 FY24") and a single "March 2024". Returns None
+    when no explicit period is found, or for a bare "Q4 2024", which may be a
+    calendar or a fiscal quarter.
+    """
+    iso = _ISO_DATE_RE.findall(text)
+    if len(iso) >= 2:
+        (y1, m1, d1), (y2, m2, d2) = iso[0], iso[1]
+        start, end = f"{y1}-{m1}-{d1}", f"{y2}-{m2}-{d2}"
+        return {"start_date": start, "end_date": end, "period_description": f"{start} to {end}"}
+
+    m = _MONTH_RANGE_RE.search(text)
+    if m:
+        end_year = int(m.group(4))
+        start_year = int(m.group(2)) if m.group(2) else end_year
+        start_month = _MONTHS[m.group(1).lower()]
+        end_month = _MONTHS[m.group(3).lower()]
+        if not m.group(2) and start_month > end_month:
+            start_year -= 1
+        start, _ = _month_bounds(start_year, start_month)
+        _, end = _month_bounds(end_year, end_month)
+        return {
+            "start_date": start,
+            "end_date": end,
+            "period_description": f"{calendar.month_name[start_month]} {start_year} to "
+                                  f"{calendar.month_name[end_month]} {end_year}",
         }
-        """
-        PROMPT_TEMPLATE = """
+
+    m = _FISCAL_QUARTER_RE.search(text)
+    if m:
+        quarter, fy = int(m.group(1)), int(m.group(2))
+        if fy < 100:
+            fy += 2000
+        # Q1 starts in April of the year before the FY label; Q4 is Jan-Mar
+        first_month = quarter * 3 + 1
+        year = fy - 1 if first_month <= 12 else fy
+        first_month = (first_month - 1) % 12 + 1
+        start, _ = _month_bounds(year, first_month)
+        _, end = _month_bounds(year, first_month + 2)
+        return {"start_date": start, "end_date": end, "period_description": f"Q{quarter} FY{fy % 100:02d}"}
+
+    if _BARE_QUARTER_RE.search(text):
+        return None
+
+    m = _MONTH_YEAR_RE.search(text)
+    if m:
+        month, year = _MONTHS[m.group(1).lower()], int(m.group(2))
+        start, end = _month_bounds(year, month)
+        return {"start_date": start, "end_date": end, "period_description": f"{calendar.month_name[month]} {year}"}
+
+    return None
+
+_TICKER_PROMPT_FRAG = ", ".join(sorted(TICKERS))
+
+# Single {query} placeholder, filled with str.replace (no format parsing, literal braces)
+_FUND_PROMPT = """
 You are given a user query about a stock analysis for a specific period.
 
 Your task:
@@ -35,41 +200,123 @@ Query:
 {query}
 
 Stock Tickers:
-[ADANIENT, ADANIPORTS, APOLLOHOSP, ASIANPAINT, AXISBANK, BAJAJ-AUTO, BAJFINANCE, BAJAJFINSV, BPCL, BHARTIARTL, BRITANNIA, CIPLA, COALINDIA, DIVISLAB, DRREDDY, EICHERMOT, GRASIM, HCLTECH, HDFCBANK, HDFCLIFE, HEROMOTOCO, HINDALCO, HINDUNILVR, ICICIBANK, ITC, INDUSINDBK, INFY, JSWSTEEL, KOTAKBANK, LT, M&M, MARUTI, NESTLEIND, NTPC, ONGC, POWERGRID, RELIANCE, SBILIFE, SBIN, SUNPHARMA, TATACONSUM, TATAMOTORS, TATASTEEL, TECHM, TITAN, ULTRACEMCO, UPL, WIPRO, LTIM, BAJAJHLDNG]
+[""" + _TICKER_PROMPT_FRAG + """]
 
 Return JSON:
-{{
+{
     "ticker": "TICKER_HERE",
     "start_date": "YYYY-MM-DD",
     "end_date": "YYYY-MM-DD",
     "period_description": "Human readable period"
-}}
+}
 
 Rules:
 - Extract exact dates if mentioned, or infer from month/year references
 - For October-December 2024: start_date="2024-10-01", end_date="2024-12-31"
 - Return JSON only, no explanation
 """
-        prompt = PROMPT_TEMPLATE.format(query=task_input)
-        result = call_llm_json(
-            system="You are a financial data extraction system.",
-            user=prompt
+
+
+def _quarter_bounds(label):
+    """Return (start, end) ISO dates of the quarter ending in ``label``, or None"""
+    m = _QUARTER_LABEL_RE.fullmatch(label.strip())
+    if not m:
+        return None
+    year, month = int(m.group(2)), _MONTHS[m.group(1).lower()]
+    start, _ = _month_bounds(year, month - 2)
+    _, end = _month_bounds(year, month)
+    return start, end
+
+
+def _prune_periods(data, start_date, end_date):
+    # ISO dates compare correctly as strings; keep quarters overlapping the window
+    if isinstance(data, dict):
+        pruned = {}
+        for key, value in data.items():
+            bounds = _quarter_bounds(key) if isinstance(key, str) else None
+            if bounds is not None and (bounds[1] < start_date or bounds[0] > end_date):
+                continue
+            pruned[key] = _prune_periods(value, start_date, end_date)
+        return pruned
+    if isinstance(data, list):
+        return [_prune_periods(item, start_date, end_date) for item in data]
+    return data
+
+
+def success(data, confidence=0.7, citations=None):
+    return {"status": "success", "confidence": confidence, "data": data, "citations": citations or []}
+
+def failure(reason):
+    return {"status": "failed", "error": reason}
+
+class FundamentalAgent(Agent):
+    def __init__(self):
+        super().__init__("fundamental_agent")
+
+    def can_handle(self, task_input: str) -> float:
+        if match_tickers(task_input):
+            return 0.9
+        # No local match only means the LLM has to name the company; reroute
+        # just inputs with no financial or company wording at all
+        return 0.5 if _FUNDAMENTAL_HINT_RE.search(task_input) else 0.1
+
+    def preprocess(self, task_input: str):
+        """
+        Extract ticker and period from query
+        Returns: {
+            "ticker": "ADANIPORTS",
+            "start_date": "2024-10-01",
+            "end_date": "2024-12-31",
+            "period_description": "October 2024 to December 2024"
+        }
+        """
+        result = self.preprocess_local(task_input)
+        if result is not None:
+            return result
+
+        request = self.preprocess_request(task_input)
+        result = cached_call_llm_json(
+            system=request["system"],
+            user=request["user"],
+            required_keys=request["required_keys"],
+            semantic_query=request["semantic_query"]
         )
         
-        print(f"📅 Extracted period: {result.get('period_description', 'N/A')}")
+        logger.debug("Extracted period: %s", result.get("period_description", "N/A"))
         return result
 
+    def preprocess_local(self, task_input: str):
+        # Fast path: exactly one ticker and an explicit period need no LLM
+        tickers = match_tickers(task_input)
+        period = extract_period(task_input)
+        if len(tickers) == 1 and period is not None:
+            result = {"ticker": tickers[0], **period}
+            logger.debug("Extracted period: %s", result["period_description"])
+            return result
+        return None
+
+    def preprocess_request(self, task_input: str):
+        return {
+            "system": "You are a financial data extraction system.",
+            "user": _FUND_PROMPT.replace("{query}", task_input),
+            "required_keys": ("ticker", "start_date", "end_date"),
+            "semantic_query": task_input
+        }
+
     def call_tool(self, processed_input):
-        ticker = processed_input.get('ticker')
+        ticker = (processed_input.get('ticker') or "").strip().upper()
         start_date = processed_input.get('start_date')
         end_date = processed_input.get('end_date')
         period_desc = processed_input.get('period_description')
         
-        print(f"Getting fundamentals for {ticker} during {period_desc}")
+        logger.debug("Getting fundamentals for %s during %s", ticker, period_desc)
         
-        # Fetch all fundamentals
+        # Reject hallucinated tickers before touching the scraper
+        if ticker not in TICKERS:
+            return failure(f"Unknown ticker {ticker or 'N/A'}")
+
+        # Fetch all fundamentals (the period filter runs on top)
         all_fundamentals = run_nifty_scraper(symbol=ticker)
-        
         if not all_fundamentals:
             return failure(f"No fundamental data found for {ticker}")
         
@@ -80,27 +327,17 @@ Rules:
             end_date
         )
         
-        print(f"📊 Filtered to {len(filtered_fundamentals)} records in period {period_desc}")
+        logger.debug("Filtered to %d records in period %s", len(filtered_fundamentals), period_desc)
         return filtered_fundamentals
 
     def _filter_by_period(self, data, start_date, end_date):
-        """Filter fundamental data to specific date range"""
-        if isinstance(data, dict):
-            data = str(data)
-        
-        # Extract date references from the data and filter
-        filtered_result = f"""
-Fundamentals for the period {start_date} to {end_date}:
-
-{data}
-
-[Note: This data has been filtered to show fundamentals relevant to the period from {start_date} to {end_date}. 
-If quarterly data is available, quarters overlapping this period are included.]
-"""
-        return filtered_result
+        """Drop quarters that fall outside [start_date, end_date], keeping the structure"""
+        if not start_date or not end_date:
+            return data
+        return _prune_periods(data, str(start_date), str(end_date))
 
     def postprocess(self, tool_output, symbol):
-        print("Postprocessing fundamental data...")
+        logger.debug("Postprocessing fundamental data")
         
         if tool_output is None or isinstance(tool_output, dict) and tool_output.get('error'):
             return failure("No fundamental data found for the given query.")
@@ -108,9 +345,7 @@ If quarterly data is available, quarters overlapping this period are included.]
         citations = [{"source": "merged_nifty50.json", "symbol": symbol}]
         return success(tool_output, citations=citations)
 
-    def run(self, task_input: str) -> str:
-        processed_input = self.preprocess(task_input)
-        
+    def run_preprocessed(self, task_input: str, processed_input):
         if isinstance(processed_input, dict) and 'error' in processed_input:
             return failure(f"Failed to extract period: {processed_input['error']}")
         
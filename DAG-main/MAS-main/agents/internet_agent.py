@@ -1,9 +1,17 @@
 from agents.base import Agent
 import asyncio
+import os
 from concurrent.futures import ThreadPoolExecutor
 from llm.llm_client import call_llm
 from financial_intelligence.main_parallel import run_financial_system
 
+# Shared pool for running the async financial system from sync callers.
+# Reusing warm threads avoids spawning/tearing down an executor per call.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("THREAD_POOL_SIZE", "16")),
+    thread_name_prefix="internet_agent",
+)
+
 class InternetAgent(Agent):
     def __init__(self):
         super().__init__("internet_agent")
@@ -13,62 +21,76 @@ class InternetAgent(Agent):
         return task_input
 
     def call_tool(self, processed_input):
-        # Run async code in separate thread to avoid nested event loop issues
-        def run_in_thread():
-            return asyncio.run(run_financial_system(processed_input))
+        # Run async code on a pooled thread to avoid nested event loop issues
+        future = _EXECUTOR.submit(asyncio.run, run_financial_system(processed_input))
+        output = future.result()
+        return self._package(output)
+
+    async def call_tool_async(self, processed_input):
+        """Await the financial system directly when already inside an event loop"""
+        output = await run_financial_system(processed_input)
+        return self._package(output)
+
+    async def arun(self, task_input: str):
+        # Native async path: no thread hop and no per-call event loop
+        tool_output = await self.call_tool_async(self.preprocess(task_input))
+        return self.postprocess(tool_output)
+
+    def _package(self, output):
+        # Extract citations (URLs) from the financial_intelligence output
+        citations = []
         
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(run_in_thread)
-            output = future.result()
+        if isinstance(output, dict):
+            # Check for results structure
+            results = output.get('results', {})
+            
+            # Extract URLs from NEWS worker
+            if 'NEWS' in results:
+                news_data = results['NEWS'].get('data', {})
+                articles = news_data.get('articles', [])
+                for article in articles:
+                    if isinstance(article, dict) and article.get('url'):
+                        citations.append({
+                            "title": article.get('title', 'Untitled'),
+                            "url": article.get('url'),
+                            "source": article.get('source', 'Unknown'),
+                            "published": article.get('published', 'unknown')
+                        })
             
-            # Extract citations (URLs) from the financial_intelligence output
-            citations = []
+            seen_urls = {c['url'] for c in citations}
             
-            if isinstance(output, dict):
-                # Check for results structure
-                results = output.get('results', {})
-                
-                # Extract URLs from NEWS worker
-                if 'NEWS' in results:
-                    news_data = results['NEWS'].get('data', {})
-                    articles = news_data.get('articles', [])
-                    for article in articles:
-                        if isinstance(article, dict) and article.get('url'):
-                            citations.append({
-                                "title": article.get('title', 'Untitled'),
-                                "url": article.get('url'),
-                                "source": article.get('source', 'Unknown'),
-                                "published": article.get('published', 'unknown')
-                            })
-                
-                # Extract URLs from NEWS_ANALYSIS worker
-                if 'NEWS_ANALYSIS' in results:
-                    analysis_sources = results['NEWS_ANALYSIS'].get('_sources', {})
-                    urls = analysis_sources.get('urls', [])
-                    for url in urls:
-                        # Avoid duplicates
-                        if not any(c['url'] == url for c in citations):
-                            citations.append({
-                                "title": "Additional Source",
-                                "url": url,
-                                "source": "NEWS_ANALYSIS",
-                                "published": "unknown"
-                            })
-                
-                # Check top-level _sources as fallback
-                if not citations and '_sources' in output:
-                    sources = output['_sources']
-                    if isinstance(sources, dict) and 'urls' in sources:
-                        for url in sources['urls']:
-                            citations.append({
-                                "title": "Financial Intelligence Source",
-                                "url": url,
-                                "source": "financial_intelligence",
-                                "published": "unknown"
-                            })
+            # Extract URLs from NEWS_ANALYSIS worker
+            if 'NEWS_ANALYSIS' in results:
+                analysis_sources = results['NEWS_ANALYSIS'].get('_sources', {})
+                urls = analysis_sources.get('urls', [])
+                for url in urls:
+                    # Avoid duplicates
+                    if url not in seen_urls:
+                        seen_urls.add(url)
+                        citations.append({
+                            "title": "Additional Source",
+                            "url": url,
+                            "source": "NEWS_ANALYSIS",
+                            "published": "unknown"
+                        })
             
-            return {
-                "status": "success",
-                "data": output,
-                "citations": citations
-            }
\ No newline at end of file
+            # Check top-level _sources as fallback
+            if not citations and '_sources' in output:
+                sources = output['_sources']
+                if isinstance(sources, dict) and 'urls' in sources:
+                    for url in sources['urls']:
+                        if url in seen_urls:
+                            continue
+                        seen_urls.add(url)
+                        citations.append({
+                            "title": "Financial Intelligence Source",
+                            "url": url,
+                            "source": "financial_intelligence",
+                            "published": "unknown"
+                        })
+        
+        return {
+            "status": "success",
+            "data": output,
+            "citations": citations
+        }
\ No newline at end of file
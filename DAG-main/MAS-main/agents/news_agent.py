@@ -1,10 +1,27 @@
-from typing import Dict, Any, List
+import logging
+import re
+from datetime import date
+from typing import Callable, Dict, Any, List, Optional
 from agents.base import Agent
-from llm.llm_client import call_llm, call_llm_json
+from llm.llm_client import call_llm, call_llm_json, call_llm_stream, cached_call_llm_json
 from tools.news_search import News_Search
 from prompts.preprocess_prompt import PREPROCESS_PROMPT
 from typing import TypedDict
 
+logger = logging.getLogger(__name__)
+
+_NEWS_HINT_RE = re.compile(r"\b(news|latest|recent|headlines?|announce\w*|reported|update[sd]?|today)\b", re.IGNORECASE)
+
+_ANSWER_SYSTEM = "Answer based on query asked and given the news articles. Don't write extra words like this is the answer for the query want straight answer in string. Also take care just don't write 1 line answer I want explnation also why was your answer take help of context to get the answer"
+
+_ANSWER_PROMPT = """There are the news articles needed for context to answer:
+{news}
+
+Based on these articles as context write a answer for this query with given system instruction:
+query:
+{query}
+"""
+
 def success(data, confidence=0.7, citations=None):
     return {"status": "success", "confidence": confidence, "data": data, "citations": citations or []}
 
@@ -19,6 +36,10 @@ class NewsAgent(Agent):
     def __init__(self):
         super().__init__("NewsAgent")
 
+    def can_handle(self, task_input: str) -> float:
+        # Any query can be searched against the archive; news wording just raises confidence
+        return 0.8 if _NEWS_HINT_RE.search(task_input) else 0.5
+
     def preprocess(self, task_input: str) -> Dict[str, Any]:
         """
         Converts user query into:
@@ -29,13 +50,24 @@ class NewsAgent(Agent):
             "TOP_K": int
         }
         """
-        return call_llm_json(
-            system=PREPROCESS_PROMPT,
-            user=task_input
+        request = self.preprocess_request(task_input)
+        return cached_call_llm_json(
+            system=request["system"],
+            user=request["user"],
+            required_keys=request["required_keys"]
         )
 
+    def preprocess_request(self, task_input: str) -> Dict[str, Any]:
+        # Relative phrases ("last week", "this quarter") resolve against today, and
+        # putting the date in the prompt also keeps cached ranges from going stale
+        return {
+            "system": PREPROCESS_PROMPT + f"\nToday's date: {date.today().isoformat()}\n",
+            "user": task_input,
+            "required_keys": ("START_DATE", "END_DATE", "QUERY")
+        }
+
     def call_tool(self, processed_input: Dict[str, Any]) -> List[NewsResult]:
-        print("Processed Input:", processed_input)
+        logger.debug("Processed input: %s", processed_input)
         
         news_response,top_score=News_Search(
             query=processed_input["QUERY"],
@@ -44,7 +76,7 @@ class NewsAgent(Agent):
             top_k=10
         )
         
-        print(f"📊 News Search Results: {len(news_response)} articles, top score: {top_score:.4f}")
+        logger.debug("News search returned %d articles, top score %.4f", len(news_response), top_score)
         
         if(len(news_response)==0):
             return failure(f"No news articles found for '{processed_input['QUERY']}' between {processed_input['START_DATE']} and {processed_input['END_DATE']}")
@@ -64,41 +96,39 @@ class NewsAgent(Agent):
 
         return success(news_response, citations=citations)
 
-    def postprocess(self, tool_output: List[NewsResult],task_input) -> str:
+    def postprocess(self, tool_output: List[NewsResult], task_input, on_chunk: Optional[Callable[[str], None]] = None) -> str:
         """
         Convert structured news results → final answer
+
+        The answer is streamed from the LLM; `on_chunk` receives each text
+        chunk as it arrives so callers can start rendering early.
         """
         # if(tool_output is None or len(tool_output)==0 or ):
         #     return "There is not any significant relevant news available to answer the query."
         formatted_news = ""
-        print("Tool Output:", tool_output)
+        logger.debug("Tool output: %s", tool_output)
         if(tool_output["status"]=="success"):
-            print("Tool Output Data:", tool_output["data"])
-            for output in tool_output["data"]: 
-                formatted_news += "".join(
+            logger.debug("Tool output data: %s", tool_output["data"])
+            formatted_news = "\n".join(
                 f"Title: {output['title']}\n"
                 f"Date: {output['publish_date']}\n"
                 # f"Source: {output['url']}\n"
                 f"Summary: {output['summary']}"
+                for output in tool_output["data"]
             )
-            print("Formatted News:", formatted_news)
-            user_prompt="""There are the news articles needed for context to answer:
-            {}
-            
-            Based on these articles as context write a answer for this query with given system instruction:
-            query:
-            {}
-            """.format(formatted_news,task_input)
-            llm_response=call_llm(
-                system="Answer based on query asked and given the news articles. Don't write extra words like this is the answer for the query want straight answer in string. Also take care just don't write 1 line answer I want explnation also why was your answer take help of context to get the answer",
-                user=user_prompt
-            )
+            logger.debug("Formatted news: %s", formatted_news)
+            user_prompt=_ANSWER_PROMPT.format_map({"news": formatted_news, "query": task_input})
             citations = tool_output.get("citations", [])
+            chunks = []
+            for chunk in call_llm_stream(system=_ANSWER_SYSTEM, user=user_prompt):
+                chunks.append(chunk)
+                if on_chunk is not None:
+                    on_chunk(chunk)
+            llm_response = "".join(chunks).strip()
             return  success(llm_response+"\n\n\nBased on the artciles\n\n"+formatted_news, citations=citations)
         else:
             error_msg = tool_output.get("error", "Unknown error")
             return failure(f"News agent failed: {error_msg}")
-    def run(self, task_input: str) -> str:
-        processed_input = self.preprocess(task_input)
+    def run_preprocessed(self, task_input: str, processed_input: Dict[str, Any]):
         tool_output = self.call_tool(processed_input)
         return self.postprocess(tool_output,task_input)
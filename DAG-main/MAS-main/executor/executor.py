@@ -1,58 +1,186 @@
-from agents.news_agent import NewsAgent
-from agents.internet_agent import InternetAgent
-from agents.fundamental_agent import FundamentalAgent
+from llm.llm_client import call_llm_json_batch
+import asyncio
+import concurrent.futures
+import functools
 import json
-AGENTS = {
-    "news_agent": NewsAgent(),
-    "internet_agent": InternetAgent(),
-    "fundamental_agent": FundamentalAgent(),
+import logging
+from pathlib import Path
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Agent modules are imported on first use so a plan only pays for the
+# agents it actually routes to (the internet agent pulls in the whole
+# financial_intelligence stack).
+def _make_news():
+    from agents.news_agent import NewsAgent
+    return NewsAgent()
+
+def _make_internet():
+    from agents.internet_agent import InternetAgent
+    return InternetAgent()
+
+def _make_fundamental():
+    from agents.fundamental_agent import FundamentalAgent
+    return FundamentalAgent()
+
+_AGENT_FACTORIES = {
+    "news_agent": _make_news,
+    "internet_agent": _make_internet,
+    "fundamental_agent": _make_fundamental,
 }
 
-def execute_plan(plan):
-    results = {}
+# Tasks whose agent scores below this on can_handle go straight to the internet agent
+MIN_CAN_HANDLE = 0.2
 
-    for task in plan["tasks"]:
-        agent_name = task["agent"]
-        task_input = task["input"]
-
-        if agent_name not in AGENTS:
-            continue  # safety
-
-        agent = AGENTS[agent_name]
-        if(agent_name!="internet_agent"):
-                try:
-                    output= agent.run(task_input)
-                except Exception as e:
-                    print(f"Agent {agent_name} failed with exception: {e}, switching to Internet agent")
-                    output=AGENTS["internet_agent"].run(task_input)
-                    results[task["id"]] = {
-                        "agent": "internet_agent",
-                        "output": f"News Agent got failed had to run the Internet agent {output}",
-                    }
-                    continue
-                
-                # Check if output is a failure (either status "failed" or "failure")
-                if(output.get("status") in ["failure", "failed"]):
-                    print(f"Agent {agent_name} returned failure: {output.get('error', 'Unknown error')}, switching to Internet agent")
-                    output=AGENTS["internet_agent"].run(task_input)
-                    results[task["id"]] = {
-                        "agent": "internet_agent",
-                        "output": f"News Agent got failed had to run the Internet agent {output}",
-                    }
-                    continue
-                
-                # Success case - extract data
-                results[task["id"]] = {
-                    "agent": agent_name,
-                    "output": output.get("data", output),  # Fallback to full output if no data key
-                }
+@functools.lru_cache(maxsize=None)
+def get_agent(name):
+    return _AGENT_FACTORIES[name]()
+
+def _route(task):
+    # Reroute obvious mismatches before any preprocess LLM call is spent on them
+    if task["agent"] == "internet_agent":
+        return task
+    score = get_agent(task["agent"]).can_handle(task["input"])
+    if score < MIN_CAN_HANDLE:
+        logger.info("Agent %s cannot handle task %s (score %.2f), routing to Internet agent", task["agent"], task["id"], score)
+        return {**task, "agent": "internet_agent"}
+    return task
+
+async def _run_internet_agent(task_input):
+    return await get_agent("internet_agent").arun(task_input)
+
+def _plan_preprocess(tasks):
+    """Split tasks into ready-to-run and needing an LLM preprocess call.
+
+    Returns ({task_id: processed_input or None}, {task_id: request}); the
+    first covers tasks handled by an agent's local fast path or with no
+    LLM preprocessing at all.
+    """
+    ready, requests = {}, {}
+    for task in tasks:
+        if task["agent"] == "internet_agent":
+            ready[task["id"]] = None
+            continue
+        agent = get_agent(task["agent"])
+        local = agent.preprocess_local(task["input"])
+        if local is not None:
+            ready[task["id"]] = local
+            continue
+        request = agent.preprocess_request(task["input"])
+        if request is None:
+            ready[task["id"]] = None
         else:
-            output = agent.run(task_input)
-            results[task["id"]] = {
+            requests[task["id"]] = request
+    return ready, requests
+
+async def _batch_preprocess(requests):
+    # One LLM round-trip for every task whose agent needs structured input;
+    # cached items are answered from the LLM cache without joining the batch
+    try:
+        outputs = await asyncio.to_thread(call_llm_json_batch, list(requests.values()))
+    except Exception as e:
+        logger.warning("Batched preprocess failed: %s, agents will preprocess individually", e)
+        return {}
+    return {
+        task_id: output
+        for task_id, output in zip(requests, outputs)
+        if output is not None
+    }
+
+async def _run_after_batch(task, batch):
+    preprocessed = await batch
+    return await _run_task(task, preprocessed.get(task["id"]))
+
+async def _run_task(task, processed_input=None):
+    agent_name = task["agent"]
+    task_input = task["input"]
+    agent = get_agent(agent_name)
+
+    if(agent_name!="internet_agent"):
+            try:
+                if processed_input is not None:
+                    output = await asyncio.to_thread(agent.run_preprocessed, task_input, processed_input)
+                else:
+                    output = await agent.arun(task_input)
+            except Exception as e:
+                logger.warning("Agent %s failed with exception: %s, switching to Internet agent", agent_name, e)
+                output = await _run_internet_agent(task_input)
+                return {
+                    "agent": "internet_agent",
+                    "output": f"News Agent got failed had to run the Internet agent {output}",
+                }
+
+            # Check if output is a failure (either status "failed" or "failure")
+            if(output.get("status") in ["failure", "failed"]):
+                logger.warning("Agent %s returned failure: %s, switching to Internet agent", agent_name, output.get("error", "Unknown error"))
+                output = await _run_internet_agent(task_input)
+                return {
+                    "agent": "internet_agent",
+                    "output": f"News Agent got failed had to run the Internet agent {output}",
+                }
+
+            # Success case - extract data
+            return {
                 "agent": agent_name,
-                "output": output,
+                "output": output.get("data", output),  # Fallback to full output if no data key
             }
-    with open("execution_results.json", "w", encoding="utf-8") as f:
+    else:
+        output = await _run_internet_agent(task_input)
+        return {
+            "agent": agent_name,
+            "output": output,
+        }
+
+def _write_results(results, path="execution_results.json"):
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(
+            results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ))
+        return
+    with open(path, "w", encoding="utf-8") as f:
         json.dump(results, f, indent=4)
+
+async def execute_plan_async(plan):
+    # Tasks are independent and I/O bound, so run them concurrently
+    tasks = [_route(task) for task in plan["tasks"] if task["agent"] in _AGENT_FACTORIES]  # safety
+    ready, requests = _plan_preprocess(tasks)
+    # A lone LLM preprocess gains nothing from batching; the agent runs it itself
+    batch = asyncio.ensure_future(_batch_preprocess(requests)) if len(requests) >= 2 else None
+    # Tasks that need no LLM preprocessing start right away instead of waiting on the batch
+    outputs = await asyncio.gather(
+        *(
+            _run_after_batch(task, batch) if batch is not None and task["id"] in requests
+            else _run_task(task, ready.get(task["id"]))
+            for task in tasks
+        ),
+        return_exceptions=True
+    )
+
+    results = {}
+    for task, output in zip(tasks, outputs):
+        if isinstance(output, Exception):
+            logger.error("Task %s (%s) failed: %s", task["id"], task["agent"], output)
+            output = {
+                "agent": task["agent"],
+                "output": None,
+                "error": str(output),
+            }
+        results[task["id"]] = output
+    _write_results(results)
     return results
-                                                                                            
\ No newline at end of file
+
+def execute_plan(plan):
+    # Sync entry point; async callers should await execute_plan_async directly
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(execute_plan_async(plan))
+    # Already inside an event loop, so asyncio.run would raise here
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, execute_plan_async(plan)).result()
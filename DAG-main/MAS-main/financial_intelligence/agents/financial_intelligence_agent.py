@@ -4,16 +4,79 @@ Wraps the entire financial intelligence system as a single external agent.
 This agent can be composed into larger meta-agent systems.
 """
 import asyncio
-from typing import Dict, Any, Optional
+import hashlib
+import json
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
+import time
 from datetime import datetime
 
 from external_agents.base_agent import ExternalAgent, AgentStatus
+from llm.cache import get_llm_cache, make_key
 from orchestrator import ParallelOrchestrator
-from planner.planner_llm import invoke_planner_llm
+from planner.planner_llm import (
+    SYSTEM_PROMPT as PLANNER_SYSTEM_PROMPT,
+    PLANNER_MODEL,
+    PLANNER_TEMPERATURE,
+    invoke_planner_llm,
+)
 from planner.validator import validate_planner_output
 from utils.entity_resolver import resolve_entities
 
 
+# Built once; read-only so callers can't mutate the shared description
+_CAPABILITIES: Mapping[str, Any] = MappingProxyType({
+    "agent_name": "financial_intelligence",
+    "version": "1.0",
+    "domains": (
+        "macroeconomics",
+        "equities",
+        "commodities",
+        "fixed_income",
+        "forex",
+        "crypto",
+        "market_analysis",
+        "news_impact",
+    ),
+    "query_types": (
+        "fundamental_analysis",
+        "price_lookup",
+        "macro_indicators",
+        "news_analysis",
+        "impact_assessment",
+    ),
+    "regions": ("US", "IN", "GLOBAL"),
+    "data_sources": (
+        "Yahoo Finance",
+        "FRED (Federal Reserve)",
+        "Screener.in",
+        "Web News Search",
+    ),
+    "freshness": MappingProxyType({
+        "prices": "15-minute delay",
+        "news": "real-time",
+        "fundamentals": "quarterly",
+        "macro": "monthly/quarterly",
+    }),
+    "limitations": (
+        "No forward-looking predictions",
+        "No investment advice",
+        "Historical data only",
+        "No high-frequency data",
+    ),
+})
+
+
+def _is_cacheable_plan(raw_plan: str) -> bool:
+    """Only well-formed planner output (not the error fallback) is cached"""
+    try:
+        parsed = json.loads(raw_plan)
+    except (TypeError, ValueError):
+        return False
+    return isinstance(parsed, dict) and "intent" in parsed and not parsed.get("_fallback")
+
+
 class FinancialIntelligenceAgent(ExternalAgent):
     """
     Black-box financial intelligence capability.
@@ -32,18 +95,23 @@ class FinancialIntelligenceAgent(ExternalAgent):
         self.MIN_CONFIDENCE = 0.3
         self.HIGH_CONFIDENCE = 0.7
         
+        # (raw_plan, plan) per normalized query, shared by can_handle/execute
+        self._plan_cache: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self.PLAN_CACHE_SIZE = 512
+        
     async def execute(self, query: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Execute financial intelligence pipeline.
         
         Returns standardized agent response.
         """
-        start_time = datetime.now()
+        # One wall-clock read for every timestamp; durations use the monotonic clock
+        timestamp = datetime.now().isoformat()
+        start_time = time.perf_counter()
         
         try:
             # Step 1: Intent classification
-            raw_plan = invoke_planner_llm(query)
-            plan = validate_planner_output(raw_plan)
+            raw_plan, plan = self._get_plan(query)
             
             intent = plan.get('intent')
             confidence = plan.get('confidence', 0.0)
@@ -54,7 +122,8 @@ class FinancialIntelligenceAgent(ExternalAgent):
                     query=query,
                     intent=intent,
                     confidence=confidence,
-                    reason="Query intent unclear or outside financial domain"
+                    reason="Query intent unclear or outside financial domain",
+                    timestamp=timestamp
                 )
             
             # Step 2: Entity resolution
@@ -71,11 +140,12 @@ class FinancialIntelligenceAgent(ExternalAgent):
                     query=query,
                     intent=intent,
                     confidence=confidence,
-                    reason="No relevant data found for query"
+                    reason="No relevant data found for query",
+                    timestamp=timestamp
                 )
             
             # Step 5: Build successful response
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             return {
                 "agent": "financial_intelligence",
@@ -89,7 +159,7 @@ class FinancialIntelligenceAgent(ExternalAgent):
                 },
                 "metadata": {
                     "execution_time_seconds": round(execution_time, 2),
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
                     "query": query
                 },
                 "error": None
@@ -99,51 +169,13 @@ class FinancialIntelligenceAgent(ExternalAgent):
             return self._error_response(
                 query=query,
                 error=str(e),
-                execution_time=(datetime.now() - start_time).total_seconds()
+                execution_time=time.perf_counter() - start_time,
+                timestamp=timestamp
             )
     
-    def capabilities(self) -> Dict[str, Any]:
-        """Describe agent capabilities"""
-        return {
-            "agent_name": "financial_intelligence",
-            "version": "1.0",
-            "domains": [
-                "macroeconomics",
-                "equities",
-                "commodities",
-                "fixed_income",
-                "forex",
-                "crypto",
-                "market_analysis",
-                "news_impact"
-            ],
-            "query_types": [
-                "fundamental_analysis",
-                "price_lookup",
-                "macro_indicators",
-                "news_analysis",
-                "impact_assessment"
-            ],
-            "regions": ["US", "IN", "GLOBAL"],
-            "data_sources": [
-                "Yahoo Finance",
-                "FRED (Federal Reserve)",
-                "Screener.in",
-                "Web News Search"
-            ],
-            "freshness": {
-                "prices": "15-minute delay",
-                "news": "real-time",
-                "fundamentals": "quarterly",
-                "macro": "monthly/quarterly"
-            },
-            "limitations": [
-                "No forward-looking predictions",
-                "No investment advice",
-                "Historical data only",
-                "No high-frequency data"
-            ]
-        }
+    def capabilities(self) -> Mapping[str, Any]:
+        """Describe agent capabilities (read-only; copy with dict() to modify)"""
+        return _CAPABILITIES
     
     def can_handle(self, query: str) -> float:
         """
@@ -152,8 +184,7 @@ class FinancialIntelligenceAgent(ExternalAgent):
         Uses the planner's confidence as the primary signal.
         """
         try:
-            raw_plan = invoke_planner_llm(query)
-            plan = validate_planner_output(raw_plan)
+            raw_plan, plan = self._get_plan(query)
             
             intent = plan.get('intent', 'NON_FINANCIAL')
             confidence = plan.get('confidence', 0.0)
@@ -169,6 +200,51 @@ class FinancialIntelligenceAgent(ExternalAgent):
     
     # Helper methods
     
+    def _get_plan(self, query: str) -> Tuple[str, Dict[str, Any]]:
+        """Return (raw_plan, validated plan), memoized per query.
+        
+        can_handle() and execute() are usually called back to back with the
+        same query, so the second call reuses the first planner round-trip.
+        """
+        key = hashlib.sha256(query.strip().lower().encode("utf-8")).hexdigest()
+        
+        cached = self._plan_cache.get(key)
+        if cached is not None:
+            self._plan_cache.move_to_end(key)
+            raw_plan, plan = cached
+            return raw_plan, dict(plan)
+        
+        raw_plan = self._invoke_planner(query)
+        plan = validate_planner_output(raw_plan)
+        
+        self._plan_cache[key] = (raw_plan, plan)
+        if len(self._plan_cache) > self.PLAN_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+        return raw_plan, dict(plan)
+    
+    def _invoke_planner(self, query: str) -> str:
+        """Planner call behind the shared LLM cache (exact + semantic)"""
+        cache = get_llm_cache()
+        key = make_key(PLANNER_SYSTEM_PROMPT, query, PLANNER_MODEL, PLANNER_TEMPERATURE)
+        scope = make_key(PLANNER_SYSTEM_PROMPT, PLANNER_MODEL, PLANNER_TEMPERATURE)
+        
+        raw_plan = cache.get(key, query=query, scope=scope, validate=_is_cacheable_plan)
+        if raw_plan is not None:
+            return raw_plan
+        
+        raw_plan = invoke_planner_llm(query)
+        if _is_cacheable_plan(raw_plan):
+            cache.set(
+                key,
+                raw_plan,
+                prompt=query,
+                model=PLANNER_MODEL,
+                temperature=PLANNER_TEMPERATURE,
+                query=query,
+                scope=scope
+            )
+        return raw_plan
+    
     def _has_useful_data(self, result: Dict[str, Any]) -> bool:
         """Check if orchestrator returned useful data"""
         if result.get('status') != 'success':
@@ -191,7 +267,8 @@ class FinancialIntelligenceAgent(ExternalAgent):
         query: str, 
         intent: str, 
         confidence: float,
-        reason: str
+        reason: str,
+        timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """Return structured response for low confidence"""
         return {
@@ -203,7 +280,7 @@ class FinancialIntelligenceAgent(ExternalAgent):
                 "reason": reason
             },
             "metadata": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp or datetime.now().isoformat(),
                 "query": query
             },
             "error": None
@@ -214,7 +291,8 @@ class FinancialIntelligenceAgent(ExternalAgent):
         query: str,
         intent: str,
         confidence: float,
-        reason: str
+        reason: str,
+        timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """Return structured response when no data found"""
         return {
@@ -226,7 +304,7 @@ class FinancialIntelligenceAgent(ExternalAgent):
                 "reason": reason
             },
             "metadata": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp or datetime.now().isoformat(),
                 "query": query
             },
             "error": None
@@ -236,7 +314,8 @@ class FinancialIntelligenceAgent(ExternalAgent):
         self,
         query: str,
         error: str,
-        execution_time: float
+        execution_time: float,
+        timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """Return structured error response"""
         return {
@@ -246,7 +325,7 @@ class FinancialIntelligenceAgent(ExternalAgent):
             "data": {},
             "metadata": {
                 "execution_time_seconds": round(execution_time, 2),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp or datetime.now().isoformat(),
                 "query": query
             },
             "error": error
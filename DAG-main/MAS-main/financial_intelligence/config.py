@@ -8,58 +8,197 @@ Includes:
 - Fallback configuration
 - Worker-specific settings
 """
+import logging
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Optional
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
+# ============================================================================
+# ENVIRONMENT SNAPSHOT
+# ============================================================================
+
+# Read the environment once; every setting below is parsed from this snapshot
+_ENV = dict(os.environ)
+
+
+def _as_bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+@lru_cache(maxsize=None)
+def _get(key: str, default: Optional[str] = None, cast: Callable[[str], Any] = str) -> Any:
+    """Read ``key`` from the environment snapshot and coerce it with ``cast``"""
+    value = _ENV.get(key, default)
+    if value is None:
+        return None
+    return cast(value)
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Every environment-driven setting, parsed once"""
+
+    # API keys
+    groq_api_key: Optional[str]
+    openai_api_key: Optional[str]
+    serpapi_key: Optional[str]
+    fred_api_key: Optional[str]
+    polygon_api_key: Optional[str]
+    tavily_api_key: Optional[str]
+    user_agent: str
+
+    # LLM
+    llm_provider: str
+    planner_model: str
+    planner_temperature: float
+    worker_model: str
+    worker_temperature: float
+    openai_fallback_model: str
+    openai_max_tokens: int
+    openai_temperature: float
+
+    # Confidence
+    aggregate_confidence_threshold: float
+    planner_confidence_warning: float
+
+    # Fallback
+    enable_openai_fallback: bool
+    fallback_system: str
+    enable_groq_fallback: bool
+    max_fallback_attempts: int
+
+    # Data sources
+    strict_news_source_filtering: bool
+    max_news_articles: int
+    min_article_length: int
+
+    # Caching
+    cache_file: str
+    cache_dir: str
+    enable_caching: bool
+    cache_ttl_seconds: int
+
+    # Logging
+    log_level: str
+    log_file: str
+    enable_file_logging: bool
+    debug_mode: bool
+
+    # Performance
+    max_concurrent_workers: int
+    max_concurrent_analyses: int
+    default_request_timeout: int
+    enable_rate_limiting: bool
+    rate_limit_requests_per_minute: int
+
+    # Output
+    save_results: bool
+    results_file: str
+    pretty_print_json: bool
+    include_timestamps: bool
+
+
+@lru_cache(maxsize=1)
+def load_config() -> Config:
+    """Parse the environment snapshot into a Config (cached)"""
+    return Config(
+        groq_api_key=_get("GROQ_API_KEY"),
+        openai_api_key=_get("OPENAI_API_KEY"),
+        serpapi_key=_get("SERPAPI_KEY"),
+        fred_api_key=_get("FRED_API_KEY"),
+        polygon_api_key=_get("POLYGON_API_KEY"),
+        tavily_api_key=_get("TAVILY_API_KEY"),
+        user_agent=_get("USER_AGENT", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"),
+        llm_provider=_get("LLM_PROVIDER", "groq"),
+        planner_model=_get("PLANNER_MODEL", "llama-3.1-8b-instant"),
+        planner_temperature=_get("PLANNER_TEMPERATURE", "0", float),
+        worker_model=_get("WORKER_MODEL", "llama-3.1-8b-instant"),
+        worker_temperature=_get("WORKER_TEMPERATURE", "0.3", float),
+        openai_fallback_model=_get("OPENAI_FALLBACK_MODEL", "gpt-4o-mini"),
+        openai_max_tokens=_get("OPENAI_MAX_TOKENS", "1500", int),
+        openai_temperature=_get("OPENAI_TEMPERATURE", "0.7", float),
+        aggregate_confidence_threshold=_get("CONFIDENCE_THRESHOLD", "0.65", float),
+        planner_confidence_warning=_get("PLANNER_CONFIDENCE_WARNING", "0.3", float),
+        enable_openai_fallback=_get("ENABLE_OPENAI_FALLBACK", "true", _as_bool),
+        fallback_system=_get("FALLBACK_SYSTEM", "groq"),
+        enable_groq_fallback=_get("ENABLE_GROQ_FALLBACK", "true", _as_bool),
+        max_fallback_attempts=_get("MAX_FALLBACK_ATTEMPTS", "1", int),
+        strict_news_source_filtering=_get("STRICT_SOURCE_FILTERING", "false", _as_bool),
+        max_news_articles=_get("MAX_NEWS_ARTICLES", "6", int),
+        min_article_length=_get("MIN_ARTICLE_LENGTH", "300", int),
+        cache_file=_get("CACHE_FILE", "query_cache.json"),
+        cache_dir=_get("CACHE_DIR", ".cache"),
+        enable_caching=_get("ENABLE_CACHING", "true", _as_bool),
+        cache_ttl_seconds=_get("CACHE_TTL_SECONDS", "300", int),
+        log_level=_get("LOG_LEVEL", "INFO"),
+        log_file=_get("LOG_FILE", "financial_intelligence.log"),
+        enable_file_logging=_get("ENABLE_FILE_LOGGING", "false", _as_bool),
+        debug_mode=_get("DEBUG_MODE", "false", _as_bool),
+        max_concurrent_workers=_get("MAX_CONCURRENT_WORKERS", "4", int),
+        max_concurrent_analyses=_get("MAX_CONCURRENT_ANALYSES", "6", int),
+        default_request_timeout=_get("REQUEST_TIMEOUT", "30", int),
+        enable_rate_limiting=_get("ENABLE_RATE_LIMITING", "true", _as_bool),
+        rate_limit_requests_per_minute=_get("RATE_LIMIT_RPM", "60", int),
+        save_results=_get("SAVE_RESULTS", "true", _as_bool),
+        results_file=_get("RESULTS_FILE", "last_run_results.json"),
+        pretty_print_json=_get("PRETTY_PRINT_JSON", "true", _as_bool),
+        include_timestamps=_get("INCLUDE_TIMESTAMPS", "true", _as_bool),
+    )
+
+
+CONFIG = load_config()
+
 # ============================================================================
 # API KEYS
 # ============================================================================
 
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-SERPAPI_KEY = os.getenv("SERPAPI_KEY")
-FRED_API_KEY = os.getenv("FRED_API_KEY")
-POLYGON_API_KEY = os.getenv("POLYGON_API_KEY")
-TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
+GROQ_API_KEY = CONFIG.groq_api_key
+OPENAI_API_KEY = CONFIG.openai_api_key
+SERPAPI_KEY = CONFIG.serpapi_key
+FRED_API_KEY = CONFIG.fred_api_key
+POLYGON_API_KEY = CONFIG.polygon_api_key
+TAVILY_API_KEY = CONFIG.tavily_api_key
 
 # User agent for web scraping
-USER_AGENT = os.getenv(
-    "USER_AGENT",
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-)
+USER_AGENT = CONFIG.user_agent
 
 # ============================================================================
 # LLM CONFIGURATION
 # ============================================================================
 
 # Primary LLM provider
-LLM_PROVIDER = os.getenv("LLM_PROVIDER", "groq")
+LLM_PROVIDER = CONFIG.llm_provider
 
 # Planner model (intent classification)
-PLANNER_MODEL = os.getenv("PLANNER_MODEL", "llama-3.1-8b-instant")
-PLANNER_TEMPERATURE = float(os.getenv("PLANNER_TEMPERATURE", "0"))
+PLANNER_MODEL = CONFIG.planner_model
+PLANNER_TEMPERATURE = CONFIG.planner_temperature
 
 # Worker model (data analysis)
-WORKER_MODEL = os.getenv("WORKER_MODEL", "llama-3.1-8b-instant")
-WORKER_TEMPERATURE = float(os.getenv("WORKER_TEMPERATURE", "0.3"))
+WORKER_MODEL = CONFIG.worker_model
+WORKER_TEMPERATURE = CONFIG.worker_temperature
 
 # OpenAI fallback model
-OPENAI_FALLBACK_MODEL = os.getenv("OPENAI_FALLBACK_MODEL", "gpt-4o-mini")
-OPENAI_MAX_TOKENS = int(os.getenv("OPENAI_MAX_TOKENS", "1500"))
-OPENAI_TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0.7"))
+OPENAI_FALLBACK_MODEL = CONFIG.openai_fallback_model
+OPENAI_MAX_TOKENS = CONFIG.openai_max_tokens
+OPENAI_TEMPERATURE = CONFIG.openai_temperature
 
 # ============================================================================
 # CONFIDENCE THRESHOLDS
 # ============================================================================
 
 # Minimum confidence to proceed without fallback
-AGGREGATE_CONFIDENCE_THRESHOLD = float(os.getenv("CONFIDENCE_THRESHOLD", "0.65"))
+AGGREGATE_CONFIDENCE_THRESHOLD = CONFIG.aggregate_confidence_threshold
 
 # Minimum planner confidence (warn below this)
-PLANNER_CONFIDENCE_WARNING = float(os.getenv("PLANNER_CONFIDENCE_WARNING", "0.3"))
+PLANNER_CONFIDENCE_WARNING = CONFIG.planner_confidence_warning
 
 # Worker-specific confidence thresholds
 WORKER_CONFIDENCE_THRESHOLDS = {
@@ -75,13 +214,13 @@ WORKER_CONFIDENCE_THRESHOLDS = {
 # ============================================================================
 
 # Enable/disable OpenAI fallback
-ENABLE_OPENAI_FALLBACK = os.getenv("ENABLE_OPENAI_FALLBACK", "true").lower() == "true"
+ENABLE_OPENAI_FALLBACK = CONFIG.enable_openai_fallback
 
 # Fallback system type: "groq", "openai", "hybrid"
-FALLBACK_SYSTEM = os.getenv("FALLBACK_SYSTEM", "groq")
+FALLBACK_SYSTEM = CONFIG.fallback_system
 
 # Enable/disable Groq fallback
-ENABLE_GROQ_FALLBACK = os.getenv("ENABLE_GROQ_FALLBACK", "true").lower() == "true"
+ENABLE_GROQ_FALLBACK = CONFIG.enable_groq_fallback
 
 # Fallback triggers (when to activate OpenAI)
 FALLBACK_TRIGGERS = {
@@ -92,7 +231,7 @@ FALLBACK_TRIGGERS = {
 }
 
 # Maximum fallback attempts
-MAX_FALLBACK_ATTEMPTS = int(os.getenv("MAX_FALLBACK_ATTEMPTS", "1"))
+MAX_FALLBACK_ATTEMPTS = CONFIG.max_fallback_attempts
 
 # ============================================================================
 # DATA SOURCE CONFIGURATION
@@ -115,12 +254,16 @@ APPROVED_NEWS_SOURCES = [
     "thehindubusinessline.com"
 ]
 
+# Built once at import: exact host lookup plus a suffix tuple for subdomains
+APPROVED_NEWS_SOURCES_SET = frozenset(APPROVED_NEWS_SOURCES)
+_APPROVED_SUFFIXES = tuple("." + domain for domain in APPROVED_NEWS_SOURCES)
+
 # Enable strict source filtering
-STRICT_NEWS_SOURCE_FILTERING = os.getenv("STRICT_SOURCE_FILTERING", "false").lower() == "true"
+STRICT_NEWS_SOURCE_FILTERING = CONFIG.strict_news_source_filtering
 
 # Maximum articles to fetch and analyze
-MAX_NEWS_ARTICLES = int(os.getenv("MAX_NEWS_ARTICLES", "6"))
-MIN_ARTICLE_LENGTH = int(os.getenv("MIN_ARTICLE_LENGTH", "300"))
+MAX_NEWS_ARTICLES = CONFIG.max_news_articles
+MIN_ARTICLE_LENGTH = CONFIG.min_article_length
 
 # ============================================================================
 # WORKER CONFIGURATION
@@ -161,101 +304,122 @@ NEWS_WORKER_CONFIG = {
 # CACHING
 # ============================================================================
 
-CACHE_FILE = os.getenv("CACHE_FILE", "query_cache.json")
-ENABLE_CACHING = os.getenv("ENABLE_CACHING", "true").lower() == "true"
-CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))  # 5 minutes
+CACHE_FILE = CONFIG.cache_file
+CACHE_DIR = CONFIG.cache_dir  # root of the sharded per-worker file cache
+ENABLE_CACHING = CONFIG.enable_caching
+CACHE_TTL_SECONDS = CONFIG.cache_ttl_seconds  # default 5 minutes
+
+# Per-worker TTLs matched to how often the underlying data changes;
+# workers not listed fall back to CACHE_TTL_SECONDS
+CACHE_TTL_BY_WORKER = {
+    "PRICES": 60,
+    "NEWS": 7 * 86400,
+    "FUNDAMENTALS": 90 * 86400,
+    "FUNDAMENTALS_MARKET": 300,  # price-derived fundamentals (price, market cap, P/E...)
+    "MACRO": 30 * 86400,
+    "FILINGS": 90 * 86400,
+    "NEWS_ANALYSIS": 86400,  # LLM responses, keyed by the full prompt
+}
 
 # ============================================================================
 # LOGGING
 # ============================================================================
 
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_FILE = os.getenv("LOG_FILE", "financial_intelligence.log")
-ENABLE_FILE_LOGGING = os.getenv("ENABLE_FILE_LOGGING", "false").lower() == "true"
+LOG_LEVEL = CONFIG.log_level
+LOG_FILE = CONFIG.log_file
+ENABLE_FILE_LOGGING = CONFIG.enable_file_logging
 
 # Debug mode (verbose output)
-DEBUG_MODE = os.getenv("DEBUG_MODE", "false").lower() == "true"
+DEBUG_MODE = CONFIG.debug_mode
 
 # ============================================================================
 # PERFORMANCE
 # ============================================================================
 
 # Maximum concurrent workers
-MAX_CONCURRENT_WORKERS = int(os.getenv("MAX_CONCURRENT_WORKERS", "4"))
+MAX_CONCURRENT_WORKERS = CONFIG.max_concurrent_workers
+
+# Maximum concurrent LLM calls per news analysis (one per article)
+MAX_CONCURRENT_ANALYSES = CONFIG.max_concurrent_analyses
 
 # Request timeout (seconds)
-DEFAULT_REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
+DEFAULT_REQUEST_TIMEOUT = CONFIG.default_request_timeout
 
 # Rate limiting
-ENABLE_RATE_LIMITING = os.getenv("ENABLE_RATE_LIMITING", "true").lower() == "true"
-RATE_LIMIT_REQUESTS_PER_MINUTE = int(os.getenv("RATE_LIMIT_RPM", "60"))
+ENABLE_RATE_LIMITING = CONFIG.enable_rate_limiting
+RATE_LIMIT_REQUESTS_PER_MINUTE = CONFIG.rate_limit_requests_per_minute
 
 # ============================================================================
 # OUTPUT FORMATTING
 # ============================================================================
 
 # Save results to file
-SAVE_RESULTS = os.getenv("SAVE_RESULTS", "true").lower() == "true"
-RESULTS_FILE = os.getenv("RESULTS_FILE", "last_run_results.json")
+SAVE_RESULTS = CONFIG.save_results
+RESULTS_FILE = CONFIG.results_file
 
 # Pretty print JSON
-PRETTY_PRINT_JSON = os.getenv("PRETTY_PRINT_JSON", "true").lower() == "true"
+PRETTY_PRINT_JSON = CONFIG.pretty_print_json
 
 # Include timestamps in output
-INCLUDE_TIMESTAMPS = os.getenv("INCLUDE_TIMESTAMPS", "true").lower() == "true"
+INCLUDE_TIMESTAMPS = CONFIG.include_timestamps
 
 # ============================================================================
 # VALIDATION
 # ============================================================================
 
-def validate_config():
-    """Validate configuration and warn about missing keys"""
+@lru_cache(maxsize=1)
+def _check_config() -> tuple:
+    """Collect configuration errors, reporting problems once per process"""
     
+    cfg = load_config()
     warnings = []
     errors = []
     
     # Check critical API keys
-    if not GROQ_API_KEY:
+    if not cfg.groq_api_key:
         errors.append("GROQ_API_KEY not set - system will not function")
     
     # Check fallback system configuration
-    if FALLBACK_SYSTEM == "groq" and not (ENABLE_GROQ_FALLBACK and GROQ_API_KEY):
+    if cfg.fallback_system == "groq" and not (cfg.enable_groq_fallback and cfg.groq_api_key):
         errors.append("Groq fallback configured but GROQ_API_KEY not set or ENABLE_GROQ_FALLBACK is false")
     
-    if FALLBACK_SYSTEM == "openai" and not (ENABLE_OPENAI_FALLBACK and OPENAI_API_KEY):
+    if cfg.fallback_system == "openai" and not (cfg.enable_openai_fallback and cfg.openai_api_key):
         errors.append("OpenAI fallback configured but OPENAI_API_KEY not set or ENABLE_OPENAI_FALLBACK is false")
     
-    if FALLBACK_SYSTEM == "hybrid":
-        if not (ENABLE_GROQ_FALLBACK and GROQ_API_KEY) and not (ENABLE_OPENAI_FALLBACK and OPENAI_API_KEY):
+    if cfg.fallback_system == "hybrid":
+        if not (cfg.enable_groq_fallback and cfg.groq_api_key) and not (cfg.enable_openai_fallback and cfg.openai_api_key):
             errors.append("Hybrid fallback configured but neither Groq nor OpenAI fallbacks are properly configured")
     
-    if not OPENAI_API_KEY and ENABLE_OPENAI_FALLBACK:
+    if not cfg.openai_api_key and cfg.enable_openai_fallback:
         warnings.append("OPENAI_API_KEY not set - OpenAI fallback disabled")
     
-    if not TAVILY_API_KEY and ENABLE_GROQ_FALLBACK:
+    if not cfg.tavily_api_key and cfg.enable_groq_fallback:
         warnings.append("TAVILY_API_KEY not set - Groq fallback may not work properly")
     
-    if not FRED_API_KEY:
+    if not cfg.fred_api_key:
         warnings.append("FRED_API_KEY not set - macro data will be limited")
     
     # Check thresholds
-    if not 0 <= AGGREGATE_CONFIDENCE_THRESHOLD <= 1:
-        errors.append(f"Invalid CONFIDENCE_THRESHOLD: {AGGREGATE_CONFIDENCE_THRESHOLD}")
+    if not 0 <= cfg.aggregate_confidence_threshold <= 1:
+        errors.append(f"Invalid CONFIDENCE_THRESHOLD: {cfg.aggregate_confidence_threshold}")
     
-    # Print warnings and errors
+    # Log warnings and errors
     if warnings:
-        print("⚠️  Configuration Warnings:")
-        for w in warnings:
-            print(f"   - {w}")
-        print()
+        logger.warning("⚠️  Configuration Warnings:\n%s", "\n".join(f"   - {w}" for w in warnings))
     
     if errors:
-        print("❌ Configuration Errors:")
-        for e in errors:
-            print(f"   - {e}")
-        print()
-        raise ValueError("Invalid configuration")
+        logger.error("❌ Configuration Errors:\n%s", "\n".join(f"   - {e}" for e in errors))
     
+    return tuple(errors)
+
+
+def validate_config():
+    """Validate configuration and warn about missing keys
+    
+    Call from entrypoints; the check itself runs once and is cached.
+    """
+    if _check_config():
+        raise ValueError("Invalid configuration")
     return True
 
 # ============================================================================
@@ -272,35 +436,51 @@ def get_worker_config(worker_name: str) -> dict:
         "NEWS": NEWS_WORKER_CONFIG
     }
     
-    return config_map.get(worker_name, {})
+    return {**config_map.get(worker_name, {}), "cache_ttl": get_cache_ttl(worker_name)}
+
+
+def get_cache_ttl(worker_name: str) -> int:
+    """Get cache TTL (seconds) for a worker's data"""
+    return CACHE_TTL_BY_WORKER.get(worker_name, CACHE_TTL_SECONDS)
+
+
+def is_approved_source(url: str) -> bool:
+    """Check if a URL's host is an approved news source or a subdomain of one"""
+    try:
+        host = urlparse(url).hostname
+    except ValueError:
+        return False
+    if not host:
+        return False
+    return host in APPROVED_NEWS_SOURCES_SET or host.endswith(_APPROVED_SUFFIXES)
 
 
 def should_enable_fallback() -> bool:
     """Check if any fallback system should be enabled"""
-    if FALLBACK_SYSTEM == "groq":
-        return ENABLE_GROQ_FALLBACK and GROQ_API_KEY is not None
-    elif FALLBACK_SYSTEM == "openai":
-        return ENABLE_OPENAI_FALLBACK and OPENAI_API_KEY is not None
-    elif FALLBACK_SYSTEM == "hybrid":
-        return (ENABLE_GROQ_FALLBACK and GROQ_API_KEY is not None) or \
-               (ENABLE_OPENAI_FALLBACK and OPENAI_API_KEY is not None)
+    if CONFIG.fallback_system == "groq":
+        return CONFIG.enable_groq_fallback and CONFIG.groq_api_key is not None
+    elif CONFIG.fallback_system == "openai":
+        return CONFIG.enable_openai_fallback and CONFIG.openai_api_key is not None
+    elif CONFIG.fallback_system == "hybrid":
+        return (CONFIG.enable_groq_fallback and CONFIG.groq_api_key is not None) or \
+               (CONFIG.enable_openai_fallback and CONFIG.openai_api_key is not None)
     else:
         return False
 
 
 def should_enable_openai_fallback() -> bool:
     """Check if OpenAI fallback should be enabled"""
-    return ENABLE_OPENAI_FALLBACK and OPENAI_API_KEY is not None
+    return CONFIG.enable_openai_fallback and CONFIG.openai_api_key is not None
 
 
 def should_enable_groq_fallback() -> bool:
     """Check if Groq fallback should be enabled"""
-    return ENABLE_GROQ_FALLBACK and GROQ_API_KEY is not None
+    return CONFIG.enable_groq_fallback and CONFIG.groq_api_key is not None
 
 
 def get_fallback_system_type() -> str:
     """Get the configured fallback system type"""
-    return FALLBACK_SYSTEM
+    return CONFIG.fallback_system
 
 
 def get_confidence_threshold(worker_name: str = None) -> float:
@@ -309,7 +489,7 @@ def get_confidence_threshold(worker_name: str = None) -> float:
     if worker_name:
         return WORKER_CONFIDENCE_THRESHOLDS.get(worker_name, 0.5)
     
-    return AGGREGATE_CONFIDENCE_THRESHOLD
+    return CONFIG.aggregate_confidence_threshold
 
 
 # ============================================================================
@@ -317,31 +497,31 @@ def get_confidence_threshold(worker_name: str = None) -> float:
 # ============================================================================
 
 def print_config_summary():
-    """Print configuration summary"""
+    """Print configuration summary to stdout (CLI helper)"""
     
-    print("=" * 80)
-    print("CONFIGURATION SUMMARY")
-    print("=" * 80)
-    print(f"\nLLM Provider: {LLM_PROVIDER}")
-    print(f"Planner Model: {PLANNER_MODEL}")
-    print(f"Worker Model: {WORKER_MODEL}")
-    print(f"\nOpenAI Fallback: {'ENABLED' if should_enable_fallback() else 'DISABLED'}")
-    if should_enable_fallback():
-        print(f"Fallback Model: {OPENAI_FALLBACK_MODEL}")
-        print(f"Confidence Threshold: {AGGREGATE_CONFIDENCE_THRESHOLD}")
-    print(f"\nAPI Keys Configured:")
-    print(f"  GROQ: {'✅' if GROQ_API_KEY else '❌'}")
-    print(f"  OpenAI: {'✅' if OPENAI_API_KEY else '❌'}")
-    print(f"  FRED: {'✅' if FRED_API_KEY else '❌'}")
-    print(f"  Polygon: {'✅' if POLYGON_API_KEY else '❌'}")
-    print(f"\nCaching: {'ENABLED' if ENABLE_CACHING else 'DISABLED'}")
-    print(f"Debug Mode: {'ON' if DEBUG_MODE else 'OFF'}")
-    print("=" * 80)
-
-
-# Validate configuration on import
-if __name__ != "__main__":
-    try:
-        validate_config()
-    except Exception as e:
-        print(f"Configuration validation failed: {e}")
\ No newline at end of file
+    fallback = should_enable_fallback()
+    fallback_details = (
+        f"Fallback Model: {OPENAI_FALLBACK_MODEL}\n"
+        f"Confidence Threshold: {AGGREGATE_CONFIDENCE_THRESHOLD}\n"
+        if fallback else ""
+    )
+    
+    def mark(key):
+        return "✅" if key else "❌"
+    
+    # One write for the whole block
+    print(
+        "\n%s\nCONFIGURATION SUMMARY\n%s\n"
+        "\nLLM Provider: %s\nPlanner Model: %s\nWorker Model: %s\n"
+        "\nOpenAI Fallback: %s\n%s"
+        "\nAPI Keys Configured:\n  GROQ: %s\n  OpenAI: %s\n  FRED: %s\n  Polygon: %s\n"
+        "\nCaching: %s\nDebug Mode: %s\n%s" % (
+            "=" * 80, "=" * 80,
+            LLM_PROVIDER, PLANNER_MODEL, WORKER_MODEL,
+            "ENABLED" if fallback else "DISABLED", fallback_details,
+            mark(GROQ_API_KEY), mark(OPENAI_API_KEY), mark(FRED_API_KEY), mark(POLYGON_API_KEY),
+            "ENABLED" if ENABLE_CACHING else "DISABLED",
+            "ON" if DEBUG_MODE else "OFF",
+            "=" * 80
+        )
+    )
@@ -2,11 +2,14 @@
 
 Core data structures for governance and validation
 """
+import re
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from enum import Enum
 
+from financial_intelligence.core.serialize import as_dict, to_json
+
 
 class DomainType(Enum):
     """Domain classification"""
@@ -23,29 +26,44 @@ class QuarantineStatus(Enum):
     CONTAMINATED = "CONTAMINATED"
 
 
-@dataclass
+# Zero-padded ISO dates sort lexicographically, so they compare as strings
+_ISO_DATE_RE = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
+
+
+def _iso_key(date_str: Any) -> Optional[str]:
+    """Normalize a YYYY-MM-DD date to its zero-padded form, or None if invalid"""
+    if isinstance(date_str, str) and _ISO_DATE_RE.match(date_str):
+        return date_str
+    # Slow path for non-padded input such as "2024-1-5"
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except (ValueError, TypeError):
+        return None
+
+
+@dataclass(slots=True)
 class Timelock:
     """Temporal consistency enforcement"""
     as_of_date: str  # YYYY-MM-DD
     max_allowed_date: str  # YYYY-MM-DD
+    _max_key: Optional[str] = field(init=False, repr=False, compare=False, default=None)
+    
+    def __post_init__(self):
+        # Parse the bound once instead of on every validate_date call
+        self._max_key = _iso_key(self.max_allowed_date)
     
     def validate_date(self, date_str: str) -> bool:
         """Check if date is within allowed range"""
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            max_date = datetime.strptime(self.max_allowed_date, "%Y-%m-%d")
-            return date <= max_date
-        except (ValueError, TypeError):
+        if self._max_key is None:
             return False
+        key = _iso_key(date_str)
+        return key is not None and key <= self._max_key
     
     def to_dict(self) -> Dict[str, str]:
-        return {
-            "as_of_date": self.as_of_date,
-            "max_allowed_date": self.max_allowed_date
-        }
+        return as_dict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class DAGContext:
     """Complete context for DAG-safe execution"""
     query: str
@@ -58,18 +76,14 @@ class DAGContext:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return {
-            "query": self.query,
-            "intent": self.intent,
-            "entities": self.entities,
-            "timelock": self.timelock.to_dict() if self.timelock else None,
-            "domain_hint": self.domain_hint.value,
-            "required_metrics": self.required_metrics,
-            "confidence": self.confidence
-        }
+        return as_dict(self)
+    
+    def to_json(self) -> bytes:
+        """Serialize straight to JSON bytes, skipping the intermediate dict"""
+        return to_json(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class GovernanceMetadata:
     """Metadata for governance validation results"""
     timelock_validated: bool = False
@@ -79,13 +93,43 @@ class GovernanceMetadata:
     validation_timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "timelock_validated": self.timelock_validated,
-            "domain_purity_check": self.domain_purity_check,
-            "completeness_score": self.completeness_score,
-            "quarantine_status": self.quarantine_status.value,
-            "validation_timestamp": self.validation_timestamp
-        }
+        return as_dict(self)
+    
+    def to_json(self) -> bytes:
+        return to_json(self)
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerResult:
+    """Read-only view of the worker output fields the verifier reads
+    
+    Built once per worker at the validator boundary so the validators use
+    attribute loads instead of repeated dict lookups. Missing keys get the
+    same defaults the validators used with .get().
+    """
+    status: Optional[str] = None
+    error: Any = "unknown"
+    data: Any = field(default_factory=dict)
+    region: Any = "UNKNOWN"
+    macro_facts: Any = field(default_factory=dict)
+    synthesis: Any = field(default_factory=dict)
+    governance: Any = field(default_factory=dict)
+    
+    @classmethod
+    def from_raw(cls, raw: Any) -> "WorkerResult":
+        """Wrap a worker's output dict (an existing WorkerResult is returned as-is)"""
+        if isinstance(raw, cls):
+            return raw
+        get = raw.get
+        return cls(
+            status=get("status"),
+            error=get("error", "unknown"),
+            data=get("data", {}),
+            region=get("region", "UNKNOWN"),
+            macro_facts=get("macro_facts", {}),
+            synthesis=get("synthesis", {}),
+            governance=get("_governance", {}),
+        )
 
 
 # ==========================================
@@ -94,6 +138,9 @@ class GovernanceMetadata:
 
 class WorkerError(Exception):
     """Base error for all workers"""
+    # Exception can't take dataclass(slots=True); declare slots by hand
+    __slots__ = ("status", "message", "metadata")
+    
     def __init__(self, status: str, message: str, metadata: Dict = None):
         self.status = status
         self.message = message
@@ -111,6 +158,8 @@ class WorkerError(Exception):
 
 class TimelockViolationError(WorkerError):
     """Raised when data exceeds max_allowed_date"""
+    __slots__ = ()
+    
     def __init__(self, message: str, date_found: str, max_allowed: str):
         super().__init__(
             status="TIMELOCK_VIOLATION",
@@ -121,6 +170,8 @@ class TimelockViolationError(WorkerError):
 
 class DomainContaminationError(WorkerError):
     """Raised when non-financial data contaminates financial queries"""
+    __slots__ = ()
+    
     def __init__(self, message: str, expected_domain: str, actual_domain: str):
         super().__init__(
             status="DOMAIN_CONTAMINATION",
@@ -131,6 +182,8 @@ class DomainContaminationError(WorkerError):
 
 class MissingDataError(WorkerError):
     """Raised when required metrics are missing"""
+    __slots__ = ()
+    
     def __init__(self, message: str, missing_metrics: List[str]):
         super().__init__(
             status="MISSING_DATA",
@@ -141,6 +194,8 @@ class MissingDataError(WorkerError):
 
 class IntelligenceContaminationError(WorkerError):
     """Raised when forward-looking data contaminates calculations"""
+    __slots__ = ()
+    
     def __init__(self, message: str, contaminated_fields: List[str]):
         super().__init__(
             status="INTELLIGENCE_CONTAMINATION",
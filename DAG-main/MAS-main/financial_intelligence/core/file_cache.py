@@ -0,0 +1,97 @@
+"""Sharded on-disk cache for worker responses
+
+Each entry is its own file at ``<root>/<worker>/<key[:2]>/<key>.json``, so a
+write touches one small file instead of rewriting a monolithic cache, and
+readers never need a lock. Writes go through a temp file + os.replace.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from financial_intelligence.config import CACHE_DIR, ENABLE_CACHING, get_cache_ttl
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache:
+    """Per-key JSON files with a TTL stored alongside each value"""
+
+    def __init__(self, root: str = CACHE_DIR):
+        self.root = Path(root)
+
+    @staticmethod
+    def make_key(endpoint: str, params: Any = None) -> str:
+        return hashlib.md5(f"{endpoint}|{params}".encode("utf-8")).hexdigest()
+
+    def _path(self, worker: str, key: str) -> Path:
+        return self.root / worker / key[:2] / f"{key}.json"
+
+    def get(self, worker: str, endpoint: str, params: Any = None) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        path = self._path(worker, self.make_key(endpoint, params))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() > entry.get("ts", 0) + entry.get("ttl", 0):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        return entry.get("value")
+
+    def set(
+        self,
+        worker: str,
+        endpoint: str,
+        params: Any = None,
+        *,
+        value: Any,
+        ttl: Optional[int] = None,
+    ) -> None:
+        """Store `value`; `ttl` defaults to the worker's configured TTL"""
+        path = self._path(worker, self.make_key(endpoint, params))
+        entry = {
+            "ts": time.time(),
+            "ttl": get_cache_ttl(worker) if ttl is None else ttl,
+            "value": value,
+        }
+        tmp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Each writer gets its own temp file, so concurrent writers never
+            # interleave; the last os.replace wins
+            with tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as tmp:
+                tmp_name = tmp.name
+                json.dump(entry, tmp)
+            os.replace(tmp_name, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not cache %s response: %s", worker, e)
+            if tmp_name:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+
+_file_cache: Optional[FileCache] = None
+
+
+def get_file_cache() -> Optional[FileCache]:
+    """Shared FileCache, or None when ENABLE_CACHING is off"""
+    global _file_cache
+    if not ENABLE_CACHING:
+        return None
+    if _file_cache is None:
+        _file_cache = FileCache()
+    return _file_cache
@@ -1,14 +1,18 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict
 
 
 class Entity(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     ticker: str
     type: str  # stock | index | country
 
 
 class Requirements(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     company_fundamentals: bool
     market_prices: bool
     macro_data: bool
@@ -16,8 +20,10 @@ class Requirements(BaseModel):
 
 
 class PlannerOutput(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     entities: List[Entity]
     region: str
     requirements: Requirements
     time_context: str
-    error: Optional[str]
+    error: Optional[str] = None
@@ -0,0 +1,98 @@
+"""Token-bucket rate limiting for outbound requests
+
+One bucket per host, sized from RATE_LIMIT_REQUESTS_PER_MINUTE. Bursts spend
+accumulated tokens immediately instead of being serialized by fixed sleeps.
+"""
+import asyncio
+import threading
+import time
+from typing import Awaitable, Dict, Optional, TypeVar
+from urllib.parse import urlparse
+
+from financial_intelligence.config import ENABLE_RATE_LIMITING, RATE_LIMIT_REQUESTS_PER_MINUTE
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Classic token bucket: holds up to `capacity` tokens, refilled continuously"""
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = float(capacity)
+        self.refill_per_sec = float(refill_per_sec)
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        # A thread lock (held only for arithmetic) lets one bucket serve
+        # coroutines on different event loops
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_sec)
+            self.last_refill = now
+
+    def try_acquire(self, n: float = 1) -> bool:
+        """Take `n` tokens if available; never blocks"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens >= n:
+                self.tokens -= n
+                return True
+            return False
+
+    def _wait_time(self, n: float) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens >= n:
+                self.tokens -= n
+                return 0.0
+            return (n - self.tokens) / self.refill_per_sec
+
+    async def acquire(self, n: float = 1) -> None:
+        """Wait until `n` tokens are available, then take them"""
+        while True:
+            delay = self._wait_time(n)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    async def wrap(self, aw: Awaitable[T]) -> T:
+        """Take a token, then await `aw`; lets a gather() fan-out share the bucket"""
+        await self.acquire()
+        return await aw
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(url: str) -> Optional[TokenBucket]:
+    """Per-host bucket for `url`, or None when rate limiting is disabled"""
+    if not ENABLE_RATE_LIMITING or RATE_LIMIT_REQUESTS_PER_MINUTE <= 0:
+        return None
+    host = urlparse(url).hostname or ""
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(
+                capacity=RATE_LIMIT_REQUESTS_PER_MINUTE,
+                refill_per_sec=RATE_LIMIT_REQUESTS_PER_MINUTE / 60,
+            )
+            _buckets[host] = bucket
+        return bucket
+
+
+async def acquire_for(url: str) -> None:
+    """Wait for a request slot on `url`'s host"""
+    bucket = get_bucket(url)
+    if bucket is not None:
+        await bucket.acquire()
+
+
+async def limited(url: str, aw: Awaitable[T]) -> T:
+    """Await `aw` once `url`'s host has a free request slot"""
+    bucket = get_bucket(url)
+    if bucket is None:
+        return await aw
+    return await bucket.wrap(aw)
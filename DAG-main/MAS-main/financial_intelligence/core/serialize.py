@@ -0,0 +1,56 @@
+"""Shared serialization for the core dataclasses
+
+`as_dict` walks dataclass fields once (no deepcopy, unlike dataclasses.asdict)
+and `to_json` hands the instance straight to orjson, which serializes
+dataclasses natively without building an intermediate dict.
+"""
+import json
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Dict
+
+try:
+    import orjson
+    _ORJSON_OPTS = (
+        orjson.OPT_SERIALIZE_DATACLASS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NAIVE_UTC
+        | orjson.OPT_NON_STR_KEYS
+    )
+except Exception:
+    orjson = None
+    _ORJSON_OPTS = 0
+
+
+def _default(obj: Any) -> Any:
+    """Encode values orjson/json don't handle natively"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj):
+        return as_dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _convert(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value) and not isinstance(value, type):
+        return as_dict(value)
+    return value
+
+
+def as_dict(obj: Any) -> Dict[str, Any]:
+    """Public fields of a dataclass as a dict; private (_-prefixed) fields are skipped"""
+    return {
+        f.name: _convert(getattr(obj, f.name))
+        for f in fields(obj)
+        if not f.name.startswith("_")
+    }
+
+
+def to_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize a dataclass (or anything containing one) to JSON bytes"""
+    if orjson is not None:
+        option = _ORJSON_OPTS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTS
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, default=_default, indent=2 if indent else None).encode("utf-8")
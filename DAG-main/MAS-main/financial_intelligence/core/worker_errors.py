@@ -4,9 +4,12 @@ Standardized error handling for all workers.
 
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
-from enum import Enum
+from enum import Enum, unique
 
+from financial_intelligence.core.serialize import as_dict, to_json
 
+
+@unique
 class WorkerErrorStatus(Enum):
     """Standardized error statuses for all workers."""
     DATA_UNAVAILABLE = "DATA_UNAVAILABLE"
@@ -16,14 +19,28 @@ class WorkerErrorStatus(Enum):
     RATE_LIMIT_ERROR = "RATE_LIMIT_ERROR"
     AUTHENTICATION_ERROR = "AUTHENTICATION_ERROR"
     PARSE_ERROR = "PARSE_ERROR"
-    TIMELock_VIOLATION = "TIMELOCK_VIOLATION"
+    TIMELOCK_VIOLATION = "TIMELOCK_VIOLATION"
     DOMAIN_CONTAMINATION = "DOMAIN_CONTAMINATION"
     CONTAMINATION_DETECTED = "CONTAMINATION_DETECTED"
     UNVERIFIABLE_SOURCE = "UNVERIFIABLE_SOURCE"
     FORWARD_LOOKING_DETECTED = "FORWARD_LOOKING_DETECTED"
 
 
-@dataclass
+_RETRYABLE = frozenset({
+    WorkerErrorStatus.NETWORK_ERROR,
+    WorkerErrorStatus.TIMEOUT_ERROR,
+    WorkerErrorStatus.RATE_LIMIT_ERROR,
+    WorkerErrorStatus.AUTHENTICATION_ERROR,
+})
+
+_BLOCKING = frozenset({
+    WorkerErrorStatus.TIMELOCK_VIOLATION,
+    WorkerErrorStatus.DOMAIN_CONTAMINATION,
+    WorkerErrorStatus.CONTAMINATION_DETECTED,
+})
+
+
+@dataclass(slots=True)
 class WorkerError:
     """
     Standardized error structure for all workers.
@@ -52,35 +69,19 @@ class WorkerError:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API responses."""
-        return {
-            "status": self.status.value,
-            "message": self.message,
-            "worker_name": self.worker_name,
-            "query": self.query,
-            "entities": self.entities,
-            "metadata": self.metadata,
-            "timestamp": self.timestamp,
-            "retry_count": self.retry_count
-        }
+        return as_dict(self)
+    
+    def to_json(self) -> bytes:
+        """Serialize straight to JSON bytes for API responses."""
+        return to_json(self)
     
     def is_retryable(self) -> bool:
         """Check if this error is retryable."""
-        retryable_statuses = [
-            WorkerErrorStatus.NETWORK_ERROR,
-            WorkerErrorStatus.TIMEOUT_ERROR,
-            WorkerErrorStatus.RATE_LIMIT_ERROR,
-            WorkerErrorStatus.AUTHENTICATION_ERROR
-        ]
-        return self.status in retryable_statuses
+        return self.status in _RETRYABLE
     
     def is_blocking(self) -> bool:
         """Check if this error should block the entire query."""
-        blocking_statuses = [
-            WorkerErrorStatus.TIMELOCK_VIOLATION,
-            WorkerErrorStatus.DOMAIN_CONTAMINATION,
-            WorkerErrorStatus.CONTAMINATION_DETECTED
-        ]
-        return self.status in blocking_statuses
+        return self.status in _BLOCKING
 
 
 class WorkerException(Exception):
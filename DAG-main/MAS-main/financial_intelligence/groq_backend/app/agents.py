@@ -0,0 +1,507 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+
+from .llm import openai_chat, openai_chat_async, openai_stream_chat_async
+from .search import web_search, format_search_context
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+ROUTER_SYSTEM_PROMPT = """You are a STRICT QUERY ROUTER for a financial intelligence system.
+
+Your task is ONLY to decide whether answering the query requires external, verifiable data.
+
+Respond with ONLY:
+YES
+or
+NO
+
+Reply YES if the query involves:
+- Financial results, earnings, profits, revenues, margins, ratios
+- Stock prices, indices, commodities, yields, interest rates
+- Company fundamentals or quarterly / yearly performance
+- Macroeconomic indicators (GDP, CPI, inflation, policy rates)
+- News, events, announcements, or timelines
+- Any question where NUMBERS must be FACTUALLY CORRECT
+- Geopolitical events and their economic impact
+- Currency analysis and exchange rates
+- Sector-specific impacts and analysis
+- Current market conditions or trends
+
+Reply NO if the query involves:
+- Conceptual explanations (e.g., "what is inflation")
+- Financial theory or definitions
+- Opinions, strategies, or hypothetical scenarios
+- Coding, architecture, or system design questions
+
+IMPORTANT RULES:
+- If unsure, ALWAYS answer YES
+- NEVER assume numbers from memory
+- NEVER hallucinate financial data
+- Geopolitical impact analysis ALWAYS requires web search
+- Current economic conditions ALWAYS require web search
+"""
+
+WEB_SEARCH_SYSTEM_PROMPT = """You are WebGPT — a FINANCIAL FACT SYNTHESIS ENGINE.
+
+Your responsibilities are STRICT:
+
+1. Use ONLY the provided search results
+2. NEVER invent, estimate, or assume numbers
+3. NEVER use prior knowledge or memory
+4. If exact figures are unavailable, explicitly state that
+5. Prefer accuracy over completeness
+
+FINANCIAL SAFETY RULES:
+- Every numeric value must be directly supported by a source
+- If multiple sources conflict, mention the discrepancy
+- If dates or fiscal periods are unclear, do not guess
+- Do NOT extrapolate trends unless explicitly stated in sources
+
+STYLE GUIDELINES:
+- Be concise and structured
+- Use bullet points for financial metrics
+- Clearly mention fiscal period (FY, Q, dates)
+- Cite sources naturally (company filings, Reuters, Bloomberg, etc.)
+
+If search data is insufficient:
+Say clearly: "Exact financial figures are not available in the provided sources."
+"""
+
+CHAT_SYSTEM_PROMPT = """You are a finance-aware AI assistant.
+
+Guidelines:
+- Do NOT fabricate or guess financial numbers
+- Do NOT provide current prices, earnings, or statistics without verified data
+- If a query likely requires real-world financial data, clearly recommend web search
+- You may explain concepts, frameworks, and qualitative insights
+
+Allowed:
+- Definitions
+- Financial concepts
+- Strategic or educational explanations
+
+Disallowed:
+- Specific company financial figures
+- Stock prices or ratios
+- Recent events or announcements
+
+When in doubt, explicitly say that external data is required.
+"""
+
+# Router and chat answer in one call: used for ambiguous queries so a
+# chat-only answer doesn't need a second round-trip
+FUSED_ROUTER_SYSTEM_PROMPT = """You are a STRICT QUERY ROUTER and finance-aware assistant for a financial intelligence system.
+
+First decide whether answering the query requires external, verifiable data.
+
+Respond with a JSON object ONLY, in exactly one of these forms:
+{"route": "search"}
+{"route": "chat", "reply": "<your full answer>"}
+
+Choose "search" if the query involves:
+- Financial results, earnings, profits, revenues, margins, ratios
+- Stock prices, indices, commodities, yields, interest rates
+- Company fundamentals or quarterly / yearly performance
+- Macroeconomic indicators (GDP, CPI, inflation, policy rates)
+- News, events, announcements, or timelines
+- Any question where NUMBERS must be FACTUALLY CORRECT
+- Geopolitical events and their economic impact
+- Currency analysis and exchange rates
+- Sector-specific impacts and analysis
+- Current market conditions or trends
+
+Choose "chat" only if the query involves:
+- Conceptual explanations (e.g., "what is inflation")
+- Financial theory or definitions
+- Opinions, strategies, or hypothetical scenarios
+- Coding, architecture, or system design questions
+
+IMPORTANT RULES:
+- If unsure, ALWAYS choose "search"
+- NEVER assume numbers from memory
+- NEVER hallucinate financial data
+
+When you choose "chat", the reply must:
+- Explain concepts, frameworks, and qualitative insights
+- NOT include specific company figures, prices, ratios, or recent events
+- Say explicitly when external data would be required
+"""
+
+# Local routing: the keyword lists of ROUTER_SYSTEM_PROMPT as compiled patterns
+_SEARCH_RE = re.compile(
+    r"\b("
+    r"earnings?|profits?|revenues?|margins?|ratios?|eps|ebitda|valuation|market cap"
+    r"|(stock|share) prices?|prices?|indices|index|sensex|nifty|nasdaq|dow|s&p"
+    r"|commodit(y|ies)|gold|crude|oil|yields?|bonds?|interest rates?|policy rates?|repo rate"
+    r"|fundamentals?|quarter(ly)?|q[1-4]|fy\s?\d{2,4}|annual|yearly|results?|performance"
+    r"|gdp|cpi|inflation|unemployment|fed|rbi"
+    r"|news|latest|today|recent(ly)?|current(ly)?|announce\w*|events?|timeline"
+    r"|geopolitic\w*|war|tariffs?|sanctions?"
+    r"|exchange rates?|currenc(y|ies)|forex|rupee|dollar|euro|yen"
+    r"|sectors?|markets?|trends?|(19|20)\d{2}"
+    r")\b",
+    re.IGNORECASE
+)
+_NO_SEARCH_RE = re.compile(
+    r"\b("
+    r"what (is|are)|define|definition of|meaning of"
+    r"|explain|concept of|difference between|in theory|theory of"
+    r"|hi|hello|hey|thanks|thank you|good (morning|afternoon|evening)|how are you|jokes?"
+    r"|hypothetical(ly)?|what if|opinion|strategy|strategies"
+    r"|code|coding|python|javascript|architecture|system design"
+    r")\b",
+    re.IGNORECASE
+)
+
+def classify_query_locally(query: str):
+    """
+    True/False when keywords decide the route, None when ambiguous
+    """
+    wants_search = _SEARCH_RE.search(query) is not None
+    no_search = _NO_SEARCH_RE.search(query) is not None
+    if wants_search and no_search:
+        return None
+    if no_search:
+        return False
+    # Search keywords, or nothing recognisable: "if unsure, ALWAYS answer YES"
+    return True
+
+def _router_messages(query: str) -> list:
+    return [
+        {
+            "role": "system",
+            "content": ROUTER_SYSTEM_PROMPT
+        },
+        {"role": "user", "content": query}
+    ]
+
+# LLM routing decisions, keyed by normalized query (bounded LRU)
+ROUTER_CACHE_SIZE = int(os.getenv("ROUTER_CACHE_SIZE", "4096"))
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_router_decisions = OrderedDict()  # normalized query -> bool
+
+def _normalize_query(query: str) -> str:
+    return _WHITESPACE_RE.sub(" ", query.strip().lower())
+
+def _cached_decision(key: str):
+    decision = _router_decisions.get(key)
+    if decision is not None:
+        _router_decisions.move_to_end(key)
+    return decision
+
+def _remember_decision(key: str, decision: bool) -> bool:
+    if ROUTER_CACHE_SIZE > 0:
+        _router_decisions[key] = decision
+        _router_decisions.move_to_end(key)
+        while len(_router_decisions) > ROUTER_CACHE_SIZE:
+            _router_decisions.popitem(last=False)
+    return decision
+
+def needs_web_search(query: str) -> bool:
+    """
+    Determine if query needs web search (keywords first, OpenAI only if ambiguous)
+    """
+    local = classify_query_locally(query)
+    if local is not None:
+        return local
+    key = _normalize_query(query)
+    cached = _cached_decision(key)
+    if cached is not None:
+        return cached
+    response = openai_chat(_router_messages(query), temperature=0.0, max_tokens=10)
+    
+    return _remember_decision(key, "YES" in response.upper())
+
+async def needs_web_search_async(query: str) -> bool:
+    """
+    Async variant of needs_web_search
+    """
+    local = classify_query_locally(query)
+    if local is not None:
+        return local
+    key = _normalize_query(query)
+    cached = _cached_decision(key)
+    if cached is not None:
+        return cached
+    response = await openai_chat_async(_router_messages(query), temperature=0.0, max_tokens=10)
+    
+    return _remember_decision(key, "YES" in response.upper())
+
+async def route_or_answer_async(query: str) -> dict:
+    """
+    One LLM call that either routes to search or answers directly
+    
+    Returns {"route": "search"} or {"route": "chat", "reply": str}; anything
+    unparseable routes to search, matching the router's "if unsure, YES".
+    """
+    response = await openai_chat_async(
+        [
+            {"role": "system", "content": FUSED_ROUTER_SYSTEM_PROMPT},
+            {"role": "user", "content": query}
+        ],
+        temperature=0.4,
+        max_tokens=1500,
+        response_format={"type": "json_object"}
+    )
+    try:
+        decision = _json_loads(response or "")
+    except ValueError:
+        return {"route": "search"}
+    if not isinstance(decision, dict):
+        return {"route": "search"}
+    reply = decision.get("reply")
+    if decision.get("route") == "chat" and isinstance(reply, str) and reply.strip():
+        return {"route": "chat", "reply": reply}
+    return {"route": "search"}
+
+def planner(query: str) -> dict:
+    """
+    Plan the query execution strategy
+    Returns dict with type and search flag
+    """
+    needs_search = needs_web_search(query)
+    
+    return {
+        "type": "web_search" if needs_search else "chat",
+        "needs_search": needs_search,
+        "query": query
+    }
+
+def _web_search_messages(query: str, search_results: dict) -> list:
+    # Format context from search results
+    context = format_search_context(search_results)
+    return [
+        {
+            "role": "system",
+            "content": WEB_SEARCH_SYSTEM_PROMPT
+        },
+        {
+            "role": "user",
+            "content": f"Query: {query}\n\n{context}\n\nProvide a comprehensive answer based on these search results."
+        }
+    ]
+
+SNIPPET_LENGTH = 200
+
+def _truncate(text: str, limit: int = SNIPPET_LENGTH) -> str:
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+def _extract_sources(search_results: dict) -> list:
+    """
+    Search results as Source-shaped dicts with snippets truncated once here
+    """
+    return [
+        {
+            "title": result.get("title") or "",
+            "url": result.get("url") or "",
+            "snippet": _truncate(result.get("content") or "")
+        }
+        for result in search_results.get("results", [])
+    ]
+
+def _chat_messages(query: str) -> list:
+    return [
+        {
+            "role": "system",
+            "content": CHAT_SYSTEM_PROMPT
+        },
+        {"role": "user", "content": query}
+    ]
+
+async def web_search_agent(query: str, search_results: dict = None) -> dict:
+    """
+    Agent that performs web search and synthesizes answer
+    
+    `search_results` may be passed in when the search already ran
+    (e.g. speculatively alongside routing).
+    """
+    # Perform web search
+    if search_results is None:
+        search_results = await web_search(query, 5)
+    
+    if search_results.get("error"):
+        return {
+            "type": "error",
+            "reply": f"Search error: {search_results['error']}",
+            "sources": []
+        }
+    
+    # Generate answer using OpenAI with search context
+    answer = await openai_chat_async(_web_search_messages(query, search_results), temperature=0.2, max_tokens=1500)
+    
+    return {
+        "type": "web_search",
+        "reply": answer,
+        "sources": _extract_sources(search_results),
+        "quick_answer": search_results.get("answer", "")
+    }
+
+async def chat_agent(query: str) -> dict:
+    """
+    Agent for general conversation without web search
+    """
+    answer = await openai_chat_async(_chat_messages(query), temperature=0.4, max_tokens=1500)
+    
+    return {
+        "type": "chat",
+        "reply": answer,
+        "sources": []
+    }
+
+async def web_search_agent_stream(query: str, search_results: dict = None):
+    """
+    Streaming variant of web_search_agent
+    
+    Yields a "sources" event first, then "content" events as tokens arrive,
+    so the first words reach the client without waiting for the full answer.
+    """
+    if search_results is None:
+        search_results = await web_search(query, 5)
+    
+    if search_results.get("error"):
+        yield {"type": "error", "error": f"Search error: {search_results['error']}"}
+        return
+    
+    yield {"type": "sources", "sources": search_results.get("results", [])}
+    
+    async for chunk in openai_stream_chat_async(
+        _web_search_messages(query, search_results), temperature=0.2, max_tokens=1500
+    ):
+        yield {"type": "content", "content": chunk}
+
+async def chat_agent_stream(query: str):
+    """
+    Streaming variant of chat_agent; yields "content" events
+    """
+    async for chunk in openai_stream_chat_async(_chat_messages(query), temperature=0.4, max_tokens=1500):
+        yield {"type": "content", "content": chunk}
+
+def start_speculative_search(query: str, max_results: int = 5) -> asyncio.Task:
+    """
+    Start the web search before routing is decided; cancel it if not needed
+    """
+    return asyncio.create_task(web_search(query, max_results))
+
+async def decide_search(query: str):
+    """
+    Returns (needs_search, search_results or None)
+    
+    Keyword routing decides most queries instantly; for ambiguous ones the
+    search runs concurrently with the LLM router and is cancelled on NO.
+    """
+    local = classify_query_locally(query)
+    if local is False:
+        return False, None
+    if local is True:
+        return True, await web_search(query, 5)
+    
+    search_task = start_speculative_search(query)
+    try:
+        needs_search = await needs_web_search_async(query)
+    except BaseException:
+        search_task.cancel()
+        raise
+    if not needs_search:
+        search_task.cancel()
+        return False, None
+    return True, await search_task
+
+async def route_query_stream(query: str):
+    """
+    Streaming counterpart of route_query: routes once, then yields the
+    chosen agent's events ("sources" first for search, then "content")
+    """
+    needs_search, search_results = await decide_search(query)
+    
+    if needs_search:
+        events = web_search_agent_stream(query, search_results)
+    else:
+        events = chat_agent_stream(query)
+    
+    async for event in events:
+        yield event
+
+# Answers to repeated questions are served from memory for a short window
+ROUTE_CACHE_SIZE = int(os.getenv("ROUTE_CACHE_SIZE", "1024"))
+ROUTE_CACHE_TTL = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+
+_route_cache = OrderedDict()  # key -> (expires_at, result)
+
+def _route_cache_key(query: str) -> bytes:
+    return hashlib.blake2b(_normalize_query(query).encode("utf-8"), digest_size=16).digest()
+
+def _route_cache_get(key: bytes):
+    entry = _route_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if time.monotonic() > expires_at:
+        _route_cache.pop(key, None)
+        return None
+    _route_cache.move_to_end(key)
+    return result
+
+def _route_cache_set(key: bytes, result: dict) -> None:
+    _route_cache[key] = (time.monotonic() + ROUTE_CACHE_TTL, result)
+    _route_cache.move_to_end(key)
+    while len(_route_cache) > ROUTE_CACHE_SIZE:
+        _route_cache.popitem(last=False)
+
+async def _route_ambiguous(query: str) -> dict:
+    """
+    Search speculatively while a single fused call routes (and, for chat,
+    answers) the query
+    """
+    search_task = start_speculative_search(query)
+    try:
+        decision = await route_or_answer_async(query)
+    except BaseException:
+        search_task.cancel()
+        raise
+    if decision["route"] == "chat":
+        search_task.cancel()
+        return {
+            "type": "chat",
+            "reply": decision["reply"],
+            "sources": []
+        }
+    return await web_search_agent(query, await search_task)
+
+async def route_query(query: str) -> dict:
+    """
+    Main routing function - decides and executes query strategy
+    
+    Identical queries (ignoring case and whitespace) within ROUTE_CACHE_TTL
+    seconds reuse the previous answer instead of searching again.
+    """
+    use_cache = ROUTE_CACHE_SIZE > 0 and ROUTE_CACHE_TTL > 0
+    key = _route_cache_key(query)
+    if use_cache:
+        cached = _route_cache_get(key)
+        if cached is not None:
+            return cached
+    
+    local = classify_query_locally(query)
+    
+    # Route to appropriate agent
+    if local is True:
+        result = await web_search_agent(query)
+    elif local is False:
+        result = await chat_agent(query)
+    else:
+        result = await _route_ambiguous(query)
+    
+    # Don't pin failures in the cache
+    if use_cache and result.get("type") != "error":
+        _route_cache_set(key, result)
+    return result
\ No newline at end of file
@@ -0,0 +1,109 @@
+import asyncio
+import os
+import weakref
+from functools import lru_cache
+from dotenv import load_dotenv
+
+from .utils import new_async_http_client
+
+load_dotenv()
+
+# One AsyncOpenAI per event loop: its pooled httpx connections are bound to
+# the loop that opened them
+_async_clients = weakref.WeakKeyDictionary()
+
+@lru_cache(maxsize=1)
+def _client():
+    """OpenAI client, imported and built on first use"""
+    from openai import OpenAI
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+def openai_chat(
+    messages,
+    model="gpt-4o-mini",
+    temperature=0.2,
+    max_tokens=2048
+):
+    """Chat with OpenAI models"""
+    res = _client().chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+    return res.choices[0].message.content
+
+def openai_stream_chat(
+    messages,
+    model="gpt-4o-mini",
+    temperature=0.3,
+    max_tokens=2048
+):
+    """Streaming chat with OpenAI models"""
+    stream = _client().chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True
+    )
+    
+    for chunk in stream:
+        if chunk.choices[0].delta.content is not None:
+            yield chunk.choices[0].delta.content
+
+def _async_client():
+    """AsyncOpenAI on a shared keep-alive (HTTP/2 when available) pool"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        from openai import AsyncOpenAI
+        client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=new_async_http_client()
+        )
+        _async_clients[loop] = client
+    return client
+
+async def aclose():
+    """Close the running loop's AsyncOpenAI client and its connection pool"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+async def openai_chat_async(
+    messages,
+    model="gpt-4o-mini",
+    temperature=0.2,
+    max_tokens=2048,
+    response_format=None
+):
+    """Chat with OpenAI models without blocking the event loop"""
+    extra = {"response_format": response_format} if response_format else {}
+    res = await _async_client().chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        **extra
+    )
+    return res.choices[0].message.content
+
+async def openai_stream_chat_async(
+    messages,
+    model="gpt-4o-mini",
+    temperature=0.3,
+    max_tokens=2048
+):
+    """Async streaming chat with OpenAI models"""
+    stream = await _async_client().chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True
+    )
+    
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content is not None:
+            yield chunk.choices[0].delta.content
@@ -0,0 +1,113 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from .schemas import ChatRequest, ChatResponse
+from .agents import route_query, route_query_stream
+from .search import web_search, aclose as close_search_client
+from .llm import aclose as close_llm_client
+import json
+
+try:
+    import orjson  # noqa: F401  (required by ORJSONResponse)
+    _RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    _RESPONSE_CLASS = JSONResponse
+
+# Comma-separated list of allowed frontend origins, e.g.
+# CORS_ORIGINS=http://localhost:3000,https://app.example.com
+CORS_ORIGINS = [o.strip() for o in os.getenv("CORS_ORIGINS", "*").split(",") if o.strip()]
+
+app = FastAPI(
+    title="WebGPT Backend",
+    description="AI assistant with real-time web search using Tavily and OpenAI",
+    version="1.0.0",
+    default_response_class=_RESPONSE_CLASS
+)
+
+# CORS middleware for frontend access
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    # Browsers reject credentialed requests against a wildcard origin
+    allow_credentials="*" not in CORS_ORIGINS,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+@app.post("/chat", response_model=ChatResponse)
+async def chat(req: ChatRequest):
+    """
+    Main chat endpoint - routes query and returns response
+    """
+    result = await route_query(req.message)
+    return ChatResponse(**result)
+
+@app.post("/chat/stream")
+async def chat_stream(req: ChatRequest):
+    """
+    Streaming chat endpoint for real-time responses
+    """
+    async def generate():
+        # Route once (locally when possible, otherwise searching while the
+        # router decides), then relay the streaming agent's events
+        async for event in route_query_stream(req.message):
+            yield f"data: {json.dumps(event)}\n\n"
+        
+        yield "data: [DONE]\n\n"
+    
+    return StreamingResponse(generate(), media_type="text/event-stream")
+
+# Bounds asyncio.to_thread work (disk cache I/O) across concurrent requests
+DEFAULT_EXECUTOR_WORKERS = int(os.getenv("DEFAULT_EXECUTOR_WORKERS", "32"))
+
+@app.on_event("startup")
+async def _startup():
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=DEFAULT_EXECUTOR_WORKERS, thread_name_prefix="webgpt")
+    )
+
+@app.on_event("shutdown")
+async def _shutdown():
+    await close_search_client()
+    await close_llm_client()
+
+@app.get("/search")
+async def search(query: str, max_results: int = 5):
+    """
+    Direct search endpoint for testing
+    """
+    return await web_search(query, max_results)
+
+@app.get("/health")
+def health():
+    """Health check endpoint"""
+    return {
+        "status": "ok",
+        "service": "WebGPT",
+        "features": ["web_search", "chat", "streaming"]
+    }
+
+@app.get("/")
+def root():
+    """Root endpoint with API info"""
+    return {
+        "message": "WebGPT API",
+        "endpoints": {
+            "POST /chat": "Main chat endpoint",
+            "POST /chat/stream": "Streaming chat endpoint",
+            "GET /search": "Direct web search",
+            "GET /health": "Health check"
+        }
+    }
+
+if __name__ == "__main__":
+    import uvicorn
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", "8000")))
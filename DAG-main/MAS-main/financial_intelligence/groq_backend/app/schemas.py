@@ -1,17 +1,23 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 
 class ChatRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     message: str = Field(..., description="User's message/query")
     stream: bool = Field(default=False, description="Enable streaming response")
 
 class Source(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title: str
     url: str
     snippet: str
 
 class ChatResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: str = Field(..., description="Response type: chat, web_search, or error")
     reply: str = Field(..., description="AI generated response")
-    sources: List[Source] = Field(default=[], description="Web search sources")
-    quick_answer: Optional[str] = Field(default="", description="Quick answer from search")
\ No newline at end of file
+    sources: List[Source] = Field(default_factory=list, description="Web search sources")
+    quick_answer: Optional[str] = Field(default="", description="Quick answer from search")
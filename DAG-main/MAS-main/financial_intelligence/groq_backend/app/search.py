@@ -0,0 +1,276 @@
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from dotenv import load_dotenv
+
+from .utils import new_async_http_client
+
+try:
+    import diskcache
+except Exception:
+    diskcache = None
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# One AsyncTavilyClient per event loop, like the OpenAI clients in app.llm:
+# its HTTP connections belong to the loop that opened them
+_tavily_clients = weakref.WeakKeyDictionary()
+_tavily_http_clients = weakref.WeakKeyDictionary()
+
+class _BorrowedClient:
+    """Hands out a shared httpx client to `async with` without closing it"""
+
+    def __init__(self, http_client):
+        self._http_client = http_client
+
+    async def __aenter__(self):
+        return self._http_client
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+def _share_http_client(client):
+    """
+    Point the SDK at one pooled HTTP/2 client
+    
+    AsyncTavilyClient takes no http_client argument and opens a fresh httpx
+    client (and TLS connection) per call through _client_creator; swap that
+    for a pooled client with the same base URL, headers and timeout.
+    Returns (pooled client, template client to aclose) or None.
+    """
+    creator = getattr(client, "_client_creator", None)
+    if creator is None:
+        return None
+    template = creator()
+    http_client = new_async_http_client(
+        base_url=template.base_url,
+        headers=template.headers,
+        timeout=template.timeout
+    )
+    client._client_creator = lambda: _BorrowedClient(http_client)
+    return http_client, template
+
+async def _tavily_client():
+    """AsyncTavilyClient for the running loop, imported and built on first use"""
+    loop = asyncio.get_running_loop()
+    client = _tavily_clients.get(loop)
+    if client is None:
+        from tavily import AsyncTavilyClient
+        client = AsyncTavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
+        _tavily_clients[loop] = client
+        shared = _share_http_client(client)
+        if shared is not None:
+            _tavily_http_clients[loop], template = shared
+            # The template only supplied settings; it never sent a request
+            await template.aclose()
+    return client
+
+async def aclose():
+    """Close the running loop's Tavily client (call from app shutdown)"""
+    loop = asyncio.get_running_loop()
+    client = _tavily_clients.pop(loop, None)
+    close = getattr(client, "close", None) or getattr(client, "aclose", None)
+    if close is not None:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    http_client = _tavily_http_clients.pop(loop, None)
+    if http_client is not None:
+        await http_client.aclose()
+
+# Identical searches within SEARCH_CACHE_TTL seconds are served from memory
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1024"))
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "900"))
+
+_search_cache = OrderedDict()  # key -> (expires_at, response)
+_inflight = {}  # key -> Task fetching that key
+
+# "basic" search is cheaper and returns less; callers doing research-grade
+# lookups ask for "advanced" explicitly
+SEARCH_DEPTH = os.getenv("TAVILY_SEARCH_DEPTH", "basic")
+# The only result fields the prompt builders and source lists read
+RESULT_FIELDS = ("title", "url", "content")
+
+def _search_cache_key(query: str, max_results: int, depth: str, include_answer: bool) -> bytes:
+    return hashlib.blake2b(
+        f"{query}|{max_results}|{depth}|{include_answer}".encode("utf-8"), digest_size=16
+    ).digest()
+
+def _search_cache_get(key: bytes):
+    entry = _search_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if time.monotonic() > expires_at:
+        _search_cache.pop(key, None)
+        return None
+    _search_cache.move_to_end(key)
+    return response
+
+def _search_cache_set(key: bytes, response: dict) -> None:
+    _search_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL, response)
+    _search_cache.move_to_end(key)
+    while len(_search_cache) > SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+
+# Second tier: results survive restarts, so repeat research sessions skip Tavily
+TAVILY_CACHE_DIR = os.getenv("TAVILY_CACHE_DIR", ".cache/tavily")
+TAVILY_CACHE_SIZE_LIMIT = 2 ** 30
+
+class _SearchDiskCache:
+    """TTL disk cache of Tavily responses (diskcache if installed, else JSON files)"""
+
+    def __init__(self, root=TAVILY_CACHE_DIR, ttl=SEARCH_CACHE_TTL):
+        self.root = Path(root)
+        self.ttl = ttl
+        self._cache = (
+            diskcache.Cache(str(self.root), size_limit=TAVILY_CACHE_SIZE_LIMIT)
+            if diskcache is not None else None
+        )
+
+    @staticmethod
+    def make_key(query: str, max_results: int, depth: str = "advanced", include_answer: bool = True) -> str:
+        payload = {"q": query, "n": max_results, "depth": depth}
+        if not include_answer:
+            payload["answer"] = False
+        payload = json.dumps(payload, sort_keys=True)
+        return hashlib.md5(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str):
+        if self._cache is not None:
+            return self._cache.get(key)
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("ts", 0) > entry.get("ttl", 0):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: dict) -> None:
+        if self._cache is not None:
+            self._cache.set(key, value, expire=self.ttl)
+            return
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"ts": time.time(), "ttl": self.ttl, "value": value}, f)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not cache search results: %s", e)
+
+_disk_cache = _SearchDiskCache()
+
+def cache_clear() -> None:
+    """Drop the in-memory search cache (the disk tier is left alone)"""
+    _search_cache.clear()
+
+async def web_search(query: str, max_results: int = 5, *, depth: str = None, include_answer: bool = True):
+    """
+    Perform web search using Tavily API without blocking the event loop
+    Returns structured search results with content
+    
+    `depth` defaults to SEARCH_DEPTH; results keep only RESULT_FIELDS.
+    Results are cached for SEARCH_CACHE_TTL seconds in memory and on disk
+    (TAVILY_CACHE_DIR), and concurrent identical searches on the same loop
+    share one upstream call.
+    """
+    params = (query, max_results, depth or SEARCH_DEPTH, include_answer)
+    if SEARCH_CACHE_SIZE <= 0 or SEARCH_CACHE_TTL <= 0:
+        return await _fetch_search(*params)
+    
+    key = _search_cache_key(*params)
+    cached = _search_cache_get(key)
+    if cached is not None:
+        return dict(cached)
+    
+    task = _inflight.get(key)
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(_fetch_and_cache(key, params))
+        _inflight[key] = task
+    # Shield so one cancelled waiter doesn't cancel the fetch for the others
+    return dict(await asyncio.shield(task))
+
+web_search.cache_clear = cache_clear
+
+async def _fetch_and_cache(key: bytes, params: tuple) -> dict:
+    try:
+        disk_key = _SearchDiskCache.make_key(*params)
+        response = await asyncio.to_thread(_disk_cache.get, disk_key)
+        if response is not None:
+            _search_cache_set(key, response)
+            return response
+        
+        response = await _fetch_search(*params)
+        # Don't pin failures in the cache
+        if not response.get("error"):
+            _search_cache_set(key, response)
+            await asyncio.to_thread(_disk_cache.set, disk_key, response)
+        return response
+    finally:
+        if _inflight.get(key) is asyncio.current_task():
+            del _inflight[key]
+
+async def _fetch_search(query: str, max_results: int, depth: str, include_answer: bool) -> dict:
+    try:
+        client = await _tavily_client()
+        response = await client.search(
+            query=query,
+            max_results=max_results,
+            search_depth=depth,
+            include_answer=include_answer,
+            include_images=False
+        )
+        
+        # Drop scores, raw content etc. so cached entries stay small
+        return {
+            "answer": response.get("answer") or "",
+            "results": [
+                {k: r[k] for k in RESULT_FIELDS if k in r}
+                for r in response.get("results", [])
+            ],
+            "query": query
+        }
+    except Exception as e:
+        return {
+            "error": str(e),
+            "answer": "",
+            "results": [],
+            "query": query
+        }
+
+def format_search_context(search_results: dict) -> str:
+    """Format search results into context for LLM"""
+    answer = search_results.get("answer")
+    results = search_results.get("results") or ()
+    
+    # Quick answer (if available), header, then one block per result
+    header = f"Quick Answer: {answer}\n\nSearch Results:\n" if answer else "Search Results:\n"
+    if not results:
+        return header
+    return header + "\n" + "\n".join(
+        f"\n[{idx}] {result.get('title', 'No title')}\n"
+        f"URL: {result.get('url', 'N/A')}\n"
+        f"Content: {result.get('content', 'No content')}\n"
+        for idx, result in enumerate(results, 1)
+    )
\ No newline at end of file
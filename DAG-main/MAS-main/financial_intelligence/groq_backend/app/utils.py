@@ -0,0 +1,23 @@
+try:
+    import h2  # noqa: F401  (httpx needs h2 for HTTP/2)
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+def confidence_score(text: str) -> float:
+    return min(len(text) / 1000, 1.0)
+
+def new_async_http_client(**kwargs):
+    """
+    httpx.AsyncClient with the backend's shared pool settings
+    
+    HTTP/2 (when h2 is installed) lets concurrent requests to one API share a
+    single TLS connection. Create one per event loop and reuse it.
+    """
+    import httpx
+    kwargs.setdefault("timeout", httpx.Timeout(30.0, connect=5.0))
+    return httpx.AsyncClient(
+        http2=HTTP2,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        **kwargs
+    )
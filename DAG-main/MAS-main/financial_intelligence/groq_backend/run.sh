@@ -37,4 +37,5 @@ pip install -r requirements.txt
 echo "✨ Starting FastAPI server on http://localhost:8000"
 echo "📚 API docs available at http://localhost:8000/docs"
 echo ""
-uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
\ No newline at end of file
+# --loop auto picks uvloop when it is installed
+uvicorn app.main:app --host 0.0.0.0 --port 8000 --loop auto --reload
\ No newline at end of file
@@ -1,29 +1,56 @@
 """
 Groq-based Fallback System for Financial Intelligence
 
-Integrates the groq-backend WebGPT functionality as a replacement for OpenAI fallback.
+Integrates the groq_backend WebGPT functionality as a replacement for OpenAI fallback.
 Provides web search and synthesis capabilities using Groq models and Tavily search.
 """
 import json
+import logging
 import os
+import re
+import time
 import asyncio
+import importlib
+import threading
+import weakref
+from functools import cached_property, lru_cache
+from types import SimpleNamespace
 from typing import Dict, Any, Optional, List
 from datetime import datetime
-import sys
-from pathlib import Path
 
-# Add groq-backend to path to import its modules
-groq_backend_path = Path(__file__).parent / "groq-backend"
-sys.path.insert(0, str(groq_backend_path))
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+logger = logging.getLogger(__name__)
+
+# groq_backend is a subpackage; resolve it relative to this module so it
+# works both as financial_intelligence.groq_fallback and as a top-level import
+_BACKEND_PACKAGE = f"{__package__}.groq_backend" if __package__ else "groq_backend"
 
-try:
-    from app.agents import route_query, needs_web_search
-    from app.search import web_search, format_search_context
-    from app.llm import openai_chat
-    GROQ_BACKEND_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: groq-backend modules not available: {e}")
-    GROQ_BACKEND_AVAILABLE = False
+
+@lru_cache(maxsize=1)
+def _load_backend() -> Optional[SimpleNamespace]:
+    """
+    Import the groq_backend modules on first use
+    
+    Keeps the backend's SDK imports out of module import; returns None when
+    the modules can't be imported.
+    """
+    try:
+        agents = importlib.import_module(f"{_BACKEND_PACKAGE}.app.agents")
+        search = importlib.import_module(f"{_BACKEND_PACKAGE}.app.search")
+        llm = importlib.import_module(f"{_BACKEND_PACKAGE}.app.llm")
+    except ImportError as e:
+        logger.warning("groq_backend modules not available: %s", e)
+        return None
+    return SimpleNamespace(
+        route_query=agents.route_query,
+        route_query_stream=agents.route_query_stream,
+        needs_web_search_async=agents.needs_web_search_async,
+        web_search_agent=agents.web_search_agent,
+        web_search=search.web_search,
+        close_search_client=search.aclose,
+        close_llm_client=llm.aclose,
+    )
 
 try:
     from config import GROQ_API_KEY, TAVILY_API_KEY
@@ -31,30 +58,253 @@ except ImportError:
     GROQ_API_KEY = os.getenv("GROQ_API_KEY")
     TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 
+# Sub-question fan-out: at most this many searches per query, and this many
+# Tavily calls in flight per event loop
+MAX_SUB_QUERIES = 4
+MAX_CONCURRENT_SEARCHES = int(os.getenv("MAX_CONCURRENT_SEARCHES", "8"))
+
+_SUB_QUERY_SPLIT_RE = re.compile(r"[?;\n]+")
+
+# Concurrent HybridFallback requests allowed per event loop
+FALLBACK_MAX_CONCURRENCY = int(os.getenv("FALLBACK_MAX_CONCURRENCY", "16"))
+
+# Semaphores are per loop: fallbacks run under separate asyncio.run loops
+_search_semaphores = weakref.WeakKeyDictionary()
+
+
+def _loop_semaphore(registry: "weakref.WeakKeyDictionary", size: int) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = registry.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(size)
+        registry[loop] = semaphore
+    return semaphore
+
+
+def _search_semaphore() -> asyncio.Semaphore:
+    return _loop_semaphore(_search_semaphores, MAX_CONCURRENT_SEARCHES)
+
+
+def _decompose_query(query: str) -> List[str]:
+    """Split a multi-part question into its sub-questions (max MAX_SUB_QUERIES)"""
+    parts = [p.strip() for p in _SUB_QUERY_SPLIT_RE.split(query)]
+    parts = [p for p in parts if len(p.split()) >= 3]
+    return parts[:MAX_SUB_QUERIES] if len(parts) > 1 else [query]
+
+
+async def _limited_search(query: str) -> Dict[str, Any]:
+    async with _search_semaphore():
+        # Sub-questions of a multi-part research query get the deeper search
+        return await _load_backend().web_search(query, depth="advanced")
+
+
+async def _multi_search(queries: List[str]) -> Dict[str, Any]:
+    """Search all sub-queries concurrently and merge results, deduplicated by URL"""
+    responses = await asyncio.gather(
+        *[_limited_search(q) for q in queries],
+        return_exceptions=True
+    )
+    
+    answers = []
+    results = []
+    seen_urls = set()
+    errors = []
+    for response in responses:
+        if isinstance(response, Exception):
+            errors.append(str(response))
+            continue
+        if response.get("error"):
+            errors.append(response["error"])
+        if response.get("answer"):
+            answers.append(response["answer"])
+        for result in response.get("results", []):
+            url = result.get("url")
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+            results.append(result)
+    
+    merged = {"answer": "\n".join(answers), "results": results, "query": " | ".join(queries)}
+    # Only an error when every sub-search failed
+    if errors and not results:
+        merged["error"] = "; ".join(errors)
+    return merged
+
+
+def _source_urls(sources: List[Any]) -> List[str]:
+    """URLs of source dicts / plain URL strings, skipping empty ones"""
+    return [
+        url for url in (
+            source.get("url") if isinstance(source, dict) else source
+            for source in sources
+        )
+        if url and isinstance(url, str)
+    ]
+
+
+# Static error payloads; callers shallow-copy and stamp a timestamp
+_UNAVAILABLE_TEMPLATE = {
+    "status": "error",
+    "message": "Groq fallback not available - missing dependencies or API keys",
+    "response": None,
+    "references": [],
+    "model": "groq-unavailable",
+    "searches_performed": 0,
+    "tokens_used": "N/A",
+    "finish_reason": "unavailable",
+    "fallback_system": "groq"
+}
+
+_ALL_FAILED_TEMPLATE = {
+    "status": "error",
+    "message": "Both Groq and OpenAI fallbacks failed",
+    "response": None,
+    "references": [],
+    "model": "none",
+    "searches_performed": 0,
+    "tokens_used": "N/A",
+    "finish_reason": "failed",
+    "fallback_system": "none"
+}
+
+
+_CIRCUIT_OPEN_TEMPLATE = {
+    "status": "error",
+    "message": "Groq fallback temporarily disabled after repeated failures",
+    "response": None,
+    "references": [],
+    "model": "groq-unavailable",
+    "searches_performed": 0,
+    "tokens_used": "N/A",
+    "finish_reason": "circuit_open",
+    "fallback_system": "groq"
+}
+
+
+def _error_response(template: Dict[str, Any]) -> Dict[str, Any]:
+    response = template.copy()
+    # Fresh list: a shallow copy would share the template's references list
+    response["references"] = []
+    response["timestamp"] = datetime.now().isoformat()
+    return response
+
+
+# Transient provider errors are retried with jittered exponential backoff;
+# after BREAKER_FAILURE_THRESHOLD failed calls in a row Groq is skipped for
+# BREAKER_COOLDOWN_SECONDS
+FALLBACK_RETRY_ATTEMPTS = int(os.getenv("FALLBACK_RETRY_ATTEMPTS", "3"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "3"))
+BREAKER_COOLDOWN_SECONDS = float(os.getenv("BREAKER_COOLDOWN_SECONDS", "30"))
+
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+# httpx transport errors and the OpenAI SDK's connection/timeout errors
+_RETRYABLE_ERROR_NAMES = frozenset({
+    "TransportError", "TimeoutException", "ConnectError", "ReadTimeout",
+    "RemoteProtocolError", "APIConnectionError", "APITimeoutError",
+})
+
+
+class SearchFailedError(Exception):
+    """
+    Backend search failure
+    
+    groq_backend catches Tavily errors and answers with a {"type": "error"}
+    payload; this turns that back into an exception so it is retried and
+    counted by the circuit breaker. The payload drops the status code, so
+    every search failure is treated as transient.
+    """
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """True for rate limits, 5xx responses, dropped connections and search failures"""
+    if isinstance(exc, SearchFailedError):
+        return True
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status in _RETRYABLE_STATUS_CODES
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    return any(cls.__name__ in _RETRYABLE_ERROR_NAMES for cls in type(exc).__mro__)
+
 
 class GroqFallback:
     """
-    Groq-based fallback system using groq-backend components
+    Groq-based fallback system using groq_backend components
     """
     
     def __init__(self):
         self.api_key = GROQ_API_KEY
         self.tavily_key = TAVILY_API_KEY
-        self.available = GROQ_BACKEND_AVAILABLE and self.api_key and self.tavily_key
+        self.backend = _load_backend()
+        self.available = self.backend is not None and self.api_key and self.tavily_key
+        # Circuit breaker state, shared by every loop using this handler
+        self._breaker = {"fail_count": 0, "open_until": 0.0}
+        self._breaker_lock = threading.Lock()
+        # query -> Task answering it; concurrent identical queries share one
+        self._inflight: Dict[str, asyncio.Task] = {}
         
         if not self.available:
             missing = []
-            if not GROQ_BACKEND_AVAILABLE:
-                missing.append("groq-backend modules")
+            if self.backend is None:
+                missing.append("groq_backend modules")
             if not self.api_key:
                 missing.append("GROQ_API_KEY")
             if not self.tavily_key:
                 missing.append("TAVILY_API_KEY")
-            print(f"⚠️ Groq fallback unavailable: missing {', '.join(missing)}")
+            logger.warning("⚠️ Groq fallback unavailable: missing %s", ", ".join(missing))
     
     def is_available(self) -> bool:
-        """Check if Groq fallback is available"""
-        return self.available
+        """Check if Groq fallback is available (and its circuit isn't open)"""
+        return bool(self.available) and not self._circuit_open()
+    
+    def _circuit_open(self) -> bool:
+        return time.monotonic() < self._breaker["open_until"]
+    
+    def _record_success(self):
+        with self._breaker_lock:
+            self._breaker["fail_count"] = 0
+            self._breaker["open_until"] = 0.0
+    
+    def _record_failure(self):
+        with self._breaker_lock:
+            self._breaker["fail_count"] += 1
+            if self._breaker["fail_count"] >= BREAKER_FAILURE_THRESHOLD:
+                self._breaker["open_until"] = time.monotonic() + BREAKER_COOLDOWN_SECONDS
+                self._breaker["fail_count"] = 0
+                logger.warning("⚠️ Groq fallback circuit open for %.0fs", BREAKER_COOLDOWN_SECONDS)
+    
+    async def _run_query(self, query: str):
+        """Answer `query` through the backend; returns (result, searches_performed)"""
+        sub_queries = _decompose_query(query)
+        
+        if len(sub_queries) > 1 and await self.backend.needs_web_search_async(query):
+            # Multi-part question: search every part concurrently, then
+            # answer once from the merged results
+            logger.info("🔀 Searching %d sub-queries in parallel", len(sub_queries))
+            search_results = await _multi_search(sub_queries)
+            result = await self.backend.web_search_agent(query, search_results)
+            searches_performed = len(sub_queries)
+        else:
+            # Use groq_backend's route_query function
+            result = await self.backend.route_query(query)
+            searches_performed = None
+        
+        if result.get("type") == "error":
+            raise SearchFailedError(result.get("reply") or "Search failed")
+        return result, searches_performed
+    
+    async def close(self):
+        """
+        Close the running loop's pooled Tavily and OpenAI clients
+        
+        Clients are created lazily per event loop by groq_backend and reused by
+        every call on that loop; call this before the loop shuts down.
+        """
+        if self.backend is not None:
+            await self.backend.close_search_client()
+            await self.backend.close_llm_client()
     
     async def get_fallback_response(self, query: str, worker_results: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -66,30 +316,45 @@ class GroqFallback:
             
         Returns:
             Dict with response metadata and content
+        
+        Concurrent calls for the same query on one event loop share a single
+        backend round-trip; each caller gets its own copy of the result.
         """
         if not self.available:
-            return {
-                "status": "error",
-                "message": "Groq fallback not available - missing dependencies or API keys",
-                "response": None,
-                "references": [],
-                "model": "groq-unavailable",
-                "searches_performed": 0,
-                "tokens_used": "N/A",
-                "finish_reason": "unavailable",
-                "timestamp": datetime.now().isoformat()
-            }
+            return _error_response(_UNAVAILABLE_TEMPLATE)
+        if self._circuit_open():
+            return _error_response(_CIRCUIT_OPEN_TEMPLATE)
         
-        start_time = datetime.now()
+        task = self._inflight.get(query)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._answer(query))
+            self._inflight[query] = task
+            task.add_done_callback(lambda t: self._forget(query, t))
+        # Shield so one cancelled caller doesn't cancel the answer for the others
+        return dict(await asyncio.shield(task))
+    
+    def _forget(self, query: str, task: asyncio.Task):
+        if self._inflight.get(query) is task:
+            del self._inflight[query]
+    
+    async def _answer(self, query: str) -> Dict[str, Any]:
+        start_time = time.monotonic()
         
         try:
-            print(f"\n🚀 Groq Fallback: Processing query...")
-            print(f"   Query: {query[:100]}...")
+            logger.info("🚀 Groq Fallback: Processing query...")
+            logger.debug("Query: %.100s", query)
             
-            # Use groq-backend's route_query function
-            result = route_query(query)
+            async for attempt in AsyncRetrying(
+                wait=wait_random_exponential(multiplier=0.2, max=4),
+                stop=stop_after_attempt(FALLBACK_RETRY_ATTEMPTS),
+                retry=retry_if_exception(_is_retryable),
+                reraise=True,
+            ):
+                with attempt:
+                    result, searches_performed = await self._run_query(query)
+            self._record_success()
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.monotonic() - start_time
             
             # Extract response and sources
             reply = result.get("reply", "")
@@ -97,15 +362,12 @@ class GroqFallback:
             query_type = result.get("type", "unknown")
             
             # Format sources for consistency
-            formatted_sources = []
-            for source in sources:
-                if isinstance(source, dict):
-                    formatted_sources.append(source.get("url", ""))
-                elif isinstance(source, str):
-                    formatted_sources.append(source)
+            formatted_sources = _source_urls(sources)
             
-            print(f"   ✅ Groq fallback completed in {execution_time:.1f}s")
-            print(f"   Type: {query_type}, Sources: {len(formatted_sources)}")
+            logger.info(
+                "✅ Groq fallback completed in %.1fs (type: %s, sources: %d)",
+                execution_time, query_type, len(formatted_sources)
+            )
             
             return {
                 "status": "success",
@@ -113,7 +375,7 @@ class GroqFallback:
                 "references": formatted_sources,
                 "model": "groq-webgpt",
                 "data_source": "tavily_search",
-                "searches_performed": 1 if query_type == "web_search" else 0,
+                "searches_performed": searches_performed or (1 if query_type == "web_search" else 0),
                 "tokens_used": "N/A",  # Groq doesn't provide token usage in this implementation
                 "finish_reason": "stop",
                 "execution_time_seconds": round(execution_time, 2),
@@ -123,8 +385,9 @@ class GroqFallback:
             }
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
-            print(f"   ❌ Groq fallback failed: {e}")
+            self._record_failure()
+            execution_time = time.monotonic() - start_time
+            logger.error("❌ Groq fallback failed: %s", e)
             
             return {
                 "status": "error",
@@ -140,6 +403,57 @@ class GroqFallback:
                 "fallback_system": "groq"
             }
     
+    async def stream_fallback_response(self, query: str):
+        """
+        Stream the fallback answer as it is generated
+        
+        Yields {"type": "content", "content": str} events as tokens arrive,
+        then one {"type": "done", ...} event carrying the full response and
+        references. Failures yield a single {"type": "error", ...} event.
+        """
+        if not self.available:
+            yield {"type": "error", "message": "Groq fallback not available - missing dependencies or API keys"}
+            return
+        if self._circuit_open():
+            yield {"type": "error", "message": _CIRCUIT_OPEN_TEMPLATE["message"]}
+            return
+        
+        # Streams aren't retried (tokens may already be out), but they still
+        # count towards the circuit breaker
+        start_time = time.monotonic()
+        chunks = []
+        references = []
+        query_type = "chat"
+        
+        try:
+            async for event in self.backend.route_query_stream(query):
+                if event["type"] == "content":
+                    chunks.append(event["content"])
+                    yield event
+                elif event["type"] == "sources":
+                    query_type = "web_search"
+                    references = _source_urls(event["sources"])
+                elif event["type"] == "error":
+                    self._record_failure()
+                    yield {"type": "error", "message": event.get("error", "Unknown error")}
+                    return
+        except Exception as e:
+            self._record_failure()
+            logger.error("❌ Groq fallback stream failed: %s", e)
+            yield {"type": "error", "message": str(e)}
+            return
+        
+        self._record_success()
+        yield {
+            "type": "done",
+            "response": "".join(chunks),
+            "references": references,
+            "query_type": query_type,
+            "searches_performed": 1 if query_type == "web_search" else 0,
+            "execution_time_seconds": round(time.monotonic() - start_time, 2),
+            "fallback_system": "groq"
+        }
+    
     async def answer_query(self, query: str, worker_results: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Alias for get_fallback_response for compatibility with existing interface
@@ -153,15 +467,22 @@ class HybridFallback:
     """
     
     def __init__(self):
-        self.groq_fallback = GroqFallback()
-        
-        # Import OpenAI fallback as backup
+        self.groq_fallback = get_groq_fallback_handler()
+        self._semaphores = weakref.WeakKeyDictionary()
+    
+    @cached_property
+    def openai_fallback(self):
+        """OpenAI backup, built only once Groq can't answer"""
         try:
             from openai_fallback import OpenAIFallback
-            self.openai_fallback = OpenAIFallback()
+            return OpenAIFallback()
         except ImportError:
-            self.openai_fallback = None
-            print("⚠️ OpenAI fallback not available as backup")
+            logger.warning("⚠️ OpenAI fallback not available as backup")
+            return None
+    
+    async def close(self):
+        """Close the shared clients of the running loop"""
+        await self.groq_fallback.close()
     
     def is_available(self) -> bool:
         """Check if any fallback system is available"""
@@ -172,7 +493,18 @@ class HybridFallback:
     async def get_fallback_response(self, query: str, worker_results: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Try Groq first, fall back to OpenAI if Groq fails
+        
+        At most FALLBACK_MAX_CONCURRENCY requests run at once per event loop;
+        each finished request frees its slot for the next waiting one.
         """
+        async with _loop_semaphore(self._semaphores, FALLBACK_MAX_CONCURRENCY):
+            return await self._get_fallback_response(query, worker_results)
+    
+    async def gather_responses(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """Answer many queries concurrently through the sliding window"""
+        return await asyncio.gather(*(self.get_fallback_response(q) for q in queries))
+    
+    async def _get_fallback_response(self, query: str, worker_results: Optional[Dict] = None) -> Dict[str, Any]:
         # Try Groq first
         if self.groq_fallback.is_available():
             try:
@@ -181,36 +513,25 @@ class HybridFallback:
                     result["fallback_system"] = "groq_primary"
                     return result
                 else:
-                    print(f"⚠️ Groq fallback failed: {result.get('message')}")
+                    logger.warning("⚠️ Groq fallback failed: %s", result.get("message"))
             except Exception as e:
-                print(f"⚠️ Groq fallback exception: {e}")
+                logger.warning("⚠️ Groq fallback exception: %s", e)
         
         # Fall back to OpenAI
         if self.openai_fallback and self.openai_fallback.is_available():
-            print("🔄 Falling back to OpenAI...")
+            logger.info("🔄 Falling back to OpenAI...")
             try:
                 result = await self.openai_fallback.get_fallback_response(query, worker_results)
                 if result.get("status") == "success":
                     result["fallback_system"] = "openai_backup"
                     return result
                 else:
-                    print(f"⚠️ OpenAI fallback failed: {result.get('message')}")
+                    logger.warning("⚠️ OpenAI fallback failed: %s", result.get("message"))
             except Exception as e:
-                print(f"⚠️ OpenAI fallback exception: {e}")
+                logger.warning("⚠️ OpenAI fallback exception: %s", e)
         
         # Both failed
-        return {
-            "status": "error",
-            "message": "Both Groq and OpenAI fallbacks failed",
-            "response": None,
-            "references": [],
-            "model": "none",
-            "searches_performed": 0,
-            "tokens_used": "N/A",
-            "finish_reason": "failed",
-            "timestamp": datetime.now().isoformat(),
-            "fallback_system": "none"
-        }
+        return _error_response(_ALL_FAILED_TEMPLATE)
     
     async def answer_query(self, query: str, worker_results: Optional[Dict] = None) -> Dict[str, Any]:
         """Alias for get_fallback_response"""
@@ -223,31 +544,62 @@ class HybridFallback:
 
 _groq_handler = None
 _hybrid_handler = None
+# Agents build orchestrators from several threads; the lock keeps exactly one
+# handler (and one set of client pools) per process
+_handler_lock = threading.RLock()
 
 def get_groq_fallback_handler():
     """Get Groq fallback handler instance"""
     global _groq_handler
     if _groq_handler is None:
-        _groq_handler = GroqFallback()
+        with _handler_lock:
+            if _groq_handler is None:
+                _groq_handler = GroqFallback()
     return _groq_handler
 
 def get_hybrid_fallback_handler():
     """Get hybrid fallback handler instance"""
     global _hybrid_handler
     if _hybrid_handler is None:
-        _hybrid_handler = HybridFallback()
+        with _handler_lock:
+            if _hybrid_handler is None:
+                _hybrid_handler = HybridFallback()
     return _hybrid_handler
 
 def should_trigger_fallback(confidence: float, threshold: float = 0.7) -> bool:
     """Check if fallback should be triggered based on confidence"""
     return confidence < threshold
 
+LOW_WORKER_CONFIDENCE = 0.5
+# Worker counts at or above this are scanned with numpy when it's installed
+VECTORIZE_MIN_WORKERS = 64
+
+
+@lru_cache(maxsize=1)
+def _numpy():
+    """numpy, imported on first large scan; None when not installed"""
+    try:
+        import numpy
+    except Exception:
+        return None
+    return numpy
+
+
+def _low_confidence_workers(worker_confs: dict) -> List[str]:
+    np = _numpy() if len(worker_confs) >= VECTORIZE_MIN_WORKERS else None
+    if np is None:
+        return [n for n, c in worker_confs.items() if c < LOW_WORKER_CONFIDENCE]
+    confs = np.fromiter(worker_confs.values(), dtype=np.float64, count=len(worker_confs))
+    names = list(worker_confs)
+    return [names[i] for i in np.flatnonzero(confs < LOW_WORKER_CONFIDENCE)]
+
+
 def get_fallback_trigger_reason(confidence: float, worker_confs: dict, threshold: float = 0.7) -> str:
     """Get reason for fallback trigger"""
     reasons = []
     if confidence < threshold:
         reasons.append(f"Confidence {confidence:.2f} < {threshold}")
-    low = [n for n, c in worker_confs.items() if c < 0.5]
+    low = _low_confidence_workers(worker_confs)
     if low:
         reasons.append(f"Low: {', '.join(low)}")
     return " | ".join(reasons) or "Unknown"
@@ -264,7 +616,7 @@ class GroqFallbackWrapper:
     """
     
     def __init__(self):
-        self.groq = GroqFallback()
+        self.groq = get_groq_fallback_handler()
     
     def is_available(self) -> bool:
         return self.groq.is_available()
@@ -8,27 +8,209 @@ Key fixes:
 4. Fixed region mismatch penalties
 """
 
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Union
 from datetime import datetime
+import math
 import re
+from bisect import bisect_right
+from types import MappingProxyType
+
+from financial_intelligence.core.dag_context import WorkerResult
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+
+# Query hints, matched as whole words; each group is compiled into one
+# alternation regex so a query is scanned once per group
+HISTORICAL_TOKENS = frozenset({
+    "2020", "2021", "2022", "2023", "2024", "2025",
+    "during", "historical", "historically", "comparison", "vs", "versus",
+    "compare", "compared", "comparing", "between"
+})
+HISTORICAL_PHRASES = ("over time",)
+# Fiscal years and quarters written with the year attached ("fy2023",
+# "q3fy24", "q3 2023"), which whole-word year tokens don't see
+HISTORICAL_PATTERNS = (r"(?:q[1-4]\s?)?fy\s?(?:20)?\d{2}", r"q[1-4]\s?(?:20)?\d{2}")
+
+US_TOKENS = frozenset({"us", "fed", "dollar", "dollars"})
+US_PHRASES = ("federal reserve",)
+
+IN_TOKENS = frozenset({"india", "indian", "rbi", "rupee", "rupees", "inr"})
+
+
+def _hint_pattern(tokens: frozenset, phrases: tuple = (), patterns: tuple = ()) -> "re.Pattern":
+    # Longest first so a phrase wins over a word it starts with; raw
+    # patterns go last
+    hints = sorted(set(tokens).union(phrases), key=lambda h: (-len(h), h))
+    alternatives = [re.escape(h) for h in hints] + list(patterns)
+    return re.compile(r"\b(?:%s)\b" % "|".join(alternatives))
+
+
+_HIST_RE = _hint_pattern(HISTORICAL_TOKENS, HISTORICAL_PHRASES, HISTORICAL_PATTERNS)
+_US_RE = _hint_pattern(US_TOKENS, US_PHRASES)
+_IN_RE = _hint_pattern(IN_TOKENS)
+
+
+# Fundamentals completeness tiers and each tier's weight in a company's score
+TIER1_METRICS = ("market_cap", "price", "pe_ratio")
+TIER2_METRICS = ("roe", "roce", "pb_ratio", "book_value")
+TIER3_METRICS = ("dividend_yield", "debt_to_equity", "revenue", "profit", "eps")
+FUNDAMENTAL_METRICS = TIER1_METRICS + TIER2_METRICS + TIER3_METRICS
+_T1_LEN = len(TIER1_METRICS)
+_T2_LEN = len(TIER2_METRICS)
+_T3_LEN = len(TIER3_METRICS)
+
+# Company counts at or above this are scored with numpy when it's installed
+FUNDAMENTALS_VECTORIZE_MIN = 16
+
+# Company completeness score bands: labels for the per-company reason, and
+# the (start, base quality, slope) piece of the fundamentals quality mapping
+_COMPANY_SCORE_BREAKS = (0.30, 0.50, 0.75)
+_COMPANY_SCORE_LABELS = ("poor", "acceptable", "good", "excellent")
+_QUALITY_PIECES = (
+    (0.0, 0.30, 1.0),
+    (0.30, 0.55, 0.75),
+    (0.50, 0.70, 0.6),
+    (0.75, 0.85, 0.4),
+)
+
+_ASSESSMENT_LABELS = ("VERY_LOW", "LOW", "ACCEPTABLE", "HIGH")
+
+# metric -> tier index, for counting all three tiers in one pass
+_METRIC_TIER = {
+    metric: tier
+    for tier, metrics in enumerate((TIER1_METRICS, TIER2_METRICS, TIER3_METRICS))
+    for metric in metrics
+}
+
+# Column offsets of each tier in the (companies x FUNDAMENTAL_METRICS) mask
+_TIER_OFFSETS = (0, _T1_LEN, _T1_LEN + _T2_LEN)
+
+
+def _tier_score(tier1_count, tier2_count, tier3_count):
+    """Weighted tier completeness; works on ints or numpy count columns"""
+    # Divide rather than multiply by a hoisted 1/len: 3 * (1/5) != 3 / 5
+    # in floating point, which could shift a score across a band edge
+    tier1_complete = tier1_count / _T1_LEN
+    tier2_complete = tier2_count / _T2_LEN
+    tier3_complete = tier3_count / _T3_LEN
+    return (0.50 * tier1_complete) + (0.35 * tier2_complete) + (0.15 * tier3_complete)
+
+
+_TIER1_END = _TIER_OFFSETS[1]
+_TIER2_END = _TIER_OFFSETS[2]
+_TIER3_END = len(FUNDAMENTAL_METRICS)
+
+
+def _tier_kernel(mask):
+    """Scores and available counts for a (companies x metrics) int presence mask"""
+    n = mask.shape[0]
+    scores = np.empty(n, dtype=np.float64)
+    totals = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        tier1_count = 0
+        tier2_count = 0
+        tier3_count = 0
+        for j in range(_TIER1_END):
+            tier1_count += mask[i, j]
+        for j in range(_TIER1_END, _TIER2_END):
+            tier2_count += mask[i, j]
+        for j in range(_TIER2_END, _TIER3_END):
+            tier3_count += mask[i, j]
+        scores[i] = _tier_score_jit(tier1_count, tier2_count, tier3_count)
+        totals[i] = tier1_count + tier2_count + tier3_count
+    return scores, totals
+
+
+# The kernel gets its own compiled copy of _tier_score; the small-input
+# Python loop keeps calling the plain function without JIT dispatch
+_tier_score_jit = _tier_score
+
+# numba-compiled _tier_kernel, built on the first vectorized call so that
+# importing the verifier doesn't load numba; False once numba is known missing
+_tier_kernel_jit = None
+
+
+def _compiled_tier_kernel():
+    """Return the JIT-compiled kernel, or None when numba isn't installed"""
+    global _tier_kernel_jit, _tier_score_jit
+    if _tier_kernel_jit is None:
+        try:
+            import numba
+        except Exception:
+            _tier_kernel_jit = False
+        else:
+            # No fastmath: reassociating the sums could move scores across the
+            # 0.75/0.50/0.30 boundaries
+            _tier_score_jit = numba.njit(cache=True)(_tier_score)
+            _tier_kernel_jit = numba.njit(cache=True)(_tier_kernel)
+    return _tier_kernel_jit or None
+
+
+def _score_companies(companies: List[Dict[str, Any]]) -> Tuple[List[float], List[int]]:
+    """Per-company completeness scores and available-metric counts"""
+    if np is not None and len(companies) >= FUNDAMENTALS_VECTORIZE_MIN:
+        # One presence mask for every company, reduced to per-tier counts
+        mask = np.array(
+            [[metrics.get(m) is not None for m in FUNDAMENTAL_METRICS] for metrics in companies],
+            dtype=np.int64
+        )
+        kernel = _compiled_tier_kernel()
+        if kernel is not None:
+            scores, totals = kernel(mask)
+            return scores.tolist(), totals.tolist()
+        counts = np.add.reduceat(mask, _TIER_OFFSETS, axis=1)
+        scores = _tier_score(counts[:, 0], counts[:, 1], counts[:, 2])
+        return scores.tolist(), counts.sum(axis=1).tolist()
+    
+    scores = []
+    totals = []
+    for metrics in companies:
+        counts = [0, 0, 0]
+        for metric, tier in _METRIC_TIER.items():
+            if metrics.get(metric) is not None:
+                counts[tier] += 1
+        scores.append(_tier_score(*counts))
+        totals.append(sum(counts))
+    return scores, totals
+
+
+# Averages over at least this many values use numpy's pairwise mean
+MEAN_VECTORIZE_MIN = 8
+
+
+def _mean(values: List[float]) -> float:
+    """Mean of `values` (0.0 when empty)"""
+    n = len(values)
+    if not n:
+        return 0.0
+    if np is not None and n >= MEAN_VECTORIZE_MIN:
+        return float(np.fromiter(values, dtype=np.float64, count=n).mean())
+    return math.fsum(values) / n
 
 
 class DataQualityValidator:
     """Validates data quality with historical query awareness"""
     
+    __slots__ = ("min_macro_indicators", "min_news_articles", "min_fundamental_fields")
+    
     def __init__(self):
         self.min_macro_indicators = 1  # Relaxed from 2
         self.min_news_articles = 2     # Relaxed from 3
         self.min_fundamental_fields = 5
         
-    def validate_macro_data(self, macro_result: Dict[str, Any], query: str) -> Tuple[bool, float, str]:
+    def validate_macro_data(self, macro_result: Union[Dict[str, Any], WorkerResult], query: str, verbose: bool = True) -> Tuple[bool, float, str]:
         """Validate macro worker - MORE LENIENT"""
         
-        if macro_result.get("status") != "success":
-            return False, 0.0, f"Macro worker failed: {macro_result.get('error', 'unknown')}"
+        macro_result = WorkerResult.from_raw(macro_result)
+        if macro_result.status != "success":
+            return False, 0.0, f"Macro worker failed: {macro_result.error}" if verbose else ""
         
-        macro_facts = macro_result.get("macro_facts", {})
-        region = macro_result.get("region", "UNKNOWN")
+        macro_facts = macro_result.macro_facts
+        region = macro_result.region
         
         # Check 1: At least 1 successful indicator (relaxed)
         successful_indicators = [
@@ -37,161 +219,145 @@ class DataQualityValidator:
         ]
         
         if len(successful_indicators) < self.min_macro_indicators:
-            return False, 0.2, f"Only {len(successful_indicators)} indicators succeeded (need {self.min_macro_indicators})"
+            return False, 0.2, f"Only {len(successful_indicators)} indicators succeeded (need {self.min_macro_indicators})" if verbose else ""
         
         # Check 2: Region alignment (RELAXED - no penalty for historical queries)
         query_lower = query.lower()
-        is_historical = self._is_historical_query(query_lower)
+        is_historical = _HIST_RE.search(query_lower) is not None
         
         quality_score = 0.7  # Start higher
         reason_parts = []
         
         if not is_historical:
             # Only check region for current queries
-            us_indicators = ["us ", "federal reserve", "fed ", "dollar"]
-            india_indicators = ["india", "rbi", "reserve bank of india", "rupee", "inr"]
-            
-            has_us = any(ind in query_lower for ind in us_indicators)
-            has_india = any(ind in query_lower for ind in india_indicators)
+            has_us = _US_RE.search(query_lower) is not None
+            has_india = _IN_RE.search(query_lower) is not None
             
             if has_us and region != "US":
                 quality_score -= 0.15  # Reduced penalty
-                reason_parts.append(f"Region hint US but got {region}")
+                if verbose:
+                    reason_parts.append(f"Region hint US but got {region}")
             elif has_india and region != "IN":
                 quality_score -= 0.15  # Reduced penalty
-                reason_parts.append(f"Region hint India but got {region}")
+                if verbose:
+                    reason_parts.append(f"Region hint India but got {region}")
         
         # Bonus for comprehensive data
         if len(successful_indicators) >= 2:
             quality_score += 0.15
-            reason_parts.append("Good indicator coverage")
+            if verbose:
+                reason_parts.append("Good indicator coverage")
         
         quality_score = max(0.0, min(1.0, quality_score))
-        reason = " | ".join(reason_parts) if reason_parts else "Macro data acceptable"
+        reason = (" | ".join(reason_parts) or "Macro data acceptable") if verbose else ""
         
         return quality_score > 0.4, quality_score, reason  # Lowered threshold
     
     def _is_historical_query(self, query_lower: str) -> bool:
         """Check if query is about historical comparison"""
-        historical_indicators = [
-            '2020', '2021', '2022', '2023', '2024', '2025',
-            'during', 'historical', 'comparison', 'vs', 'versus',
-            'compare', 'between', 'over time'
-        ]
-        return any(ind in query_lower for ind in historical_indicators)
+        return _HIST_RE.search(query_lower) is not None
     
-    def validate_news_data(self, news_result: Dict[str, Any], query: str) -> Tuple[bool, float, str]:
+    def validate_news_data(self, news_result: Union[Dict[str, Any], WorkerResult], query: str, verbose: bool = True) -> Tuple[bool, float, str]:
         """Validate news - MORE LENIENT"""
         
-        if news_result.get("status") != "success":
-            return False, 0.0, f"News worker failed: {news_result.get('error', 'unknown')}"
+        news_result = WorkerResult.from_raw(news_result)
+        if news_result.status != "success":
+            return False, 0.0, f"News worker failed: {news_result.error}" if verbose else ""
         
-        data = news_result.get("data", {})
+        data = news_result.data
         articles = data.get("articles", [])
         
         # Relaxed minimum
         if len(articles) < self.min_news_articles:
-            return False, 0.3, f"Only {len(articles)} articles (need {self.min_news_articles})"
+            return False, 0.3, f"Only {len(articles)} articles (need {self.min_news_articles})" if verbose else ""
         
         quality_score = 0.6  # Start higher
         reason_parts = []
         
+        # One pass for both total length and whether a second source appears
+        total_words = 0
+        first_source = articles[0].get("source", "")
+        diverse_sources = False
+        for article in articles:
+            total_words += article.get("word_count", 0)
+            if not diverse_sources and article.get("source", "") != first_source:
+                diverse_sources = True
+        
         # Content length check (more lenient)
-        avg_length = sum(a.get("word_count", 0) for a in articles) / len(articles)
+        avg_length = total_words / len(articles)
         if avg_length < 150:  # Lowered from 200
             quality_score -= 0.1  # Reduced penalty
-            reason_parts.append(f"Short articles: {avg_length:.0f} words")
+            if verbose:
+                reason_parts.append(f"Short articles: {avg_length:.0f} words")
         elif avg_length > 400:  # Lowered threshold
             quality_score += 0.15  # Increased bonus
-            reason_parts.append("Good article depth")
+            if verbose:
+                reason_parts.append("Good article depth")
         
         # Source diversity
-        sources = set(a.get("source", "") for a in articles)
-        if len(sources) >= 2:  # Lowered from 3
+        if diverse_sources:  # At least 2 distinct sources (lowered from 3)
             quality_score += 0.1
-            reason_parts.append("Good source diversity")
+            if verbose:
+                reason_parts.append("Good source diversity")
         
         quality_score = max(0.0, min(1.0, quality_score))
-        reason = " | ".join(reason_parts) if reason_parts else "News quality acceptable"
+        reason = (" | ".join(reason_parts) or "News quality acceptable") if verbose else ""
         
         return quality_score > 0.4, quality_score, reason  # Lowered threshold
     
-    def validate_fundamentals_data(self, fund_result: Dict[str, Any]) -> Tuple[bool, float, str]:
+    def validate_fundamentals_data(self, fund_result: Union[Dict[str, Any], WorkerResult], verbose: bool = True) -> Tuple[bool, float, str]:
         """Validate fundamentals - UNCHANGED (already good)"""
         
-        if fund_result.get("status") not in ["success"]:
-            return False, 0.0, f"Fundamentals worker failed: {fund_result.get('error', 'unknown')}"
+        fund_result = WorkerResult.from_raw(fund_result)
+        if fund_result.status != "success":
+            return False, 0.0, f"Fundamentals worker failed: {fund_result.error}" if verbose else ""
         
-        data = fund_result.get("data", {})
+        data = fund_result.data
         
         if not data:
-            return False, 0.0, "No fundamental data returned"
+            return False, 0.0, "No fundamental data returned" if verbose else ""
         
         quality_score = 0.5
         reason_parts = []
         
-        tier1_metrics = ["market_cap", "price", "pe_ratio"]
-        tier2_metrics = ["roe", "roce", "pb_ratio", "book_value"]
-        tier3_metrics = ["dividend_yield", "debt_to_equity", "revenue", "profit", "eps"]
+        companies = [
+            (company, metrics) for company, metrics in data.items()
+            if isinstance(metrics, dict) and "error" not in metrics
+        ]
         
-        total_companies = len([m for m in data.values() if isinstance(m, dict) and "error" not in m])
+        if not companies:
+            return False, 0.0, "All companies returned errors" if verbose else ""
         
-        if total_companies == 0:
-            return False, 0.0, "All companies returned errors"
+        company_scores, available_counts = _score_companies([metrics for _, metrics in companies])
+        total_possible = len(FUNDAMENTAL_METRICS)
         
-        company_scores = []
+        if verbose:
+            for (company, _), company_score, total_available in zip(companies, company_scores, available_counts):
+                label = _COMPANY_SCORE_LABELS[bisect_right(_COMPANY_SCORE_BREAKS, company_score)]
+                reason_parts.append(f"{company}: {label} ({total_available}/{total_possible})")
         
-        for company, metrics in data.items():
-            if isinstance(metrics, dict) and "error" not in metrics:
-                tier1_count = sum(1 for m in tier1_metrics if m in metrics and metrics[m] is not None)
-                tier2_count = sum(1 for m in tier2_metrics if m in metrics and metrics[m] is not None)
-                tier3_count = sum(1 for m in tier3_metrics if m in metrics and metrics[m] is not None)
-                
-                tier1_complete = tier1_count / len(tier1_metrics)
-                tier2_complete = tier2_count / len(tier2_metrics) if tier2_metrics else 0
-                tier3_complete = tier3_count / len(tier3_metrics) if tier3_metrics else 0
-                
-                company_score = (0.50 * tier1_complete) + (0.35 * tier2_complete) + (0.15 * tier3_complete)
-                company_scores.append(company_score)
-                
-                total_available = tier1_count + tier2_count + tier3_count
-                total_possible = len(tier1_metrics) + len(tier2_metrics) + len(tier3_metrics)
-                
-                if company_score >= 0.75:
-                    reason_parts.append(f"{company}: excellent ({total_available}/{total_possible})")
-                elif company_score >= 0.50:
-                    reason_parts.append(f"{company}: good ({total_available}/{total_possible})")
-                elif company_score >= 0.30:
-                    reason_parts.append(f"{company}: acceptable ({total_available}/{total_possible})")
-                else:
-                    reason_parts.append(f"{company}: poor ({total_available}/{total_possible})")
+        avg_company_score = _mean(company_scores)
         
-        avg_company_score = sum(company_scores) / len(company_scores) if company_scores else 0
-        
-        if avg_company_score >= 0.75:
-            quality_score = 0.85 + (avg_company_score - 0.75) * 0.4
-        elif avg_company_score >= 0.50:
-            quality_score = 0.70 + (avg_company_score - 0.50) * 0.6
-        elif avg_company_score >= 0.30:
-            quality_score = 0.55 + (avg_company_score - 0.30) * 0.75
-        else:
-            quality_score = 0.30 + avg_company_score
+        # Piecewise-linear in the average company score
+        start, base, slope = _QUALITY_PIECES[bisect_right(_COMPANY_SCORE_BREAKS, avg_company_score)]
+        quality_score = base + (avg_company_score - start) * slope
         
         quality_score = max(0.0, min(1.0, quality_score))
-        reason = " | ".join(reason_parts) if reason_parts else "Fundamental data quality acceptable"
+        reason = (" | ".join(reason_parts) or "Fundamental data quality acceptable") if verbose else ""
         
         return quality_score >= 0.55, quality_score, reason
     
-    def validate_prices_data(self, prices_result: Dict[str, Any]) -> Tuple[bool, float, str]:
+    def validate_prices_data(self, prices_result: Union[Dict[str, Any], WorkerResult], verbose: bool = True) -> Tuple[bool, float, str]:
         """Validate prices - UNCHANGED (already good)"""
         
-        if prices_result.get("status") not in ["success"]:
-            return False, 0.0, f"Prices worker failed: {prices_result.get('error', 'unknown')}"
+        prices_result = WorkerResult.from_raw(prices_result)
+        if prices_result.status != "success":
+            return False, 0.0, f"Prices worker failed: {prices_result.error}" if verbose else ""
         
-        data = prices_result.get("data", {})
+        data = prices_result.data
         
         if not data:
-            return False, 0.0, "No price data returned"
+            return False, 0.0, "No price data returned" if verbose else ""
         
         quality_score = 0.7
         reason_parts = []
@@ -203,109 +369,148 @@ class DataQualityValidator:
                 
                 if available < len(required_fields):
                     quality_score -= 0.1
-                    reason_parts.append(f"{symbol}: incomplete")
+                    if verbose:
+                        reason_parts.append(f"{symbol}: incomplete")
                 else:
                     quality_score += 0.05
         
         quality_score = max(0.0, min(1.0, quality_score))
-        reason = " | ".join(reason_parts) if reason_parts else "Price data good"
+        reason = (" | ".join(reason_parts) or "Price data good") if verbose else ""
         
         return quality_score > 0.5, quality_score, reason
 
 
+_FAILED_STATUSES = frozenset({"error", "no_symbols", "no_companies", "no_content", "no_results"})
+
+
 class StrictConfidenceCalculator:
     """FIXED confidence calculator - more lenient"""
     
+    __slots__ = ("validator", "_dispatch")
+    
+    # Shared, read-only tables (class level, so no per-instance copies)
+    CRITICAL_WORKERS = MappingProxyType({
+        "MACRO_DATA": ("MACRO",),  # News is bonus
+        "COMPANY_FUNDAMENTALS": ("FUNDAMENTALS_IN", "FUNDAMENTALS_US"),
+        "MARKET_PRICES": ("PRICES",),
+        "NEWS_ANALYSIS": ("NEWS", "NEWS_ANALYSIS"),
+        "MIXED": ()
+    })
+    
+    # RELAXED thresholds - ALWAYS trigger fallback for fundamentals
+    INTENT_THRESHOLDS = MappingProxyType({
+        "MACRO_DATA": 0.80,        # Increased from 0.50 to 0.80
+        "COMPANY_FUNDAMENTALS": 0.10,  # Lowered to 0.10 - ALWAYS trigger fallback
+        "MARKET_PRICES": 0.60,
+        "NEWS_ANALYSIS": 0.50,
+        "MIXED": 0.55,             # Relaxed from 0.65
+        "NON_FINANCIAL": 0.30
+    })
+    
     def __init__(self):
         self.validator = DataQualityValidator()
         
-        self.CRITICAL_WORKERS = {
-            "MACRO_DATA": ["MACRO"],  # News is bonus
-            "COMPANY_FUNDAMENTALS": ["FUNDAMENTALS_IN", "FUNDAMENTALS_US"],
-            "MARKET_PRICES": ["PRICES"],
-            "NEWS_ANALYSIS": ["NEWS", "NEWS_ANALYSIS"],
-            "MIXED": []
-        }
-        
-        # RELAXED thresholds - ALWAYS trigger fallback for fundamentals
-        self.INTENT_THRESHOLDS = {
-            "MACRO_DATA": 0.80,        # Increased from 0.50 to 0.80
-            "COMPANY_FUNDAMENTALS": 0.10,  # Lowered to 0.10 - ALWAYS trigger fallback
-            "MARKET_PRICES": 0.60,
-            "NEWS_ANALYSIS": 0.50,
-            "MIXED": 0.55,             # Relaxed from 0.65
-            "NON_FINANCIAL": 0.30
+        # worker -> (validator, takes query, prefix "VALIDATION FAILED" when invalid)
+        self._dispatch = {
+            "MACRO": (self.validator.validate_macro_data, True, False),
+            "NEWS": (self.validator.validate_news_data, True, False),
+            "FUNDAMENTALS_IN": (self.validator.validate_fundamentals_data, False, True),
+            "FUNDAMENTALS_US": (self.validator.validate_fundamentals_data, False, True),
+            "PRICES": (self.validator.validate_prices_data, False, True),
+            "NEWS_ANALYSIS": (self._validate_news_analysis, False, False),
         }
     
     def calculate_worker_confidence(
         self,
         worker_name: str,
         worker_result: Dict[str, Any],
-        query: str
+        query: str,
+        verbose: bool = True
     ) -> Tuple[float, str]:
-        """Calculate worker confidence with quality validation"""
+        """
+        Calculate worker confidence with quality validation
+        
+        With verbose=False the reason is "" and no reason strings are built.
+        """
         
         status = worker_result.get("status", "error")
         
-        if status in ["error", "no_symbols", "no_companies", "no_content", "no_results"]:
-            return 0.0, f"Worker failed: {status}"
-        
-        if worker_name == "MACRO":
-            is_valid, quality, reason = self.validator.validate_macro_data(worker_result, query)
-            return quality, reason  # Return quality even if not "valid"
-        
-        elif worker_name == "NEWS":
-            is_valid, quality, reason = self.validator.validate_news_data(worker_result, query)
-            return quality, reason
-        
-        elif worker_name in ["FUNDAMENTALS_IN", "FUNDAMENTALS_US"]:
-            is_valid, quality, reason = self.validator.validate_fundamentals_data(worker_result)
-            if not is_valid:
-                return quality, f"VALIDATION FAILED: {reason}"
-            return quality, reason
-        
-        elif worker_name == "PRICES":
-            is_valid, quality, reason = self.validator.validate_prices_data(worker_result)
-            if not is_valid:
-                return quality, f"VALIDATION FAILED: {reason}"
-            return quality, reason
-        
-        elif worker_name == "NEWS_ANALYSIS":
-            synthesis = worker_result.get("synthesis", {})
-            if not synthesis or not synthesis.get("overall_summary"):
-                return 0.3, "News analysis incomplete"
-            
-            governance = worker_result.get("_governance", {})
-            if governance.get("quarantine_status") != "CLEAN":
-                return 0.5, f"Quarantined: {governance.get('quarantine_status')}"  # Less harsh
-            
-            return 0.75, "News analysis quality good"
+        if status in _FAILED_STATUSES:
+            return 0.0, f"Worker failed: {status}" if verbose else ""
         
-        return 0.5, "Default confidence"
+        entry = self._dispatch.get(worker_name)
+        if entry is None:
+            return 0.5, "Default confidence" if verbose else ""
+        
+        validate, takes_query, strict = entry
+        # One attribute view per worker; the validators take it as-is
+        worker_result = WorkerResult.from_raw(worker_result)
+        if takes_query:
+            is_valid, quality, reason = validate(worker_result, query, verbose)
+        else:
+            is_valid, quality, reason = validate(worker_result, verbose)
+        
+        # Fundamentals/prices flag failed validation; others return quality as-is
+        if strict and not is_valid and verbose:
+            return quality, f"VALIDATION FAILED: {reason}"
+        return quality, reason
+    
+    @staticmethod
+    def _validate_news_analysis(
+        worker_result: Union[Dict[str, Any], WorkerResult],
+        verbose: bool = True
+    ) -> Tuple[bool, float, str]:
+        worker_result = WorkerResult.from_raw(worker_result)
+        synthesis = worker_result.synthesis
+        if not synthesis or not synthesis.get("overall_summary"):
+            return False, 0.3, "News analysis incomplete" if verbose else ""
+        
+        governance = worker_result.governance
+        if governance.get("quarantine_status") != "CLEAN":
+            return False, 0.5, f"Quarantined: {governance.get('quarantine_status')}" if verbose else ""  # Less harsh
+        
+        return True, 0.75, "News analysis quality good" if verbose else ""
     
     def calculate_aggregate_confidence(
         self,
         intent: str,
         planner_confidence: float,
         worker_results: Dict[str, Any],
-        query: str
+        query: str,
+        verbose: bool = True
     ) -> Tuple[float, Dict[str, Any]]:
-        """Calculate aggregate confidence - MORE LENIENT"""
-        
-        # Step 1: Calculate worker confidences
-        worker_confidences = {}
-        worker_reasons = {}
+        """
+        Calculate aggregate confidence - MORE LENIENT
+        
+        Batch/monitoring callers that only need the numbers pass verbose=False;
+        worker_reasons are then all "".
+        """
+        
+        # Step 1: Calculate worker confidences into parallel lists; the
+        # per-worker dicts are only built for the returned breakdown
+        names = list(worker_results)
+        statuses = [result.get("status", "error") for result in worker_results.values()]
+        confs = [0.0] * len(names)
+        
+        if all(status in _FAILED_STATUSES for status in statuses):
+            # Every worker failed outright (e.g. a rate-limit outage): all
+            # confidences stay 0.0, so skip per-worker scoring entirely
+            reasons = [f"Worker failed: {status}" if verbose else "" for status in statuses]
+        else:
+            reasons = [""] * len(names)
+            for i, worker_name in enumerate(names):
+                confs[i], reasons[i] = self.calculate_worker_confidence(
+                    worker_name, worker_results[worker_name], query, verbose
+                )
         
-        for worker_name, result in worker_results.items():
-            conf, reason = self.calculate_worker_confidence(worker_name, result, query)
-            worker_confidences[worker_name] = conf
-            worker_reasons[worker_name] = reason
+        worker_confidences = dict(zip(names, confs))
         
         # Step 2: Check critical workers
-        critical_workers = self.CRITICAL_WORKERS.get(intent, [])
+        # Copied to a list so the breakdown keeps its pre-tuple payload shape
+        critical_workers = list(self.CRITICAL_WORKERS.get(intent, ()))
         
         if intent == "MIXED":
-            critical_workers = list(worker_results.keys())
+            critical_workers = names
         
         critical_failures = []
         critical_successes = []
@@ -320,14 +525,14 @@ class StrictConfidenceCalculator:
         # RELAXED penalty for critical failures
         if critical_failures:
             penalty = 0.2 * len(critical_failures)  # Reduced from 0.3
-            worker_avg = sum(worker_confidences.values()) / len(worker_confidences) if worker_confidences else 0
+            worker_avg = _mean(confs)
             aggregate = max(0.2, worker_avg - penalty)  # Higher floor, no planner confidence
             
             return aggregate, {
                 "aggregate_confidence": aggregate,
                 "planner_confidence": planner_confidence,
                 "worker_confidences": worker_confidences,
-                "worker_reasons": worker_reasons,
+                "worker_reasons": dict(zip(names, reasons)),
                 "critical_failures": critical_failures,
                 "critical_successes": critical_successes,
                 "penalty_applied": penalty,
@@ -335,7 +540,7 @@ class StrictConfidenceCalculator:
             }
         
         # Step 3: Calculate weighted average (NEWS IS BONUS)
-        if not worker_confidences:
+        if not names:
             # No workers - return low confidence (no planner confidence influence)
             return 0.0, {
                 "aggregate_confidence": 0.0,
@@ -359,7 +564,7 @@ class StrictConfidenceCalculator:
                 worker_avg = (macro_conf * 0.7) + (news_conf * 0.3)
         else:
             # Standard average
-            worker_avg = sum(worker_confidences.values()) / len(worker_confidences)
+            worker_avg = _mean(confs)
         
         # Weight: 0% planner, 100% workers (planner confidence excluded from aggregate)
         aggregate = worker_avg
@@ -372,7 +577,7 @@ class StrictConfidenceCalculator:
             "aggregate_confidence": aggregate,
             "planner_confidence": planner_confidence,
             "worker_confidences": worker_confidences,
-            "worker_reasons": worker_reasons,
+            "worker_reasons": dict(zip(names, reasons)),
             "worker_average": worker_avg,
             "critical_workers": critical_workers,
             "critical_failures": [],
@@ -403,15 +608,8 @@ class StrictConfidenceCalculator:
         """Get confidence assessment"""
         
         threshold = self.INTENT_THRESHOLDS.get(intent, 0.55)
-        
-        if aggregate_confidence >= threshold + 0.15:
-            return "HIGH"
-        elif aggregate_confidence >= threshold:
-            return "ACCEPTABLE"
-        elif aggregate_confidence >= threshold - 0.15:
-            return "LOW"
-        else:
-            return "VERY_LOW"
+        bands = (threshold - 0.15, threshold, threshold + 0.15)
+        return _ASSESSMENT_LABELS[bisect_right(bands, aggregate_confidence)]
 
 
 # Convenience functions
@@ -421,11 +619,12 @@ def calculate_confidence(
     intent: str,
     planner_confidence: float,
     worker_results: Dict[str, Any],
-    query: str
+    query: str,
+    verbose: bool = True
 ) -> Tuple[float, Dict[str, Any]]:
     """Calculate aggregate confidence"""
     return _calculator.calculate_aggregate_confidence(
-        intent, planner_confidence, worker_results, query
+        intent, planner_confidence, worker_results, query, verbose
     )
 
 def should_trigger_fallback(intent: str, aggregate_confidence: float) -> Tuple[bool, str]:
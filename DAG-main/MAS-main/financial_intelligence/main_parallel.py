@@ -8,52 +8,111 @@ Features:
 - Result persistence
 """
 import asyncio
-import json
+import io
 import sys
-import structlog
+import weakref
 from datetime import datetime
+from functools import partial
 
-from financial_intelligence.planner.planner_llm import invoke_planner_llm
-from financial_intelligence.planner.validator import validate_planner_output
-from financial_intelligence.orchestrator import ParallelOrchestrator
-from financial_intelligence.utils.entity_resolver import resolve_entities
-from financial_intelligence.config import AGGREGATE_CONFIDENCE_THRESHOLD
+# The planner, orchestrator, verifier and structlog are imported inside
+# run_financial_system, so importing this module stays cheap
+_logger = None
 
-# Configure structured logging
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
-    ],
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
 
-logger = structlog.get_logger()
+def _configure_logging():
+    """Configure structlog on first use and return the module logger"""
+    global _logger
+    if _logger is None:
+        # Concurrent first calls may both configure; that's harmless
+        import structlog
+        structlog.configure(
+            processors=[
+                structlog.stdlib.filter_by_level,
+                structlog.stdlib.add_logger_name,
+                structlog.stdlib.add_log_level,
+                structlog.stdlib.PositionalArgumentsFormatter(),
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.StackInfoRenderer(),
+                structlog.processors.format_exc_info,
+                structlog.processors.UnicodeDecoder(),
+                structlog.processors.JSONRenderer()
+            ],
+            context_class=dict,
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            cache_logger_on_first_use=True,
+        )
+        _logger = structlog.get_logger()
+    return _logger
+
+# Sessions in flight per event loop and the orchestrators they built; the
+# loop's pooled clients are closed when its last session finishes
+_loop_sessions = weakref.WeakKeyDictionary()  # loop -> {"active": int, "orchestrators": list}
+
+
+async def _end_session(orchestrator) -> None:
+    state = _loop_sessions[asyncio.get_running_loop()]
+    state["active"] -= 1
+    if orchestrator is not None:
+        state["orchestrators"].append(orchestrator)
+    if state["active"]:
+        return
+    orchestrators, state["orchestrators"] = state["orchestrators"], []
+    for orchestrator in orchestrators:
+        try:
+            await orchestrator.aclose()
+        except Exception as e:
+            _configure_logging().warning("session.close_error", error=str(e))
+
+def _write_bytes(path: str, payload: bytes) -> None:
+    with open(path, 'wb') as f:
+        f.write(payload)
+
 # final=[]
 
 async def run_financial_system(input_query: str):
     """Enhanced main with full governance and OpenAI fallback"""
+    from financial_intelligence.planner.planner_llm import invoke_planner_llm
+    from financial_intelligence.planner.validator import validate_planner_output
+    from financial_intelligence.orchestrator import ParallelOrchestrator
+    from financial_intelligence.utils.entity_resolver import resolve_entities
+    from financial_intelligence.config import AGGREGATE_CONFIDENCE_THRESHOLD, validate_config
+    from financial_intelligence.core.serialize import to_json
     
-    print("\n" + "=" * 80)
-    print("FINANCIAL INTELLIGENCE SYSTEM V2.0 - WITH GOVERNANCE & FALLBACK")
-    print("=" * 80 + "\n")
+    logger = _configure_logging()
+    final = None
+    
+    # Status lines are buffered and written in one go at each step boundary
+    # (before any slow call, so progress still shows up as it happens)
+    out = io.StringIO()
+    p = partial(print, file=out)
+    
+    def flush():
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+        out.seek(0)
+        out.truncate()
+    
+    p("\n" + "=" * 80)
+    p("FINANCIAL INTELLIGENCE SYSTEM V2.0 - WITH GOVERNANCE & FALLBACK")
+    p("=" * 80 + "\n")
+    
+    # Validated here rather than on import; repeat calls are free
+    try:
+        validate_config()
+    except ValueError as e:
+        p(f"Configuration validation failed: {e}")
     
     query = input_query.strip()
     
     if not query:
-        print("Empty query. Exiting.")
+        p("Empty query. Exiting.")
+        flush()
         return
     
     session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    orchestrator = None
+    state = _loop_sessions.setdefault(asyncio.get_running_loop(), {"active": 0, "orchestrators": []})
+    state["active"] += 1
     
     logger.info(
         "session.start",
@@ -65,12 +124,13 @@ async def run_financial_system(input_query: str):
         # =============================================================
         # STEP 1: Intent Classification
         # =============================================================
-        print("\n📊 STEP 1: Intent Classification...")
+        p("\n📊 STEP 1: Intent Classification...")
+        flush()
         logger.info("step.intent_classification.start")
         
         raw_plan = invoke_planner_llm(query)
-        print("\nRAW PLANNER OUTPUT:")
-        print(raw_plan)
+        p("\nRAW PLANNER OUTPUT:")
+        p(raw_plan)
         
         plan = validate_planner_output(raw_plan)
         
@@ -78,9 +138,9 @@ async def run_financial_system(input_query: str):
         confidence = plan.get('confidence')
         reason = plan.get('reason')
         
-        print(f"\n✅ Intent: {intent}")
-        print(f"   Confidence: {confidence:.2f}")
-        print(f"   Reason: {reason}")
+        p(f"\n✅ Intent: {intent}")
+        p(f"   Confidence: {confidence:.2f}")
+        p(f"   Reason: {reason}")
         
         logger.info(
             "step.intent_classification.complete",
@@ -94,22 +154,24 @@ async def run_financial_system(input_query: str):
                 "step.intent_classification.low_confidence",
                 confidence=confidence
             )
-            print("\n⚠️  Low confidence intent classification")
-            print("🔍 Falling back to planner decomposition – no workers will be executed")
+            p("\n⚠️  Low confidence intent classification")
+            p("🔍 Falling back to planner decomposition – no workers will be executed")
+            flush()
             return
         
         # =============================================================
         # STEP 2: Entity Resolution
         # =============================================================
-        print("\n🔍 STEP 2: Entity Resolution...")
+        p("\n🔍 STEP 2: Entity Resolution...")
+        flush()
         logger.info("step.entity_resolution.start")
         
         entities = resolve_entities(query)
         
         if entities:
-            print(f"✅ Resolved {len(entities)} entities:")
+            p(f"✅ Resolved {len(entities)} entities:")
             for e in entities:
-                print(f"   - {e['company']} ({e['ticker']}) [{e.get('region', 'UNKNOWN')}]")
+                p(f"   - {e['company']} ({e['ticker']}) [{e.get('region', 'UNKNOWN')}]")
             
             logger.info(
                 "step.entity_resolution.complete",
@@ -117,7 +179,7 @@ async def run_financial_system(input_query: str):
                 entities=[e['ticker'] for e in entities]
             )
         else:
-            print("⚠️  No entities detected")
+            p("⚠️  No entities detected")
             logger.info("step.entity_resolution.complete", entities_count=0)
         
         # Attach entities to plan
@@ -127,8 +189,9 @@ async def run_financial_system(input_query: str):
         # =============================================================
         # STEP 3: Execute Workers with Governance + Fallback
         # =============================================================
-        print(f"\n🔄 STEP 3: Executing workers for intent '{intent}'...")
-        print(f"   Confidence threshold for fallback: {AGGREGATE_CONFIDENCE_THRESHOLD}")
+        p(f"\n🔄 STEP 3: Executing workers for intent '{intent}'...")
+        p(f"   Confidence threshold for fallback: {AGGREGATE_CONFIDENCE_THRESHOLD}")
+        flush()
         logger.info("step.worker_execution.start", intent=intent)
         
         orchestrator = ParallelOrchestrator()
@@ -144,73 +207,76 @@ async def run_financial_system(input_query: str):
         # =============================================================
         # STEP 4: Display Results
         # =============================================================
-        print("\n" + "=" * 80)
-        print("RESULTS")
-        print("=" * 80)
+        p("\n" + "=" * 80)
+        p("RESULTS")
+        p("=" * 80)
         
         # Show governance status
         final_status = result.get("status", "UNKNOWN")
-        print(f"\n🔒 GOVERNANCE STATUS: {final_status}")
+        p(f"\n🔒 GOVERNANCE STATUS: {final_status}")
         
         if final_status == "BLOCKED":
-            print("❌ Request blocked by governance checks")
+            p("❌ Request blocked by governance checks")
             logger.error("session.blocked", reason=result.get("error", "Unknown"))
         elif final_status == "APPROVED_WITH_WARNINGS":
-            print("⚠️  Request approved with warnings - review carefully")
+            p("⚠️  Request approved with warnings - review carefully")
             logger.warning("session.approved_with_warnings")
         else:
-            print("✅ Request fully approved")
+            p("✅ Request fully approved")
             logger.info("session.approved")
         
         # Show confidence breakdown
-        print(f"\n📈 CONFIDENCE ANALYSIS:")
-        print(f"   Planner Confidence: {result.get('planner_confidence', 0):.2f}")
+        p(f"\n📈 CONFIDENCE ANALYSIS:")
+        p(f"   Planner Confidence: {result.get('planner_confidence', 0):.2f}")
         
         worker_confs = result.get('worker_confidences', {})
         if worker_confs:
-            print(f"   Worker Confidences:")
+            p(f"   Worker Confidences:")
             for worker, conf in worker_confs.items():
                 emoji = "✅" if conf >= 0.6 else "⚠️" if conf >= 0.4 else "❌"
-                print(f"      {emoji} {worker}: {conf:.2f}")
+                p(f"      {emoji} {worker}: {conf:.2f}")
         
         aggregate = result.get('aggregate_confidence', 0)
-        print(f"   Aggregate Confidence: {aggregate:.2f}")
+        p(f"   Aggregate Confidence: {aggregate:.2f}")
         
         if aggregate < AGGREGATE_CONFIDENCE_THRESHOLD:
-            print(f"   ⚠️  Below threshold ({AGGREGATE_CONFIDENCE_THRESHOLD})")
+            p(f"   ⚠️  Below threshold ({AGGREGATE_CONFIDENCE_THRESHOLD})")
         
         # Show fallback status
         if result.get('fallback_triggered'):
-            print(f"\n🔄 OPENAI FALLBACK:")
-            print(f"   Triggered: YES")
-            print(f"   Reason: {result.get('fallback_reason', 'Unknown')}")
+            p(f"\n🔄 OPENAI FALLBACK:")
+            p(f"   Triggered: YES")
+            p(f"   Reason: {result.get('fallback_reason', 'Unknown')}")
             
             fallback_resp = result.get('fallback_response', {})
             if fallback_resp.get('status') == 'success':
-                print(f"   Status: ✅ Success")
-                print(f"   Model: {fallback_resp.get('model', 'N/A')}")
-                print(f"   Tokens Used: {fallback_resp.get('tokens_used', 'N/A')}")
+                p(f"   Status: ✅ Success")
+                p(f"   Model: {fallback_resp.get('model', 'N/A')}")
+                p(f"   Tokens Used: {fallback_resp.get('tokens_used', 'N/A')}")
             else:
-                print(f"   Status: ❌ Failed")
-                print(f"   Error: {fallback_resp.get('message', 'Unknown')}")
+                p(f"   Status: ❌ Failed")
+                p(f"   Error: {fallback_resp.get('message', 'Unknown')}")
         else:
-            print(f"\n🔄 OPENAI FALLBACK: Not triggered")
+            p(f"\n🔄 OPENAI FALLBACK: Not triggered")
         
         # Display formatted output
-        print("\n" + "=" * 80)
-        print("DETAILED OUTPUT")
-        print("=" * 80)
-        print(orchestrator.format_output(result))
+        p("\n" + "=" * 80)
+        p("DETAILED OUTPUT")
+        p("=" * 80)
+        p(orchestrator.format_output(result))
+        flush()
         
         # =============================================================
         # STEP 5: Save Results
         # =============================================================
         output_file = 'last_run_results.json'
-        final= json.dumps(result, indent=2)
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        # Serialized once; the same bytes go to disk and back to the caller.
+        # The write runs in a worker thread so a slow disk doesn't stall the loop
+        payload = to_json(result, indent=True)
+        await asyncio.to_thread(_write_bytes, output_file, payload)
+        final = payload.decode("utf-8")
         
-        print(f"\n💾 Full results saved to '{output_file}'")
+        p(f"\n💾 Full results saved to '{output_file}'")
         
         logger.info(
             "session.complete",
@@ -223,29 +289,35 @@ async def run_financial_system(input_query: str):
         # =============================================================
         # STEP 6: Display Governance Summary
         # =============================================================
-        print("\n" + "=" * 80)
-        print("GOVERNANCE SUMMARY")
-        print("=" * 80)
+        p("\n" + "=" * 80)
+        p("GOVERNANCE SUMMARY")
+        p("=" * 80)
         
         workers_executed = result.get("workers_executed", [])
         results_data = result.get("results", {})
         
         for worker in workers_executed:
-            worker_result = results_data.get(worker, {})
-            governance = worker_result.get("_governance", {})
+            worker_result = results_data.get(worker)
+            governance = worker_result.get("_governance") if worker_result else None
+            if not governance:
+                continue
             
-            if governance:
-                print(f"\n{worker}:")
-                print(f"  Timelock Validated: {governance.get('timelock_validated', False)}")
-                print(f"  Domain Purity: {governance.get('domain_purity_check', 'N/A')}")
-                print(f"  Completeness: {governance.get('completeness_score', 0):.2%}")
-                print(f"  Quarantine: {governance.get('quarantine_status', 'N/A')}")
+            get = governance.get
+            p(
+                f"\n{worker}:\n"
+                f"  Timelock Validated: {get('timelock_validated', False)}\n"
+                f"  Domain Purity: {get('domain_purity_check', 'N/A')}\n"
+                f"  Completeness: {get('completeness_score', 0):.2%}\n"
+                f"  Quarantine: {get('quarantine_status', 'N/A')}"
+            )
         
-        print("\n" + "=" * 80)
+        p("\n" + "=" * 80)
+        flush()
         
     except KeyboardInterrupt:
         logger.info("session.cancelled", session_id=session_id)
-        print("\n\n⚠️  Session cancelled by user")
+        p("\n\n⚠️  Session cancelled by user")
+        flush()
         sys.exit(0)
         
     except Exception as e:
@@ -255,9 +327,12 @@ async def run_financial_system(input_query: str):
             error=str(e),
             exc_info=True
         )
-        print(f"\n❌ ERROR: {e}")
+        p(f"\n❌ ERROR: {e}")
+        flush()
         import traceback
         traceback.print_exc()
+    finally:
+        await _end_session(orchestrator)
     return final
 
 
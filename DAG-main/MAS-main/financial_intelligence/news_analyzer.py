@@ -7,15 +7,255 @@ Enhanced with:
 - Contamination guards
 - Improved error handling
 """
+import asyncio
 import json
 import re
-from typing import Dict, Any, List
-from groq import Groq
-from financial_intelligence.config import GROQ_API_KEY, WORKER_MODEL, WORKER_TEMPERATURE
+import threading
+import weakref
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit
+from groq import AsyncGroq
+from llm.http_client import get_shared_client
+from financial_intelligence.config import (
+    GROQ_API_KEY, WORKER_MODEL, WORKER_TEMPERATURE, MAX_CONCURRENT_ANALYSES
+)
+from financial_intelligence.core.file_cache import get_file_cache
 from financial_intelligence.core.dag_context import (
     DAGContext, GovernanceMetadata, QuarantineStatus,
-    IntelligenceContaminationError, DomainType
+    IntelligenceContaminationError, DomainContaminationError, DomainType
+)
+
+try:
+    import hyperscan
+except Exception:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
+try:
+    import tiktoken
+except Exception:
+    tiktoken = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers match either way
+try:
+    import orjson
+    _json_loads = orjson.loads
+except Exception:
+    _json_loads = json.loads
+
+# Patterns used per article/query, compiled once
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_FENCE_JSON_RE = re.compile(r'```json\s*')
+_FENCE_RE = re.compile(r'```\s*')
+_HOST_RE = re.compile(
+    r'(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}',  # or IP
+    re.IGNORECASE
 )
+_SPACE_RE = re.compile(r'\s')
+
+
+@lru_cache(maxsize=1)
+def _tokenizer():
+    """cl100k_base encoding, or None without tiktoken (or its BPE file)"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _is_well_formed_url(url: str) -> bool:
+    """http(s) URL with a domain, localhost or IPv4 host and no whitespace
+    
+    urlsplit does the parsing, so only the short hostname goes through a
+    regex. Cached because the same sources recur across articles and runs.
+    """
+    if _SPACE_RE.search(url):
+        return False
+    try:
+        parts = urlsplit(url)
+        parts.port  # ValueError on a non-numeric or out-of-range port
+    except ValueError:
+        return False
+    return (
+        parts.scheme in ('http', 'https')
+        and '@' not in parts.netloc
+        and _HOST_RE.fullmatch(parts.hostname or '') is not None
+    )
+
+
+def _string_values(obj: Any):
+    """Yield every string nested in `obj`'s dict values and lists (not dict keys)"""
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            yield from _string_values(value)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            yield from _string_values(value)
+
+
+class _KeywordSet:
+    """Substring keyword matcher built once over one or more keyword groups
+    
+    Backends, fastest first: a Hyperscan database (python-hyperscan), an
+    Aho-Corasick automaton (pyahocorasick), or one `in` check per keyword.
+    Each of the first two finds every keyword of every group in one pass.
+    """
+    
+    __slots__ = ("groups", "_hits", "_database", "_local", "_automaton")
+    
+    def __init__(self, *groups):
+        self.groups = tuple(tuple(keywords) for keywords in groups)
+        # Pattern id -> (group index, keyword)
+        self._hits = tuple(
+            (group, kw) for group, keywords in enumerate(self.groups) for kw in keywords
+        )
+        self._database = None
+        self._automaton = None
+        if hyperscan is not None:
+            try:
+                database = hyperscan.Database()
+                database.compile(
+                    expressions=[re.escape(kw).encode("utf-8") for _, kw in self._hits],
+                    ids=list(range(len(self._hits))),
+                    elements=len(self._hits),
+                    # Report each keyword once per scan
+                    flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(self._hits)
+                )
+                self._database = database
+                # Scratch space can't be shared by concurrent scans
+                self._local = threading.local()
+                return
+            except Exception:
+                pass  # e.g. a CPU without the required SIMD support
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for hit in self._hits:
+                automaton.add_word(hit[1], hit)
+            automaton.make_automaton()
+            self._automaton = automaton
+    
+    def _scan(self, text: str) -> List[int]:
+        """Hyperscan ids of the keywords in `text`, in match order"""
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._database)
+        ids = []
+        self._database.scan(
+            text.encode("utf-8"),
+            match_event_handler=lambda id_, start, end, flags, context: ids.append(id_),
+            scratch=scratch
+        )
+        return ids
+    
+    def matches(self, *texts: str):
+        """Yield (group index, keyword) once for each keyword found in any of `texts`"""
+        if self._database is not None:
+            seen = set()
+            for text in texts:
+                for id_ in self._scan(text):
+                    if id_ not in seen:
+                        seen.add(id_)
+                        yield self._hits[id_]
+            return
+        if self._automaton is None:
+            for hit in self._hits:
+                if any(hit[1] in text for text in texts):
+                    yield hit
+            return
+        seen = set()
+        for text in texts:
+            for _, hit in self._automaton.iter(text):
+                if hit not in seen:
+                    seen.add(hit)
+                    yield hit
+    
+    def count(self, text: str, limit: int = None) -> int:
+        """Distinct keywords found in `text`, stopping early once `limit` is reached"""
+        found = 0
+        for _ in self.matches(text):
+            found += 1
+            if limit is not None and found >= limit:
+                break
+        return found
+
+
+# Payload keys served by ArticleSummary fields rather than the parsed analysis
+_SUMMARY_META_KEYS = ("title", "url", "source", "published")
+
+
+@dataclass(slots=True)
+class ArticleSummary:
+    """One analyzed article; the payload dict is only built by to_dict()"""
+    title: Optional[str]
+    url: Optional[str]
+    quarantine_status: str
+    block_calculations: bool
+    source: Optional[str] = None
+    published: Optional[str] = None
+    analysis: Dict[str, Any] = field(default_factory=dict)  # parsed LLM fields
+    error: Optional[str] = None
+    
+    @classmethod
+    def failed(cls, article: Dict[str, Any], error: str) -> "ArticleSummary":
+        """Contaminated placeholder for an article that couldn't be analyzed"""
+        return cls(
+            title=article.get("title"),
+            url=article.get("url"),
+            quarantine_status=QuarantineStatus.CONTAMINATED.value,
+            block_calculations=True,
+            error=error
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        if self.error is not None:
+            return {
+                "title": self.title,
+                "url": self.url,
+                "error": self.error,
+                "_quarantine_status": self.quarantine_status,
+                "_block_calculations": self.block_calculations
+            }
+        # Parsed fields may override the metadata; governance keys always win
+        return {
+            "title": self.title,
+            "url": self.url,
+            "source": self.source,
+            "published": self.published,
+            **self.analysis,
+            "_quarantine_status": self.quarantine_status,
+            "_block_calculations": self.block_calculations
+        }
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """to_dict().get(key, default) without building the dict"""
+        if key == "_quarantine_status":
+            return self.quarantine_status
+        if key == "_block_calculations":
+            return self.block_calculations
+        if self.error is not None:
+            if key == "error":
+                return self.error
+            if key in ("title", "url"):
+                return getattr(self, key)
+            return default
+        if key in self.analysis:
+            return self.analysis[key]
+        if key in _SUMMARY_META_KEYS:
+            return getattr(self, key)
+        return default
 
 
 class NewsAnalyzer:
@@ -48,23 +288,104 @@ class NewsAnalyzer:
         'wind power', 'capacity addition', 'power plant', 'grid'
     ]
     
+    # Historical query keywords
+    HISTORICAL_KEYWORDS = (
+        'during', 'recession', 'crisis', 'historical',
+        'back in', 'earlier', 'previous', 'past',
+        '2008', '2009', 'financial crisis'
+    )
+    
+    # Group 0: forward-looking keywords, group 1: exclusions
+    _FORWARD_LOOKING = _KeywordSet(FORWARD_LOOKING_KEYWORDS, FORWARD_LOOKING_EXCLUSIONS)
+    _FINANCIAL = _KeywordSet(FINANCIAL_KEYWORDS)
+    
     def __init__(self):
         if not GROQ_API_KEY:
             raise ValueError("GROQ_API_KEY not set - NewsAnalyzer cannot function")
         
-        self.client = Groq(api_key=GROQ_API_KEY)
         self.model = WORKER_MODEL
         self.temperature = WORKER_TEMPERATURE
-        self.max_chunk_size = 3000
+        self.max_chunk_size = 3000  # characters, when no tokenizer is available
+        self.max_chunk_tokens = 900
+        
+        # One AsyncGroq client and call limit per event loop: pooled
+        # connections belong to the loop that opened them
+        self._clients = weakref.WeakKeyDictionary()  # loop -> (AsyncGroq, httpx client)
+        self._semaphores = weakref.WeakKeyDictionary()
+    
+    def _client(self) -> AsyncGroq:
+        """AsyncGroq on the loop's shared httpx pool (HTTP/2 when h2 is installed)"""
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(loop)
+        if entry is None or entry[1].is_closed:
+            http_client = get_shared_client()
+            entry = (AsyncGroq(api_key=GROQ_API_KEY, http_client=http_client), http_client)
+            self._clients[loop] = entry
+        return entry[0]
+    
+    async def aclose(self) -> None:
+        """Drop the running loop's Groq client
+        
+        The connection pool itself is shared and closed by llm.http_client
+        at exit, so it is left open for the loop's other users.
+        """
+        self._clients.pop(asyncio.get_running_loop(), None)
+    
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+            self._semaphores[loop] = semaphore
+        return semaphore
+    
+    async def _chat(self, messages: List[Dict[str, str]], max_tokens: int) -> str:
+        """
+        Completion text for `messages`
+        
+        Responses are kept in the file cache keyed by model, temperature,
+        max_tokens and the full prompt, so re-analyzing the same article (or
+        re-synthesizing the same summaries) skips the Groq round trip.
+        """
+        cache = get_file_cache()
+        params = json.dumps([self.model, self.temperature, max_tokens, messages], sort_keys=True)
+        if cache is not None:
+            cached = cache.get("NEWS_ANALYSIS", "chat", params)
+            if cached is not None:
+                return cached
+        
+        async with self._semaphore():
+            response = await self._client().chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=max_tokens
+            )
         
+        text = response.choices[0].message.content.strip()
+        if cache is not None:
+            cache.set("NEWS_ANALYSIS", "chat", params, value=text)
+        return text
+    
     def analyze(
         self, 
         news_worker_output: Dict[str, Any], 
         context: DAGContext
+    ) -> Dict[str, Any]:
+        """Blocking wrapper around aanalyze for callers without an event loop"""
+        return asyncio.run(self.aanalyze(news_worker_output, context))
+    
+    async def aanalyze(
+        self, 
+        news_worker_output: Dict[str, Any], 
+        context: DAGContext
     ) -> Dict[str, Any]:
         """
         Analyze news with full governance
         
+        Articles are analyzed concurrently (at most MAX_CONCURRENT_ANALYSES
+        LLM calls in flight), so latency no longer grows with article count.
+        
         Args:
             news_worker_output: Output from NewsWorker
             context: DAGContext with timelock and domain info
@@ -104,25 +425,29 @@ class NewsAnalyzer:
                 else:
                     raise
             
-            # Analyze each article with quarantine
+            # Analyze all articles concurrently with quarantine; gather keeps
+            # article order and one failure doesn't cancel the rest
+            results = await asyncio.gather(
+                *(self._analyze_article(article, context) for article in articles),
+                return_exceptions=True
+            )
+            
             article_summaries = []
             quarantine_count = 0
             analysis_errors = 0
             
-            for i, article in enumerate(articles, 1):
-                try:
-                    summary = self._analyze_article(article, context)
-                    if summary:
-                        article_summaries.append(summary)
-                        
-                        # Track quarantine status
-                        if summary.get('_quarantine_status') != 'CLEAN':
-                            quarantine_count += 1
-                except Exception as e:
-                    print(f"    ⚠️  Failed to analyze article {i}: {e}")
+            for i, summary in enumerate(results, 1):
+                if isinstance(summary, Exception):
+                    print(f"    ⚠️  Failed to analyze article {i}: {summary}")
                     analysis_errors += 1
                     # Continue with other articles
                     continue
+                if summary:
+                    article_summaries.append(summary)
+                    
+                    # Track quarantine status
+                    if summary.quarantine_status != 'CLEAN':
+                        quarantine_count += 1
             
             # Check if we got any successful analyses
             if not article_summaries:
@@ -136,7 +461,7 @@ class NewsAnalyzer:
             
             # Generate synthesis (with contamination guard)
             try:
-                synthesis = self._synthesize_insights(article_summaries, context)
+                synthesis = await self._synthesize_insights(article_summaries, context)
             except Exception as e:
                 print(f"    ⚠️  Synthesis failed: {e}")
                 synthesis = {
@@ -158,7 +483,7 @@ class NewsAnalyzer:
             return {
                 "status": "success",
                 "analysis": {
-                    "individual_articles": article_summaries,
+                    "individual_articles": [s.to_dict() for s in article_summaries],
                     "synthesis": synthesis,
                     "total_articles_analyzed": len(article_summaries),
                     "analysis_errors": analysis_errors
@@ -188,17 +513,11 @@ class NewsAnalyzer:
         query_lower = query.lower()
         
         # Year patterns
-        if re.search(r'\b(19|20)\d{2}\b', query_lower):
+        if _YEAR_RE.search(query_lower):
             return True
         
         # Historical keywords
-        historical_keywords = [
-            'during', 'recession', 'crisis', 'historical',
-            'back in', 'earlier', 'previous', 'past',
-            '2008', '2009', 'financial crisis'
-        ]
-        
-        return any(kw in query_lower for kw in historical_keywords)
+        return any(kw in query_lower for kw in self.HISTORICAL_KEYWORDS)
     
     def _validate_domain_purity(
         self, 
@@ -215,73 +534,58 @@ class NewsAnalyzer:
             print(f"    ℹ️  Relaxed domain validation for historical query")
             return
         
-        from core.dag_context import DomainContaminationError
-        
         financial_article_count = 0
+        required = len(articles) * 0.5
         
         for article in articles:
-            content = article.get('content', '').lower()
-            title = article.get('title', '').lower()
-            combined = content + ' ' + title
+            combined = (article.get('content', '') + ' ' + article.get('title', '')).lower()
             
-            # Check if article contains financial keywords
-            financial_score = sum(
-                1 for kw in self.FINANCIAL_KEYWORDS 
-                if kw in combined
-            )
+            # Check if article contains financial keywords (2 is all we need)
+            financial_score = self._FINANCIAL.count(combined, limit=2)
             
             # Require at least 2 financial keywords (relaxed from 3)
             if financial_score >= 2:
                 financial_article_count += 1
+                if financial_article_count >= required:
+                    return  # Enough financial articles; the rest can't change that
         
         # Require at least 50% of articles to be financial
-        if financial_article_count < len(articles) * 0.5:
+        if financial_article_count < required:
             raise DomainContaminationError(
                 message=f"Only {financial_article_count}/{len(articles)} articles are financial",
                 expected_domain="FINANCIAL",
                 actual_domain="MIXED/NON_FINANCIAL"
             )
     
-    def _analyze_article(
+    async def _analyze_article(
         self, 
         article: Dict[str, Any], 
         context: DAGContext
-    ) -> Dict[str, Any]:
+    ) -> ArticleSummary:
         """Analyze single article with quarantine detection"""
         try:
             content = article.get("content", "")
             
             if not content or len(content) < 50:
-                return {
-                    "title": article.get("title"),
-                    "url": article.get("url"),
-                    "error": "Insufficient content",
-                    "_quarantine_status": QuarantineStatus.CONTAMINATED.value,
-                    "_block_calculations": True
-                }
+                return ArticleSummary.failed(article, "Insufficient content")
             
             # Chunk if too long
-            if len(content) > self.max_chunk_size:
-                content = content[:self.max_chunk_size] + "..."
+            content = self._truncate(content)
             
             prompt = self._build_analysis_prompt(article, content, context)
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
+            result = await self._chat(
+                [
                     {"role": "system", "content": self._get_system_prompt()},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=self.temperature,
                 max_tokens=500
             )
-            
-            result = response.choices[0].message.content.strip()
             result = self._clean_json_response(result)
             
             # Parse LLM output
             try:
-                parsed = json.loads(result)
+                parsed = _json_loads(result)
             except json.JSONDecodeError as e:
                 print(f"    ⚠️  JSON parse error: {e}")
                 # Fallback to text summary
@@ -302,25 +606,37 @@ class NewsAnalyzer:
                 quarantine_status = QuarantineStatus.UNVERIFIABLE
             
             # Build final result
-            return {
-                "title": article.get("title"),
-                "url": url,
-                "source": article.get("source"),
-                "published": article.get("published"),
-                **parsed,
-                "_quarantine_status": quarantine_status.value,
-                "_block_calculations": quarantine_status != QuarantineStatus.CLEAN
-            }
+            return ArticleSummary(
+                title=article.get("title"),
+                url=url,
+                source=article.get("source"),
+                published=article.get("published"),
+                analysis={**parsed},
+                quarantine_status=quarantine_status.value,
+                block_calculations=quarantine_status != QuarantineStatus.CLEAN
+            )
                 
         except Exception as e:
             print(f"    ⚠️  Article analysis error: {e}")
-            return {
-                "title": article.get("title"),
-                "url": article.get("url"),
-                "error": str(e),
-                "_quarantine_status": QuarantineStatus.CONTAMINATED.value,
-                "_block_calculations": True
-            }
+            return ArticleSummary.failed(article, str(e))
+    
+    def _truncate(self, content: str) -> str:
+        """Cut article content to the prompt budget (tokens when tiktoken is available)"""
+        tokenizer = _tokenizer()
+        if tokenizer is None:
+            if len(content) > self.max_chunk_size:
+                content = content[:self.max_chunk_size] + "..."
+            return content
+        
+        # Tokens are rarely longer than 8 characters on average, so only that
+        # prefix is encoded; a cut there is still within the token budget
+        head = content[:self.max_chunk_tokens * 8]
+        ids = tokenizer.encode(head, disallowed_special=())
+        if len(ids) > self.max_chunk_tokens:
+            return tokenizer.decode(ids[:self.max_chunk_tokens]) + "..."
+        if len(head) < len(content):
+            return head + "..."
+        return content
     
     def _detect_forward_looking(
         self, 
@@ -329,14 +645,22 @@ class NewsAnalyzer:
     ) -> QuarantineStatus:
         """Detect forward-looking language in analysis"""
         
-        # Combine analysis and content for checking
-        text = json.dumps(analysis).lower() + " " + content.lower()
+        # Check the analysis' string values and the content; serializing the
+        # analysis would also scan its keys and JSON syntax
+        texts = [value.lower() for value in _string_values(analysis)]
+        texts.append(content.lower())
         
-        # Check for exclusions first (financial analysis context)
-        has_exclusions = any(
-            exclusion in text 
-            for exclusion in self.FORWARD_LOOKING_EXCLUSIONS
-        )
+        # One scan counts forward-looking keywords and spots exclusions
+        # (financial analysis context); 5 keywords quarantine either way
+        forward_count = 0
+        has_exclusions = False
+        for group, _ in self._FORWARD_LOOKING.matches(*texts):
+            if group:
+                has_exclusions = True
+            else:
+                forward_count += 1
+                if forward_count >= 5:
+                    break
         
         # If exclusions found, be more lenient
         if has_exclusions:
@@ -346,12 +670,6 @@ class NewsAnalyzer:
             # Standard threshold
             threshold = 3
         
-        # Count forward-looking keywords
-        forward_count = sum(
-            1 for kw in self.FORWARD_LOOKING_KEYWORDS 
-            if kw in text
-        )
-        
         # Threshold-based quarantine
         if forward_count >= threshold:
             return QuarantineStatus.FORWARD_LOOKING
@@ -364,20 +682,11 @@ class NewsAnalyzer:
             return False
         
         # Basic format check
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # or IP
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE
-        )
-        
-        return bool(url_pattern.match(url))
+        return _is_well_formed_url(url)
     
-    def _synthesize_insights(
+    async def _synthesize_insights(
         self, 
-        summaries: List[Dict], 
+        summaries: List[ArticleSummary], 
         context: DAGContext
     ) -> Dict[str, Any]:
         """Synthesize insights with contamination guard"""
@@ -385,7 +694,7 @@ class NewsAnalyzer:
             # Filter out quarantined articles for synthesis
             clean_summaries = [
                 s for s in summaries 
-                if s.get('_quarantine_status') == 'CLEAN'
+                if s.quarantine_status == 'CLEAN'
             ]
             
             if not clean_summaries:
@@ -399,21 +708,17 @@ class NewsAnalyzer:
             
             synthesis_prompt = self._build_synthesis_prompt(clean_summaries, context)
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
+            result = await self._chat(
+                [
                     {"role": "system", "content": "You are a financial analyst synthesizing news insights. Output ONLY valid JSON without markdown code fences. Focus on FACTS, not predictions."},
                     {"role": "user", "content": synthesis_prompt}
                 ],
-                temperature=self.temperature,
                 max_tokens=600
             )
-            
-            result = response.choices[0].message.content.strip()
             result = self._clean_json_response(result)
             
             try:
-                parsed = json.loads(result)
+                parsed = _json_loads(result)
                 
                 # Add metadata about quarantine
                 parsed['_clean_articles_used'] = len(clean_summaries)
@@ -459,9 +764,7 @@ class NewsAnalyzer:
     
     def _clean_json_response(self, text: str) -> str:
         """Remove markdown code fences"""
-        text = re.sub(r'```json\s*', '', text)
-        text = re.sub(r'```\s*', '', text)
-        return text.strip()
+        return _FENCE_RE.sub('', _FENCE_JSON_RE.sub('', text)).strip()
     
     def _get_system_prompt(self) -> str:
         return """You are a financial news analyst. Extract FACTUAL insights only.
@@ -505,7 +808,7 @@ Extract FACTUAL insights as JSON. NO predictions or forecasts."""
     
     def _build_synthesis_prompt(
         self, 
-        summaries: List[Dict], 
+        summaries: List[ArticleSummary], 
         context: DAGContext
     ) -> str:
         summaries_text = "\n\n".join([
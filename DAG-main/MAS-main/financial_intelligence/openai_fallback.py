@@ -6,6 +6,7 @@ Triggers when aggregate confidence < 0.7:
 - Provides comprehensive financial analysis
 - Handles edge cases gracefully
 """
+import asyncio
 import os
 import json
 from typing import Dict, Any, Optional
@@ -227,8 +228,10 @@ Remember: You're providing educational information, not investment recommendatio
             from ddgs import DDGS
             ddgs = DDGS()
             
-            # Search for recent information
-            results = list(ddgs.text(query, max_results=3, timelimit='w'))
+            # Search for recent information (ddgs is blocking; keep it off the loop)
+            results = await asyncio.to_thread(
+                lambda: list(ddgs.text(query, max_results=3, timelimit='w'))
+            )
             
             if not results:
                 return ""
@@ -277,7 +280,9 @@ Remember: You're providing educational information, not investment recommendatio
             if web_context:
                 print(f"   🌐 Web search enabled: included recent context")
             
-            response = self.client.chat.completions.create(
+            # Sync client: run it in a thread so other fallbacks keep progressing
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
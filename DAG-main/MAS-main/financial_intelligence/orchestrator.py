@@ -6,17 +6,12 @@ Key changes:
 3. Better error handling
 """
 import asyncio
+from functools import cached_property
 from typing import Dict, Any, List
 from datetime import datetime
 import structlog
 
-from financial_intelligence.workers.macro_worker import MacroWorker
-from financial_intelligence.workers.fundamentals_worker import FundamentalsWorker
-from financial_intelligence.workers.prices_worker import PricesWorker
-from financial_intelligence.workers.news_worker import NewsWorker
-from financial_intelligence.workers.us_fundamentals_worker import USFundamentalsWorker
 from financial_intelligence.utils.region_resolver import resolve_region_from_entities
-from financial_intelligence.news_analyzer import NewsAnalyzer
 from financial_intelligence.groq_fallback import get_groq_fallback_handler, get_hybrid_fallback_handler
 from financial_intelligence.config import (
     AGGREGATE_CONFIDENCE_THRESHOLD, 
@@ -40,13 +35,6 @@ class ParallelOrchestrator:
     """Orchestrator with direct WebGPT routing for fundamentals"""
     
     def __init__(self):
-        self.macro_worker = MacroWorker()
-        self.fundamentals_worker = FundamentalsWorker()
-        self.us_fundamentals_worker = USFundamentalsWorker()
-        self.prices_worker = PricesWorker()
-        self.news_worker = NewsWorker()
-        self.news_analyzer = NewsAnalyzer()
-        
         # Initialize fallback handler based on configuration
         fallback_system = get_fallback_system_type()
         if fallback_system == "groq":
@@ -73,6 +61,51 @@ class ParallelOrchestrator:
             "NON_FINANCIAL": ["news"]
         }
     
+    # Workers (and their scraping/search dependencies) are imported and built
+    # on first use, so a query only loads the workers its intent routes to
+    @cached_property
+    def macro_worker(self):
+        from financial_intelligence.workers.macro_worker import MacroWorker
+        return MacroWorker()
+    
+    @cached_property
+    def fundamentals_worker(self):
+        from financial_intelligence.workers.fundamentals_worker import FundamentalsWorker
+        return FundamentalsWorker()
+    
+    @cached_property
+    def us_fundamentals_worker(self):
+        from financial_intelligence.workers.us_fundamentals_worker import USFundamentalsWorker
+        return USFundamentalsWorker()
+    
+    @cached_property
+    def prices_worker(self):
+        from financial_intelligence.workers.prices_worker import PricesWorker
+        return PricesWorker()
+    
+    @cached_property
+    def news_worker(self):
+        from financial_intelligence.workers.news_worker import NewsWorker
+        return NewsWorker()
+    
+    @cached_property
+    def news_analyzer(self):
+        from financial_intelligence.news_analyzer import NewsAnalyzer
+        return NewsAnalyzer()
+    
+    async def aclose(self):
+        """
+        Close the running loop's fallback and news analysis clients
+        
+        Those clients are cached per event loop; call this before the loop
+        shuts down.
+        """
+        close = getattr(self.fallback_handler, "close", None)
+        if close is not None:
+            await close()
+        if "news_analyzer" in self.__dict__:
+            await self.news_analyzer.aclose()
+    
     async def execute(self, planner_output: Dict[str, Any]) -> Dict[str, Any]:
         """Execute with direct WebGPT routing for fundamentals"""
         
@@ -518,13 +551,7 @@ class ParallelOrchestrator:
         logger.info("orchestrator.news_analysis.start")
         
         try:
-            loop = asyncio.get_event_loop()
-            news_analysis = await loop.run_in_executor(
-                None,
-                self.news_analyzer.analyze,
-                news_result,
-                context
-            )
+            news_analysis = await self.news_analyzer.aanalyze(news_result, context)
             
             analysis_status = news_analysis.get("status")
             
@@ -1,11 +1,17 @@
+import copy
 import json
+from functools import lru_cache
 from financial_intelligence.core.errors import PlannerError
 
 REQUIRED_FIELDS = {"intent", "confidence", "reason"}
 
 def validate_planner_output(text: str) -> dict:
     """Validate and normalize planner output"""
-    
+    # Callers mutate the plan, so hand out a copy of the cached result
+    return copy.deepcopy(_validate_cached(text))
+
+@lru_cache(maxsize=1024)
+def _validate_cached(text: str) -> dict:
     # Clean markdown fences
     cleaned = text.replace("```json", "").replace("```", "").strip()
 
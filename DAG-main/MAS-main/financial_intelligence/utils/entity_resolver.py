@@ -4,7 +4,8 @@ Deterministically extracts and resolves entities from queries.
 Separates concerns: planner does intent, resolver does entities.
 """
 import re
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
 from financial_intelligence.utils.company_lookup import find_companies_in_text
 
 
@@ -549,6 +550,11 @@ class EntityResolver:
 # Singleton instance
 _resolver = EntityResolver()
 
+@lru_cache(maxsize=1024)
+def _resolve_cached(query: str) -> Tuple[Tuple[Tuple[str, str], ...], ...]:
+    # Frozen so cached results can't be mutated by callers
+    return tuple(tuple(entity.items()) for entity in _resolver.resolve(query))
+
 def resolve_entities(query: str) -> List[Dict[str, str]]:
     """Convenience function to resolve entities"""
-    return _resolver.resolve(query)
\ No newline at end of file
+    return [dict(items) for items in _resolve_cached(query)]
\ No newline at end of file
@@ -12,12 +12,13 @@ Key improvements:
 4. Region-aware execution (only Indian companies)
 """
 import asyncio
-import aiohttp
 import requests
 import re
 from bs4 import BeautifulSoup
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from llm.http_client import DOMAIN_LIMITER, get_shared_client
+from financial_intelligence.core.file_cache import get_file_cache
 
 
 class CompanyResolver:
@@ -260,6 +261,11 @@ class PeriodParser:
         return None
 
 
+# Screener fields that move with the share price; they're cached under
+# FUNDAMENTALS_MARKET with a short TTL, apart from the slow-moving fundamentals
+PRICE_DERIVED_FIELDS = frozenset({"market_cap", "price", "pe_ratio", "dividend_yield", "pb_ratio"})
+
+
 class ScreenerExtractor:
     """Extract annual fundamentals from Screener.in"""
     
@@ -280,13 +286,21 @@ class ScreenerExtractor:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
         
+        cache = get_file_cache()
+        if cache is not None:
+            cached = cache.get("FUNDAMENTALS", url)
+            if cached is not None:
+                market = cache.get("FUNDAMENTALS_MARKET", url)
+                if market is not None:
+                    return {**cached, **market}
+        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=15) as response:
-                    if response.status != 200:
-                        return {"error": f"HTTP {response.status}"}
-                    
-                    html = await response.text()
+            await DOMAIN_LIMITER.wait(url)
+            response = await get_shared_client().get(url, headers=headers, timeout=15)
+            if response.status_code != 200:
+                return {"error": f"HTTP {response.status_code}"}
+            
+            html = response.text
             
             if len(html) < 5000:
                 return {"error": "Incomplete response"}
@@ -319,6 +333,13 @@ class ScreenerExtractor:
                 if value is not None:
                     data[key] = value
             
+            if cache is not None:
+                cache.set("FUNDAMENTALS", url, value={
+                    key: value for key, value in data.items() if key not in PRICE_DERIVED_FIELDS
+                })
+                cache.set("FUNDAMENTALS_MARKET", url, value={
+                    key: value for key, value in data.items() if key in PRICE_DERIVED_FIELDS
+                })
             return data
             
         except Exception as e:
@@ -400,7 +421,9 @@ class MoneycontrolExtractor:
             try:
                 print(f"            🌐 Trying: {base_url}")
                 
-                response = requests.get(base_url, timeout=10, headers={
+                # Async request so concurrent company fetches don't block the loop
+                await DOMAIN_LIMITER.wait(base_url)
+                response = await get_shared_client().get(base_url, timeout=10, headers={
                     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                 })
                 
@@ -612,79 +635,24 @@ class FundamentalsWorker:
             # Fetch data from both sources
             company_data = {}
             
-            for ticker, resolved in companies.items():
-                print(f"      📊 Fetching: {resolved['company']}")
-                
-                # Ensure ticker is not empty
-                if not ticker or ticker == "":
-                    print(f"         ⚠️  Empty ticker detected, using fallback")
-                    ticker = resolved.get("ticker", "UNKNOWN")
-                
-                # Fetch Screener data (annual fundamentals)
-                screener_data = await self.screener.fetch_fundamentals(
-                    resolved["screener_slug"]
-                )
-                
-                # Debug: Show what Screener returned
-                if "error" in screener_data:
-                    print(f"         ❌ Screener error: {screener_data['error']}")
-                else:
-                    print(f"         ✅ Screener: {len(screener_data)} fields")
-                
-                # Fetch Moneycontrol data (quarterly if period specified)
-                moneycontrol_data = {}
-                if period:
-                    # Always try Moneycontrol if any period specified
-                    print(f"         📅 Fetching quarterly data for {period}")
-                    moneycontrol_data = await self.moneycontrol.fetch_quarterly(
-                        resolved["moneycontrol_slug"],
-                        period
-                    )
-                    
-                    # Debug: Show what Moneycontrol returned
-                    if "error" in moneycontrol_data:
-                        print(f"         ❌ Moneycontrol error: {moneycontrol_data['error']}")
-                    elif moneycontrol_data:
-                        print(f"         ✅ Moneycontrol: {len(moneycontrol_data.get('metrics', {}))} metrics")
-                
-                # Merge data sources
-                merged_data = {
-                    "name": resolved["company"],
-                    "ticker": ticker,
-                }
-                
-                # Add Screener data
-                if "error" not in screener_data:
-                    merged_data.update(screener_data)
+            # Companies are independent: fetch them concurrently. Each source
+            # paces its own requests through the shared domain limiter.
+            fetched = await asyncio.gather(
+                *[
+                    self._fetch_company(ticker, resolved, period)
+                    for ticker, resolved in companies.items()
+                ],
+                return_exceptions=True
+            )
+            for (ticker, resolved), result in zip(companies.items(), fetched):
+                if isinstance(result, Exception):
+                    company_data[ticker] = {
+                        "name": resolved["company"],
+                        "ticker": ticker,
+                        "error": str(result)
+                    }
                 else:
-                    merged_data["screener_error"] = screener_data["error"]
-                
-                # Add or override with Moneycontrol quarterly data
-                if moneycontrol_data and "error" not in moneycontrol_data:
-                    merged_data["quarterly_results"] = moneycontrol_data["metrics"]
-                    merged_data["period"] = moneycontrol_data["period"]
-                    merged_data["data_type"] = "quarterly"
-                elif moneycontrol_data and "error" in moneycontrol_data:
-                    merged_data["moneycontrol_error"] = moneycontrol_data["error"]
-                
-                # Check if we got ANY data
-                if len(merged_data) <= 2:  # Only name and ticker
-                    # FALLBACK: Try yfinance as last resort
-                    if self.has_yfinance:
-                        print(f"         🔄 Trying yfinance fallback...")
-                        yf_data = await self._fetch_yfinance_fallback(ticker)
-                        if yf_data and "error" not in yf_data:
-                            merged_data.update(yf_data)
-                            merged_data["data_source"] = "yfinance_fallback"
-                            print(f"         ✅ yfinance: {len(yf_data)} fields")
-                        else:
-                            merged_data["error"] = "No data available from any source"
-                            print(f"         ⚠️  No data from any source for {ticker}")
-                    else:
-                        merged_data["error"] = "No data available from any source"
-                        print(f"         ⚠️  No data from any source for {ticker}")
-                
-                company_data[ticker] = merged_data
+                    company_data[result[0]] = result[1]
             
             return {
                 "status": "success",
@@ -702,6 +670,86 @@ class FundamentalsWorker:
                 "timestamp": datetime.now().isoformat()
             }
     
+    async def _fetch_company(
+        self,
+        ticker: str,
+        resolved: Dict[str, Any],
+        period: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Fetch and merge Screener/Moneycontrol (or yfinance) data for one company"""
+        print(f"      📊 Fetching: {resolved['company']}")
+
+        # Ensure ticker is not empty
+        if not ticker or ticker == "":
+            print(f"         ⚠️  Empty ticker detected, using fallback")
+            ticker = resolved.get("ticker", "UNKNOWN")
+
+        # Fetch Screener data (annual fundamentals)
+        screener_data = await self.screener.fetch_fundamentals(
+            resolved["screener_slug"]
+        )
+
+        # Debug: Show what Screener returned
+        if "error" in screener_data:
+            print(f"         ❌ Screener error: {screener_data['error']}")
+        else:
+            print(f"         ✅ Screener: {len(screener_data)} fields")
+
+        # Fetch Moneycontrol data (quarterly if period specified)
+        moneycontrol_data = {}
+        if period:
+            # Always try Moneycontrol if any period specified
+            print(f"         📅 Fetching quarterly data for {period}")
+            moneycontrol_data = await self.moneycontrol.fetch_quarterly(
+                resolved["moneycontrol_slug"],
+                period
+            )
+
+            # Debug: Show what Moneycontrol returned
+            if "error" in moneycontrol_data:
+                print(f"         ❌ Moneycontrol error: {moneycontrol_data['error']}")
+            elif moneycontrol_data:
+                print(f"         ✅ Moneycontrol: {len(moneycontrol_data.get('metrics', {}))} metrics")
+
+        # Merge data sources
+        merged_data = {
+            "name": resolved["company"],
+            "ticker": ticker,
+        }
+
+        # Add Screener data
+        if "error" not in screener_data:
+            merged_data.update(screener_data)
+        else:
+            merged_data["screener_error"] = screener_data["error"]
+
+        # Add or override with Moneycontrol quarterly data
+        if moneycontrol_data and "error" not in moneycontrol_data:
+            merged_data["quarterly_results"] = moneycontrol_data["metrics"]
+            merged_data["period"] = moneycontrol_data["period"]
+            merged_data["data_type"] = "quarterly"
+        elif moneycontrol_data and "error" in moneycontrol_data:
+            merged_data["moneycontrol_error"] = moneycontrol_data["error"]
+
+        # Check if we got ANY data
+        if len(merged_data) <= 2:  # Only name and ticker
+            # FALLBACK: Try yfinance as last resort
+            if self.has_yfinance:
+                print(f"         🔄 Trying yfinance fallback...")
+                yf_data = await self._fetch_yfinance_fallback(ticker)
+                if yf_data and "error" not in yf_data:
+                    merged_data.update(yf_data)
+                    merged_data["data_source"] = "yfinance_fallback"
+                    print(f"         ✅ yfinance: {len(yf_data)} fields")
+                else:
+                    merged_data["error"] = "No data available from any source"
+                    print(f"         ⚠️  No data from any source for {ticker}")
+            else:
+                merged_data["error"] = "No data available from any source"
+                print(f"         ⚠️  No data from any source for {ticker}")
+        
+        return ticker, merged_data
+    
     async def _fetch_yfinance_fallback(self, ticker: str) -> Dict[str, Any]:
         """Fallback to yfinance if Screener and Moneycontrol fail"""
         
@@ -9,6 +9,7 @@ Key improvements:
 5. Event-year compatibility check
 6. Enhanced confidence scoring
 """
+import asyncio
 import os
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
@@ -17,6 +18,10 @@ from enum import Enum
 import pandas as pd
 from fredapi import Fred
 
+from financial_intelligence.core.rate_limit import acquire_for
+
+FRED_API_URL = "https://api.stlouisfed.org"
+
 
 # ============================
 # METRIC SPECIFICATIONS
@@ -215,23 +220,29 @@ class MacroWorker:
                         "timestamp": datetime.now().isoformat()
                     }
         
-        # Fetch raw data
-        macro_facts = {}
-        
-        for indicator in indicators:
-            try:
-                fact = await self._fetch_and_analyze_indicator(
+        # Fetch raw data for all indicators concurrently
+        fetched = await asyncio.gather(
+            *[
+                self._fetch_and_analyze_indicator(
                     indicator, 
                     region, 
                     time_range,
                     event_year
                 )
-                macro_facts[indicator] = fact
-            except Exception as e:
+                for indicator in indicators
+            ],
+            return_exceptions=True
+        )
+        
+        macro_facts = {}
+        for indicator, fact in zip(indicators, fetched):
+            if isinstance(fact, Exception):
                 macro_facts[indicator] = {
                     "status": "error",
-                    "error": str(e)
+                    "error": str(fact)
                 }
+            else:
+                macro_facts[indicator] = fact
         
         # Compute derived state
         macro_state = self._compute_macro_state(macro_facts, region)
@@ -359,7 +370,10 @@ class MacroWorker:
                 start = end - timedelta(days=365)  # 1 year
         
         try:
-            series = self.fred.get_series(
+            # fredapi is blocking; run it off the loop so indicators fetch in parallel
+            await acquire_for(FRED_API_URL)
+            series = await asyncio.to_thread(
+                self.fred.get_series,
                 series_id,
                 observation_start=start,
                 observation_end=end
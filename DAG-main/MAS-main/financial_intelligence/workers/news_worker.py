@@ -19,6 +19,8 @@ from financial_intelligence.core.dag_context import (
     DAGContext, GovernanceMetadata, TimelockViolationError,
     DomainContaminationError, WorkerError, DomainType
 )
+from financial_intelligence.core.rate_limit import acquire_for
+from financial_intelligence.config import STRICT_NEWS_SOURCE_FILTERING, is_approved_source
 from financial_intelligence.utils.domain_validator import validate_domain  # NEW IMPORT
 
 
@@ -67,9 +69,11 @@ class NewsWorker:
             
             print(f"    📰 Found {len(search_results)} search results")
             
-            # Prioritize trusted sources
+            # Prioritize trusted sources (STRICT_SOURCE_FILTERING keeps approved ones only)
             trusted, untrusted = [], []
             for r in search_results[: self.max_articles * 4]:
+                if STRICT_NEWS_SOURCE_FILTERING and not is_approved_source(r.get("href", "")):
+                    continue
                 if self._is_trusted_source(r.get("href", "")):
                     trusted.append(r)
                 else:
@@ -285,6 +289,7 @@ class NewsWorker:
         # Retry wrapper
         for attempt in range(3):
             try:
+                await acquire_for(url)
                 loop = asyncio.get_event_loop()
                 data = await loop.run_in_executor(
                     None, 
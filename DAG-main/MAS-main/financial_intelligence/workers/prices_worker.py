@@ -3,6 +3,10 @@ from typing import Dict, Any, List
 from datetime import datetime, timedelta
 import asyncio
 
+from financial_intelligence.core.rate_limit import limited
+
+# yfinance talks to this host; all symbol fetches share its token bucket
+YAHOO_FINANCE_URL = "https://query1.finance.yahoo.com"
 
 class PricesWorker:
     """Fetches market prices and historical data from Yahoo Finance"""
@@ -414,14 +418,21 @@ class PricesWorker:
                     "message": "No tradeable symbols detected in query"
                 }
             
-            # Fetch data for all symbols
+            # Fetch all symbols concurrently, paced by the Yahoo token bucket
+            names = list(symbols)
+            fetched = await asyncio.gather(
+                *[
+                    limited(YAHOO_FINANCE_URL, self._fetch_symbol_data(symbols[name], name))
+                    for name in names
+                ],
+                return_exceptions=True
+            )
             results = {}
-            for name, symbol in symbols.items():
-                try:
-                    data = await self._fetch_symbol_data(symbol, name)
+            for name, data in zip(names, fetched):
+                if isinstance(data, Exception):
+                    results[name] = {"error": str(data)}
+                else:
                     results[name] = data
-                except Exception as e:
-                    results[name] = {"error": str(e)}
             
             return {
                 "status": "success",
@@ -4,7 +4,29 @@ import time
 # from fundamental.exporters.json_writer import write_json
 # from fundamental.exporters.excel_writer import write_excel
 import json
+import logging
+import os
+import threading
 from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+NIFTY_FILE = Path(__file__).parent.parent / "merged_nifty50.json"
+
+# Parsed NIFTY_FILE, reloaded whenever the file's mtime changes
+_nifty_lock = threading.Lock()
+_nifty_cache = {"mtime_ns": None, "data": None}
+
+
+def _load_nifty_data():
+    mtime_ns = os.stat(NIFTY_FILE).st_mtime_ns
+    with _nifty_lock:
+        if _nifty_cache["mtime_ns"] != mtime_ns:
+            with open(NIFTY_FILE, "r", encoding="utf-8") as f:
+                _nifty_cache["data"] = json.load(f)
+            _nifty_cache["mtime_ns"] = mtime_ns
+        return _nifty_cache["data"]
+
 # import json
 
 # BASE_DIR = Path(__file__).resolve().parent.parent  # project root
@@ -12,21 +34,16 @@ from pathlib import Path
 def run_nifty_scraper(
     symbol: str = "ADANI"
 ):
-    print("Starting Nifty 50 chosing...")
+    logger.debug("Loading merged nifty 50 data")
     try:
-        # Use absolute path relative to this file's parent directory
-        nifty_file = Path(__file__).parent.parent / "merged_nifty50.json"
-        with open(nifty_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_nifty_data()
     except Exception as e:
-        print("Error loading merged nifty 50 data:", e)
+        logger.error("Error loading merged nifty 50 data: %s", e)
         return None
-    print("Loaded merged nifty 50 data.")
-    print(f"finding {symbol} in {data}")
+    logger.debug("Looking up %s in %d symbols", symbol, len(data))
 
 
     if symbol in data:
-        print
         return data[symbol]
     else:
         return None
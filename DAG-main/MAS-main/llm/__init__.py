@@ -1 +1 @@
-from .llm_client import call_llm, call_llm_json
\ No newline at end of file
+from .llm_client import call_llm, call_llm_stream, call_llm_json, cached_call_llm_json, call_llm_json_batch
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""Two-tier cache for LLM responses.
+
+Tier 1 is an exact, content-addressed disk cache: every entry lives in
+``<root>/<sha256>.json`` where the hash covers the system prompt, user prompt,
+model and temperature. Tier 2 is an optional semantic cache that matches
+paraphrased queries by cosine similarity of a local sentence embedding.
+Entries in both tiers expire after ``LLM_CACHE_TTL`` seconds.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".cache/llm")
+SEMANTIC_CACHE_ENABLED = os.getenv("LLM_SEMANTIC_CACHE", "0").lower() in ("1", "true", "yes")
+SEMANTIC_THRESHOLD = float(os.getenv("LLM_SEMANTIC_THRESHOLD", "0.95"))
+EMBEDDING_MODEL = os.getenv("LLM_CACHE_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+# Preprocess answers can depend on the current date ("last week"), so they age out
+DEFAULT_TTL = int(os.getenv("LLM_CACHE_TTL", str(24 * 3600)))
+
+
+def make_key(*parts: Any) -> str:
+    """Hash ``parts`` into a hex digest.
+
+    Each part is prefixed with its 8-byte length so that ``("ab", "c")`` and
+    ``("a", "bc")`` never collide.
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        data = str(part).encode("utf-8")
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
+class LLMCache:
+    """Exact disk cache with an optional embedding-based semantic tier."""
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        semantic: Optional[bool] = None,
+        threshold: float = SEMANTIC_THRESHOLD,
+        ttl: int = DEFAULT_TTL,
+    ):
+        self.root = Path(root or DEFAULT_CACHE_DIR)
+        self.ttl = ttl
+        self.semantic = SEMANTIC_CACHE_ENABLED if semantic is None else semantic
+        self.threshold = threshold
+        self._encoder = None
+        # scope -> (keys, normalized embedding matrix)
+        self._index: Optional[Dict[str, Tuple[List[str], Any]]] = None
+
+    # ------------------------------------------------------------------
+    # Exact tier
+    # ------------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if self._is_expired(entry):
+            return None
+        return entry
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry.get("timestamp", 0) > self.ttl
+
+    def get(
+        self,
+        key: str,
+        query: Optional[str] = None,
+        scope: Optional[str] = None,
+        validate: Optional[Callable[[Any], bool]] = None,
+    ) -> Optional[Any]:
+        """Return a cached response or ``None``.
+
+        ``query``/``scope`` enable the semantic tier: ``scope`` groups entries
+        that share a system prompt and model, ``query`` is the text embedded.
+        """
+        entry = self._read(key)
+        if entry is not None and self._is_valid(entry.get("response"), validate):
+            return entry["response"]
+
+        if not (self.semantic and query and scope):
+            return None
+
+        match = self._semantic_lookup(query, scope)
+        if match is None:
+            return None
+        entry = self._read(match)
+        if entry is not None and self._is_valid(entry.get("response"), validate):
+            logger.debug("Semantic cache hit for %s", key)
+            return entry["response"]
+        return None
+
+    def set(
+        self,
+        key: str,
+        response: Any,
+        *,
+        prompt: str,
+        model: str,
+        temperature: float,
+        query: Optional[str] = None,
+        scope: Optional[str] = None,
+    ) -> None:
+        entry = {
+            "prompt": prompt,
+            "response": response,
+            "model": model,
+            "temperature": temperature,
+            "timestamp": time.time(),
+        }
+        embedding = None
+        if self.semantic and query and scope:
+            embedding = self._embed(query)
+            if embedding is not None:
+                entry["scope"] = scope
+                entry["embedding"] = embedding.tolist()
+
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = self._path(key).with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, self._path(key))
+        except OSError as exc:
+            logger.warning("Could not write LLM cache entry %s: %s", key, exc)
+            return
+
+        if embedding is not None and self._index is not None:
+            self._add_to_index(scope, key, embedding)
+
+    @staticmethod
+    def _is_valid(response: Any, validate: Optional[Callable[[Any], bool]]) -> bool:
+        if response is None:
+            return False
+        if validate is None:
+            return True
+        try:
+            return bool(validate(response))
+        except Exception:
+            return False
+
+    # ------------------------------------------------------------------
+    # Semantic tier
+    # ------------------------------------------------------------------
+
+    def _embed(self, text: str):
+        if np is None:
+            return None
+        if self._encoder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except Exception:
+                logger.info("sentence-transformers unavailable; semantic LLM cache disabled")
+                self.semantic = False
+                return None
+            self._encoder = SentenceTransformer(EMBEDDING_MODEL)
+        vec = self._encoder.encode(text, convert_to_numpy=True).astype("float32")
+        return vec / (np.linalg.norm(vec) + 1e-12)
+
+    def _load_index(self) -> None:
+        self._index = {}
+        if not self.root.is_dir():
+            return
+        for path in self.root.glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if self._is_expired(entry):
+                continue
+            if "embedding" in entry and "scope" in entry:
+                self._add_to_index(
+                    entry["scope"], path.stem, np.asarray(entry["embedding"], dtype="float32")
+                )
+
+    def _add_to_index(self, scope: str, key: str, embedding) -> None:
+        keys, matrix = self._index.get(scope, ([], None))
+        if key in keys:
+            return
+        row = embedding.reshape(1, -1)
+        matrix = row if matrix is None else np.vstack([matrix, row])
+        self._index[scope] = (keys + [key], matrix)
+
+    def _semantic_lookup(self, query: str, scope: str) -> Optional[str]:
+        embedding = self._embed(query)
+        if embedding is None:
+            return None
+        if self._index is None:
+            self._load_index()
+        keys, matrix = self._index.get(scope, ([], None))
+        if matrix is None:
+            return None
+        scores = matrix @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            return keys[best]
+        return None
+
+
+_default_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Return the process-wide LLM cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LLMCache()
+    return _default_cache
+
+
+__all__ = ["LLMCache", "get_llm_cache", "make_key"]
@@ -0,0 +1,108 @@
+"""Shared async HTTP client and per-domain rate limiting for outbound calls.
+
+One pooled ``httpx.AsyncClient`` is kept per event loop, so repeated requests
+to the same host (Screener, Moneycontrol, FRED, ...) reuse warm TCP/TLS
+connections instead of paying a handshake per call. Clients are per loop
+because an httpx connection pool cannot be shared across event loops, and
+agents run ``asyncio.run`` from worker threads.
+"""
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except Exception:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (httpx only speaks HTTP/2 when h2 is installed)
+    _HTTP2 = True
+except Exception:
+    _HTTP2 = False
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "50"))
+DOMAIN_MIN_INTERVAL = float(os.getenv("DOMAIN_MIN_INTERVAL", "0.2"))
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def get_shared_client() -> "httpx.AsyncClient":
+    """Return the pooled AsyncClient for the running event loop."""
+    if httpx is None:
+        raise RuntimeError("httpx is not installed (pip install httpx)")
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=_HTTP2,
+                timeout=HTTP_TIMEOUT,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                ),
+            )
+            _clients[loop] = client
+        return client
+
+
+class DomainRateLimiter:
+    """Space out requests to the same domain by at least ``min_interval`` seconds.
+
+    Slots are reserved under a thread lock and slept on outside it, so one
+    limiter can be shared by coroutines on different event loops.
+    """
+
+    def __init__(self, min_interval: float = DOMAIN_MIN_INTERVAL):
+        self.min_interval = min_interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, url: str) -> float:
+        domain = urlsplit(url).netloc.lower()
+        now = time.monotonic()
+        with self._lock:
+            slot = max(now, self._next_slot.get(domain, 0.0))
+            self._next_slot[domain] = slot + self.min_interval
+        return slot - now
+
+    async def wait(self, url: str) -> None:
+        delay = self._reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+DOMAIN_LIMITER = DomainRateLimiter()
+
+
+def _close_clients() -> None:
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        if client.is_closed:
+            continue
+        try:
+            asyncio.run(client.aclose())
+        except Exception as exc:
+            # The owning loop may already be gone; the OS reclaims the sockets
+            logger.debug("Could not close shared HTTP client: %s", exc)
+
+
+atexit.register(_close_clients)
+
+
+__all__ = ["DOMAIN_LIMITER", "DomainRateLimiter", "get_shared_client"]
@@ -1,19 +1,31 @@
 import os
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .cache import get_llm_cache, make_key
 
 try:
     from openai import OpenAI
 except Exception:
     OpenAI = None
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 def _get_api_key() -> Optional[str]:
     return os.getenv("OPENAI_API_KEY")
 
+DEFAULT_MODEL = "gpt-4o-mini"
+
 # Enable mock responses for local testing by setting LLM_MOCK=1 or true
 _MOCK_MODE = os.getenv("LLM_MOCK", "0").lower() in ("1", "true", "yes")
 _client: Optional[OpenAI] = None
@@ -62,7 +74,7 @@ def _mock_response(system: str, user: str) -> str:
     return json.dumps({"mock": True, "system": system[:120], "user": user[:120]})
 
 
-def call_llm(system: str, user: str) -> str:
+def call_llm(system: str, user: str, model: str = DEFAULT_MODEL, temperature: float = 0) -> str:
     """Call the LLM and return the raw text response.
 
     If `LLM_MOCK` is enabled, returns a deterministic JSON string useful for tests.
@@ -78,12 +90,12 @@ def call_llm(system: str, user: str) -> str:
 
     try:
         response = client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=model,
             messages=[
                 {"role": "system", "content": system},
                 {"role": "user", "content": user},
             ],
-            temperature=0,
+            temperature=temperature,
         )
         return response.choices[0].message.content.strip()
     except Exception as exc:
@@ -91,15 +103,204 @@ def call_llm(system: str, user: str) -> str:
         raise
 
 
-def call_llm_json(system: str, user: str, retries: int = 3) -> Dict[str, Any]:
+def call_llm_stream(
+    system: str,
+    user: str,
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0,
+) -> Iterator[str]:
+    """Call the LLM with streaming enabled and yield text chunks as they arrive.
+
+    In mock mode the whole mock response is yielded as a single chunk.
+    """
+    if _MOCK_MODE:
+        yield _mock_response(system, user)
+        return
+
+    _ensure_client()
+    client = _build_client()
+    if client is None:
+        raise RuntimeError("OpenAI client not available; check logs and environment variables")
+
+    try:
+        stream = client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            temperature=temperature,
+            stream=True,
+        )
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+    except Exception as exc:
+        logger.exception("Error streaming from LLM: %s", exc)
+        raise
+
+
+def call_llm_json(
+    system: str,
+    user: str,
+    retries: int = 3,
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0,
+) -> Dict[str, Any]:
     """Call the LLM and parse JSON output, retrying on parse errors."""
     for _ in range(retries):
-        response = call_llm(system, user)
+        response = call_llm(system, user, model=model, temperature=temperature)
         try:
-            return json.loads(response)
+            return _loads(response)
         except json.JSONDecodeError:
             continue
     raise ValueError("LLM failed to return valid JSON")
 
 
-__all__ = ["call_llm", "call_llm_json"]
+def _cache_slot(
+    system: str,
+    user: str,
+    model: str,
+    temperature: float,
+    required_keys: Optional[Iterable[str]],
+    semantic_query: Optional[str],
+) -> Dict[str, Any]:
+    """Cache key, semantic scope/query and validator for one JSON prompt."""
+    required = frozenset(required_keys or ())
+    return {
+        "key": make_key(system, user, model, temperature),
+        "scope": make_key(system, model, temperature),
+        "query": semantic_query if semantic_query is not None else user,
+        "validate": lambda response: isinstance(response, dict) and required.issubset(response),
+    }
+
+
+def _cache_get(slot: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return get_llm_cache().get(
+        slot["key"], query=slot["query"], scope=slot["scope"], validate=slot["validate"]
+    )
+
+
+def _cache_set(slot: Dict[str, Any], result: Any, user: str, model: str, temperature: float) -> None:
+    if slot["validate"](result):
+        get_llm_cache().set(
+            slot["key"],
+            result,
+            prompt=user,
+            model=model,
+            temperature=temperature,
+            query=slot["query"],
+            scope=slot["scope"],
+        )
+
+
+def cached_call_llm_json(
+    system: str,
+    user: str,
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0,
+    required_keys: Optional[Iterable[str]] = None,
+    semantic_query: Optional[str] = None,
+) -> Dict[str, Any]:
+    """`call_llm_json` behind the exact + semantic LLM cache.
+
+    Cached responses are only returned if they are JSON objects containing
+    every key in `required_keys`; anything else is treated as a miss.
+    `semantic_query` is the text embedded for paraphrase matching and
+    defaults to `user`.
+    """
+    if _MOCK_MODE:
+        return call_llm_json(system, user, model=model, temperature=temperature)
+
+    slot = _cache_slot(system, user, model, temperature, required_keys, semantic_query)
+    cached = _cache_get(slot)
+    if cached is not None:
+        return cached
+
+    result = call_llm_json(system, user, model=model, temperature=temperature)
+    _cache_set(slot, result, user, model, temperature)
+    return result
+
+
+_BATCH_SYSTEM_PROMPT = """You will receive {count} independent tasks, numbered [[0]] to [[{last}]].
+Each task has its own instructions and input. Answer every task independently.
+
+Return ONLY a JSON array with exactly {count} elements, where the i-th element
+is the JSON object answering task [[i]]. No explanations, no markdown."""
+
+
+def _has_keys(response: Any, keys: Iterable[str]) -> bool:
+    return isinstance(response, dict) and all(k in response for k in keys)
+
+
+def _call_llm_json_batch(items: List[Dict[str, Any]], retries: int) -> List[Optional[Dict[str, Any]]]:
+    if len(items) == 1:
+        item = items[0]
+        try:
+            result = call_llm_json(item["system"], item["user"])
+        except ValueError:
+            return [None]
+        return [result if _has_keys(result, item.get("required_keys", ())) else None]
+
+    system = _BATCH_SYSTEM_PROMPT.format(count=len(items), last=len(items) - 1)
+    user = "\n\n".join(
+        f"[[{i}]]\nInstructions:\n{item['system']}\n\nInput:\n{item['user']}"
+        for i, item in enumerate(items)
+    )
+
+    for _ in range(retries):
+        response = call_llm(system, user)
+        try:
+            parsed = _loads(response)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, list) and len(parsed) == len(items):
+            return [
+                result if _has_keys(result, item.get("required_keys", ())) else None
+                for result, item in zip(parsed, items)
+            ]
+    logger.warning("Batched LLM call did not return %d JSON results", len(items))
+    return [None] * len(items)
+
+
+def call_llm_json_batch(items: List[Dict[str, Any]], retries: int = 2) -> List[Optional[Dict[str, Any]]]:
+    """Answer several JSON extraction prompts with a single LLM request.
+
+    Each item is ``{"system": str, "user": str, "required_keys": [...]}``
+    with an optional ``"semantic_query"``. Items are first looked up in the
+    same cache as `cached_call_llm_json`; only the misses are sent, and their
+    answers are written back per item. Returns one parsed dict per item, or
+    ``None`` for items the model did not answer with the required keys, so
+    callers can fall back to a single call.
+    """
+    if not items:
+        return []
+    if _MOCK_MODE:
+        return _call_llm_json_batch(items, retries)
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    slots = []
+    misses = []
+    for i, item in enumerate(items):
+        slot = _cache_slot(
+            item["system"], item["user"], DEFAULT_MODEL, 0,
+            item.get("required_keys"), item.get("semantic_query"),
+        )
+        slots.append(slot)
+        results[i] = _cache_get(slot)
+        if results[i] is None:
+            misses.append(i)
+
+    if misses:
+        answers = _call_llm_json_batch([items[i] for i in misses], retries)
+        for i, answer in zip(misses, answers):
+            results[i] = answer
+            if answer is not None:
+                _cache_set(slots[i], answer, items[i]["user"], DEFAULT_MODEL, 0)
+    return results
+
+
+__all__ = ["call_llm", "call_llm_stream", "call_llm_json", "cached_call_llm_json", "call_llm_json_batch"]
@@ -1,6 +1,6 @@
 # Compatibility shim for the misspelled module name (llm_cliient).
 # The real implementation lives in `llm_client.py` and reads configuration from environment variables.
-from .llm_client import call_llm, call_llm_json
+from .llm_client import call_llm, call_llm_stream, call_llm_json, cached_call_llm_json, call_llm_json_batch
 
-__all__ = ["call_llm", "call_llm_json"]
+__all__ = ["call_llm", "call_llm_stream", "call_llm_json", "cached_call_llm_json", "call_llm_json_batch"]
 
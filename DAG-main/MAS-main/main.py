@@ -1,7 +1,10 @@
 from router.planner import plan_tasks
 from executor.executor import execute_plan
 import json
+import logging
+import os
 from datetime import datetime
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
 user_query = input("What financial news you want to know?: ")
 from openai import OpenAI
 import json
@@ -11,13 +11,16 @@ import json
 from tqdm import tqdm
 from abc import ABC, abstractmethod
 from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
 
 def News_Search(query: str, start_date: str, end_date: str, top_k: int):
 # -----------------------------
 # Load data
 # -----------------------------
     JSON_FILE = Path(__file__).parent.parent / "merged_sorted_embeddings.json"
-    print("Loading embedded data...")
+    logger.debug("Loading embedded data")
     # try:
     #     with open(JSON_FILE, "r", encoding="utf-8") as f:
     #         docs = json.load(f)
@@ -38,7 +41,7 @@ def News_Search(query: str, start_date: str, end_date: str, top_k: int):
     # Filter documents by date
     # -----------------------------
     model = SentenceTransformer("all-MiniLM-L6-v2")
-    print(f"Filtering documents from {start_date} to {end_date}...")
+    logger.debug("Filtering documents from %s to %s", start_date, end_date)
     with open(JSON_FILE, "r", encoding="utf-8") as f:
         for doc in tqdm(
                 ijson.items(f, "item"),
@@ -63,15 +66,15 @@ def News_Search(query: str, start_date: str, end_date: str, top_k: int):
                 filtered_embs.append(emb)
 
     if not filtered_docs:
-        print("❌ No documents found in the given date range")
+        logger.info("No documents found in the given date range")
         return [], 0
 
 
-    print(f"✅ Documents after date filter: {len(filtered_docs)}")
+    logger.debug("Documents after date filter: %d", len(filtered_docs))
     
     # If very few documents, print warning
     if len(filtered_docs) < 10:
-        print(f"⚠️  Warning: Only {len(filtered_docs)} articles found in date range. Search results may be limited.")
+        logger.warning("Only %d articles found in date range. Search results may be limited.", len(filtered_docs))
 
     # -----------------------------
     # Convert embeddings → NumPy
@@ -82,7 +85,7 @@ def News_Search(query: str, start_date: str, end_date: str, top_k: int):
     filtered_embs /= (
         np.linalg.norm(filtered_embs, axis=1, keepdims=True) + 1e-12
     )
-    print("✅ Normalized embeddings for semantic search")
+    logger.debug("Normalized embeddings for semantic search")
     # -----------------------------
     # Query embedding
     # -----------------------------
@@ -95,24 +98,24 @@ def News_Search(query: str, start_date: str, end_date: str, top_k: int):
     # Semantic Search
     # -----------------------------
     scores = filtered_embs @ q_emb   # cosine similarity
-    top_idx = np.argsort(-scores)[:top_k]
+    # Partial selection of the top_k, then sort only those k
+    if len(scores) > top_k:
+        top_idx = np.argpartition(-scores, top_k)[:top_k]
+    else:
+        top_idx = np.arange(len(scores))
+    top_idx = top_idx[np.argsort(-scores[top_idx])]
     if(len(top_idx)==0):
         return [],0
     top_score = scores[top_idx[0]]
-    print(f"✅ Retrieved top {top_k} results for the query.")
+    logger.debug("Retrieved top %d results for the query", top_k)
     # --------p---------------------
-    # Print results
+    # Collect results
     # -----------------------------
-    print("\n🔎 Top Results\n" + "-" * 60)
     docs=[]
 
     for rank, idx in enumerate(top_idx, start=1):
         doc=filtered_docs[idx]
         docs.append(doc)
         # top5.append(doc)
-        print(f"\nRank {rank} | Score: {scores[idx]:.4f}")
-        print("Title:", doc["title"])
-        print("Date :", doc["publish_date"])
-        print("URL  :", doc["url"])
-        print("Summary:", doc["summary"][:350])
+        logger.debug("Rank %d | Score: %.4f | %s | %s | %s", rank, scores[idx], doc["title"], doc["publish_date"], doc["url"])
     return docs, top_score
\ No newline at end of file
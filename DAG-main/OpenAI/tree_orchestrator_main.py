@@ -122,7 +122,7 @@ class TreeOrchestrator:
             
             # Import MAS components (with MAS-main first in path)
             from router.planner import plan_tasks
-            from executor.executor import execute_plan
+            from executor.executor import execute_plan_async
             
             # Execute MAS pipeline
             print(f"\n📋 Step 1: Planning tasks with MAS router...")
@@ -130,7 +130,7 @@ class TreeOrchestrator:
             print(f"✅ Plan created: {len(plan.get('tasks', []))} tasks")
             
             print(f"\n🔧 Step 2: Executing tasks with MAS agents...")
-            results = execute_plan(plan)
+            results = await execute_plan_async(plan)
             print(f"✅ Execution complete: {len(results)} results")
             
         finally: